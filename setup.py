@@ -9,6 +9,7 @@ setup(
     package_dir={'': 'src'},
     packages=find_packages('src'),
     setup_requires='setuptools >= 30.3',
+    python_requires='>=3.7',
     install_requires=[
         'sidekick>=0.5.0',
         'markupsafe~=1.0',
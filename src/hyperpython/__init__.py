@@ -1,136 +1,184 @@
 """
 Core Hyperpython API
+
+Public names are loaded lazily on first access, so importing hyperpython
+itself is cheap.
 """
+import sys
+from importlib import import_module
+from types import ModuleType
+
 __version__ = "1.1.0"
 __author__ = "Fábio Macêdo Mendes"
 
-from .core import Element, Text, Blob, Block, Json, Component
-from .fragment import fragment, FragmentNotFound
-from .helpers import classes
-from .html import html, render
-from .tags import (
-    HTML5,
-    h,
-    body,
-    head,
-    meta,
-    link,
-    title,
-    div,
-    span,
-    article,
-    aside,
-    details,
-    footer,
-    figcaption,
-    figure,
-    header,
-    main,
-    p,
-    pre,
-    section,
-    embed,
-    iframe,
-    noscript,
-    object_,
-    script,
-    style,
-    button,
-    fieldset,
-    form,
-    input_,
-    keygen,
-    label,
-    legend,
-    optgroup,
-    option,
-    select,
-    textarea,
-    h1,
-    h2,
-    h3,
-    h4,
-    h5,
-    h6,
-    dd,
-    dl,
-    dt,
-    ul,
-    li,
-    ol,
-    area,
-    audio,
-    canvas,
-    img,
-    picture,
-    track,
-    video,
-    source,
-    a,
-    menu,
-    menuitem,
-    nav,
-    abbr,
-    blockquote,
-    code,
-    caption,
-    col,
-    colgroup,
-    table,
-    tbody,
-    td,
-    tfoot,
-    th,
-    thead,
-    tr,
-    b,
-    em,
-    del_,
-    i,
-    ins,
-    mark,
-    q,
-    s,
-    small,
-    strong,
-    sub,
-    sup,
-    u,
-    br,
-    hr,
-    wbr,
-    bdi,
-    bdo,
-    rp,
-    rt,
-    ruby,
-    address,
-    dialog,
-    base,
-    cite,
-    datalist,
-    dfn,
-    kbd,
-    map_,
-    meter,
-    param,
-    progress,
-    samp,
-    summary,
-    time,
-    var,
-    output,
-    acronym,
-    applet,
-    big,
-    basefont,
-    center,
-    dir_,
-    font,
-    frame,
-    frameset,
-    noframes,
-    strike,
-    tt,
+_TAG_NAMES = (
+    "HTML5",
+    "h",
+    "body",
+    "head",
+    "meta",
+    "link",
+    "title",
+    "div",
+    "span",
+    "article",
+    "aside",
+    "details",
+    "footer",
+    "figcaption",
+    "figure",
+    "header",
+    "main",
+    "p",
+    "pre",
+    "section",
+    "embed",
+    "iframe",
+    "noscript",
+    "object_",
+    "script",
+    "style",
+    "button",
+    "fieldset",
+    "form",
+    "input_",
+    "keygen",
+    "label",
+    "legend",
+    "optgroup",
+    "option",
+    "select",
+    "textarea",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "dd",
+    "dl",
+    "dt",
+    "ul",
+    "li",
+    "ol",
+    "area",
+    "audio",
+    "canvas",
+    "img",
+    "picture",
+    "track",
+    "video",
+    "source",
+    "a",
+    "menu",
+    "menuitem",
+    "nav",
+    "abbr",
+    "blockquote",
+    "code",
+    "caption",
+    "col",
+    "colgroup",
+    "table",
+    "tbody",
+    "td",
+    "tfoot",
+    "th",
+    "thead",
+    "tr",
+    "b",
+    "em",
+    "del_",
+    "i",
+    "ins",
+    "mark",
+    "q",
+    "s",
+    "small",
+    "strong",
+    "sub",
+    "sup",
+    "u",
+    "br",
+    "hr",
+    "wbr",
+    "bdi",
+    "bdo",
+    "rp",
+    "rt",
+    "ruby",
+    "address",
+    "dialog",
+    "base",
+    "cite",
+    "datalist",
+    "dfn",
+    "kbd",
+    "map_",
+    "meter",
+    "param",
+    "progress",
+    "samp",
+    "summary",
+    "time",
+    "var",
+    "output",
+    "acronym",
+    "applet",
+    "big",
+    "basefont",
+    "center",
+    "dir_",
+    "font",
+    "frame",
+    "frameset",
+    "noframes",
+    "strike",
+    "tt",
 )
-from .utils import escape, unescape, safe, sanitize
+_LAZY_NAMES = {
+    **dict.fromkeys(["render_context"], "context"),
+    **dict.fromkeys(["Element", "Text", "Blob", "Block", "Json", "Component"], "core"),
+    **dict.fromkeys(["diff"], "diff"),
+    **dict.fromkeys(["fragment", "FragmentNotFound"], "fragment"),
+    **dict.fromkeys(["classes"], "helpers"),
+    **dict.fromkeys(["html", "render"], "html"),
+    **dict.fromkeys(["TreeIndex"], "index"),
+    **dict.fromkeys(["sizeof"], "memory"),
+    **dict.fromkeys(["parse_html"], "parser"),
+    **dict.fromkeys(["render_bytes", "dump_bytes"], "renderers"),
+    **dict.fromkeys(_TAG_NAMES, "tags"),
+    **dict.fromkeys(["escape", "unescape", "safe", "sanitize"], "utils"),
+}
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_NAMES})
+
+
+class _Package(ModuleType):
+    """
+    The import system binds submodules as attributes of their package once
+    they are loaded. This keeps hyperpython.html, hyperpython.fragment and
+    hyperpython.diff pointing to the functions rather than to their
+    homonymous modules.
+    """
+
+    def __setattr__(self, name, value):
+        if name in ("html", "fragment", "diff") and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
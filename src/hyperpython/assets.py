@@ -0,0 +1,411 @@
+"""
+Collect CSS and Javascript assets declared in the ``requires`` attribute of
+elements and inject them into the document head.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+
+from markupsafe import Markup
+
+from .core import Block, as_child
+from .renderers import render_attrs
+from .tags import link, script
+
+STYLESHEET_TAGS = {"link", "style"}
+FONT_EXTENSIONS = {"eot", "otf", "svg", "ttf", "woff", "woff2"}
+
+
+class Assets:
+    """
+    An ordered and deduplicated collection of assets.
+
+    Stylesheets always come before scripts. Inside each group, assets are kept
+    in the order they were first added.
+
+    Examples:
+        >>> assets = Assets(['main.css', 'main.js', 'theme.css', 'main.css'])
+        >>> print(assets.render())
+        <link rel="stylesheet" href="main.css"></link><link rel="stylesheet" href="theme.css"></link><script src="main.js"></script>
+    """
+
+    def __init__(self, requires=()):
+        self.stylesheets = []
+        self.scripts = []
+        self._seen = set()
+        for item in requires:
+            self.add(item)
+
+    def __iter__(self):
+        yield from self.stylesheets
+        yield from self.scripts
+
+    def __len__(self):
+        return len(self.stylesheets) + len(self.scripts)
+
+    def add(self, item):
+        """
+        Add asset to collection, unless it is already present.
+
+        Assets can be given as URLs ending in .css or .js or as elements such
+        as <link>, <style> or <script> tags.
+        """
+        key, elem = as_asset(item)
+        if key not in self._seen:
+            self._seen.add(key)
+            if elem.tag in STYLESHEET_TAGS:
+                self.stylesheets.append(elem)
+            else:
+                self.scripts.append(elem)
+
+    def exclude(self, item):
+        """
+        Mark asset as present, so it is not added to the collection.
+        """
+        self._seen.add(asset_key(item))
+
+    def render(self):
+        """
+        Render asset tags as an HTML string.
+        """
+        return Markup("".join(str(elem) for elem in self))
+
+
+def as_asset(item):
+    """
+    Return a (key, element) pair for the given asset.
+
+    The key identifies duplicate assets: it is the URL for external
+    stylesheets and scripts and the rendered HTML for inline content.
+    """
+    if isinstance(item, str) and not hasattr(item, "__html__"):
+        path = item.partition("?")[0].partition("#")[0]
+        if path.endswith(".css"):
+            return item, link(rel="stylesheet", href=item)
+        elif path.endswith(".js"):
+            return item, script(src=item)
+        raise ValueError(f"cannot determine type of asset: {item!r}")
+    elem = _unwrap(as_child(item))
+    return asset_key(elem), elem
+
+
+class AssetManifest:
+    """
+    Map logical asset names to URLs and render them as <link> and <script>
+    tags.
+
+    Each name refers to a single URL or to a list of URLs. URLs are classified
+    by extension (.css, .js or a font file). URLs without a meaningful
+    extension can be given as dictionaries with "url" and "type" keys.
+
+    Tags for each unique sequence of requested names are built only once
+    and cached.
+
+    Args:
+        assets:
+            Mapping from names to URLs.
+        integrity:
+            Optional mapping from URLs to subresource integrity hashes (e.g.,
+            "sha384-...").
+        crossorigin:
+            Value of the crossorigin attribute of tags with integrity hashes.
+
+    Examples:
+        >>> manifest = AssetManifest({'app': ['app.css', 'app.js']})
+        >>> print(manifest.render('app'))
+        <link rel="stylesheet" href="app.css"></link><script src="app.js"></script>
+    """
+
+    def __init__(self, assets=(), integrity=None, crossorigin="anonymous"):
+        self.assets = {}
+        self.integrity = dict(integrity or {})
+        self.crossorigin = crossorigin
+        self._cache = {}
+        self._lock = threading.Lock()
+        for name, urls in dict(assets).items():
+            self.add(name, urls)
+
+    def __contains__(self, name):
+        return name in self.assets
+
+    def __iter__(self):
+        return iter(self.assets)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Load manifest from a JSON file.
+
+        The file may contain a mapping from names to URLs or an object with
+        "assets" and (optionally) "integrity" keys.
+        """
+        with open(path) as fd:
+            data = json.load(fd)
+        if "assets" in data and isinstance(data["assets"], dict):
+            kwargs.setdefault("integrity", data.get("integrity"))
+            data = data["assets"]
+        return cls(data, **kwargs)
+
+    @classmethod
+    def from_templates(cls, templates, names=None, **params):
+        """
+        Create manifest from URL templates.
+
+        Templates are formatted with the given params and with the asset
+        name, available as "{name}".
+
+        Examples:
+            >>> manifest = AssetManifest.from_templates(
+            ...     {'grid': '{cdn}/{version}/{name}.css'},
+            ...     cdn='//cdn.example.com', version='1.0',
+            ... )
+            >>> manifest.urls('grid')
+            ['//cdn.example.com/1.0/grid.css']
+        """
+        if names is not None:
+            templates = {name: templates for name in names}
+        assets = {
+            name: _format_urls(urls, name=name, **params)
+            for name, urls in templates.items()
+        }
+        return cls(assets)
+
+    def copy(self):
+        """
+        Return an independent copy of the manifest.
+
+        Adding assets or integrity hashes to the copy does not change the
+        original manifest.
+        """
+        new = type(self)(integrity=self.integrity, crossorigin=self.crossorigin)
+        new.assets = {name: list(entries) for name, entries in self.assets.items()}
+        return new
+
+    def add(self, name, urls):
+        """
+        Register asset name.
+        """
+        if isinstance(urls, (str, dict)):
+            urls = [urls]
+        entries = []
+        for url in urls:
+            if isinstance(url, dict):
+                url = dict(url)
+                if "integrity" in url:
+                    self.integrity[url["url"]] = url.pop("integrity")
+                entries.append((url["url"], url.get("type") or _url_type(url["url"])))
+            else:
+                entries.append((url, _url_type(url)))
+        with self._lock:
+            self.assets[name] = entries
+            self._cache.clear()
+
+    def add_integrity(self, root, base_url="", algorithm="sha384"):
+        """
+        Compute integrity hashes from local copies of the assets.
+
+        Args:
+            root:
+                Directory with the local files.
+            base_url:
+                Prefix removed from URLs before locating files in root. URLs
+                that do not start with base_url are ignored.
+            algorithm:
+                One of "sha256", "sha384" or "sha512".
+        """
+        for name, entries in self.assets.items():
+            for url, _ in entries:
+                if not url.startswith(base_url):
+                    continue
+                path = url[len(base_url):].partition("?")[0].lstrip("/")
+                path = os.path.join(root, *path.split("/"))
+                if os.path.exists(path):
+                    self.integrity[url] = file_integrity(path, algorithm)
+        with self._lock:
+            self._cache.clear()
+
+    def urls(self, *names):
+        """
+        Return a list of URLs for the given asset names.
+        """
+        return [url for url, _ in self._entries(names)]
+
+    def elements(self, *names):
+        """
+        Return a list of elements for the given asset names.
+        """
+        return [self._element(url, kind) for url, kind in self._entries(names)]
+
+    def render(self, *names):
+        """
+        Return a Block with the tags for all given asset names.
+
+        Elements are built only once for each sequence of names and copied
+        from the cache.
+        """
+        try:
+            elements = self._cache[names]
+        except KeyError:
+            elements = tuple(self.elements(*names))
+            with self._lock:
+                self._cache[names] = elements
+        return Block([elem.copy() for elem in elements])
+
+    def _entries(self, names):
+        seen = set()
+        for name in names:
+            try:
+                entries = self.assets[name]
+            except KeyError:
+                raise ValueError(f"invalid asset: {name}")
+            for url, kind in entries:
+                if url not in seen:
+                    seen.add(url)
+                    yield url, kind
+
+    def _element(self, url, kind):
+        attrs = {}
+        integrity = self.integrity.get(url)
+        if integrity:
+            attrs = {"integrity": integrity, "crossorigin": self.crossorigin}
+        if kind == "css":
+            return link(rel="stylesheet", href=url, **attrs)
+        elif kind == "js":
+            return script(src=url, **attrs)
+        elif kind == "font":
+            crossorigin = self.crossorigin or "anonymous"
+            attrs["crossorigin"] = crossorigin
+            return link(rel="preload", as_="font", href=url, **attrs)
+        raise ValueError(f"invalid asset type: {kind!r}")
+
+
+def file_integrity(path, algorithm="sha384"):
+    """
+    Return the subresource integrity hash of a local file.
+    """
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as fd:
+        for chunk in iter(lambda: fd.read(65536), b""):
+            hasher.update(chunk)
+    digest = base64.b64encode(hasher.digest()).decode("ascii")
+    return f"{algorithm}-{digest}"
+
+
+def _url_type(url):
+    path = url.partition("?")[0].partition("#")[0]
+    ext = path.rpartition(".")[2]
+    if ext in ("css", "js"):
+        return ext
+    elif ext in FONT_EXTENSIONS:
+        return "font"
+    raise ValueError(f"cannot determine type of asset: {url!r}")
+
+
+def _format_urls(urls, **params):
+    if isinstance(urls, str):
+        return urls.format(**params)
+    elif isinstance(urls, dict):
+        return {**urls, "url": urls["url"].format(**params)}
+    return [_format_urls(url, **params) for url in urls]
+
+
+def asset_key(item):
+    """
+    Return the deduplication key for asset.
+    """
+    if isinstance(item, str) and not hasattr(item, "__html__"):
+        return item
+    elem = _unwrap(as_child(item))
+    attrs = elem.attrs
+    return attrs.get("href") or attrs.get("src") or str(elem)
+
+
+def collect_assets(tree):
+    """
+    Return an :class:`Assets` collection with all requirements declared in
+    the given tree.
+    """
+    assets = Assets()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        for item in node.requires:
+            assets.add(item)
+        tree = getattr(node, "_tree", None)
+        if tree is not None:
+            stack.append(tree)
+        else:
+            stack.extend(reversed(node.children))
+    return assets
+
+
+def render_with_assets(tree):
+    """
+    Render tree, injecting the required assets at the end of the <head>
+    element.
+
+    Requirements are collected during rendering, so the tree is visited only
+    once and the output is never parsed again. Stylesheets and scripts that
+    are already present in the head are not repeated. Assets are placed at
+    the beginning of the output when the tree has no <head> element.
+
+    Examples:
+        >>> tree = HTML5([head(), body([div('hi', requires=['app.js'])])])
+        >>> print(render_with_assets(tree))
+        <html><head><script src="app.js"></script></head><body><div>hi</div></body></html>
+    """
+    chunks = []
+    head_pos = []
+    assets = Assets()
+    _dump(tree, chunks, assets, head_pos)
+    if assets:
+        chunks.insert(head_pos[0] if head_pos else 0, assets.render())
+    return Markup("".join(chunks))
+
+
+def _dump(node, chunks, assets, head_pos):
+    for item in node.requires:
+        assets.add(item)
+
+    tree = getattr(node, "_tree", None)
+    if tree is not None:
+        _dump(tree, chunks, assets, head_pos)
+    elif node.is_element:
+        _dump_element(node, chunks, assets, head_pos)
+    elif node.children:
+        for child in node.children:
+            _dump(child, chunks, assets, head_pos)
+    else:
+        chunks.append(node.render())
+
+
+def _dump_element(node, chunks, assets, head_pos):
+    tag = node.tag
+    attrs = node.attrs and render_attrs(node.attrs)
+    chunks.append(f"<{tag} {attrs}>" if attrs else f"<{tag}>")
+    if tag == "head":
+        _exclude_present(node, assets)
+    if not node.is_void:
+        for child in node.children:
+            _dump(child, chunks, assets, head_pos)
+    if tag == "head" and not head_pos:
+        head_pos.append(len(chunks))
+    chunks.append(f"</{tag}>")
+
+
+def _exclude_present(head, assets):
+    for child in head.children:
+        child = _unwrap(child)
+        if child.is_element and child.tag in ("link", "script"):
+            url = child.attrs.get("href") or child.attrs.get("src")
+            if url:
+                assets.exclude(url)
+        elif child.children:
+            _exclude_present(child, assets)
+
+
+def _unwrap(node):
+    tree = getattr(node, "_tree", None)
+    return node if tree is None else _unwrap(tree)
@@ -0,0 +1,11 @@
+"""
+Reproducible performance benchmarks for Hyperpython.
+
+Run ``hyperpython-benchmark`` (or ``python -m hyperpython.benchmarks``) to
+measure all workloads. Use ``--save FILE`` to store a baseline and
+``--compare FILE`` to check for regressions against it. ``--threads 1,2,4``
+measures how throughput scales with the number of threads.
+"""
+from .runner import run_benchmark, run_all, compare, load_baseline, save_baseline
+from .runner import run_scaling, run_all_scaling, gil_enabled
+from .workloads import Workload, WORKLOADS, SCALING_WORKLOADS
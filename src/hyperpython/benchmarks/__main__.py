@@ -0,0 +1,54 @@
+import argparse
+import sys
+
+from .runner import run_all, compare, load_baseline, save_baseline, format_results
+from .runner import run_all_scaling, format_scaling
+
+
+def main(argv=None):
+    """
+    Entry point for the hyperpython-benchmark command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="hyperpython-benchmark", description="Run Hyperpython benchmarks."
+    )
+    parser.add_argument("select", nargs="*", help="run only matching workloads")
+    parser.add_argument("--save", metavar="FILE", help="save results as baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare with baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--size", type=int, help="override workload sizes")
+    parser.add_argument(
+        "--threads", metavar="N,M,...", help="measure scaling with thread counts"
+    )
+    args = parser.parse_args(argv)
+
+    if args.threads:
+        threads = [int(n) for n in args.threads.split(",")]
+        results = run_all_scaling(
+            select=args.select, threads=threads, min_time=args.min_time, size=args.size
+        )
+        format_scaling(results)
+        return 0
+
+    results = run_all(
+        select=args.select,
+        min_time=args.min_time,
+        repeat=args.repeat,
+        size=args.size,
+    )
+    comparison = None
+    if args.compare:
+        comparison = compare(results, load_baseline(args.compare), args.tolerance)
+    format_results(results, comparison)
+
+    if args.save:
+        save_baseline(results, args.save)
+    if comparison and any(bad for _, _, bad in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Benchmark runner: timing, memory measurement and baseline comparison.
+"""
+import json
+import platform
+import sys
+import threading
+import tracemalloc
+from time import perf_counter, sleep
+
+from .workloads import WORKLOADS, SCALING_WORKLOADS
+
+
+def run_benchmark(workload, min_time=0.2, repeat=3):
+    """
+    Run a single workload instance.
+
+    The workload is executed in a loop for at least ``min_time`` seconds. This
+    is repeated ``repeat`` times and the best result is kept. Peak memory is
+    measured with tracemalloc in a separate (untimed) execution.
+
+    Returns:
+        A dictionary with "ops" (operations per second), "peak" (peak memory
+        in bytes) and "size" keys.
+    """
+    workload.setup()
+    try:
+        workload.run()  # warm up caches
+        best = 0.0
+        for _ in range(repeat):
+            best = max(best, _ops_per_second(workload.run, min_time))
+        peak = _peak_memory(workload.run)
+    finally:
+        workload.teardown()
+    return {"ops": best, "peak": peak, "size": workload.size}
+
+
+def run_all(workloads=None, select=None, min_time=0.2, repeat=3, size=None):
+    """
+    Run all workloads and return a mapping from workload names to results.
+
+    Args:
+        workloads:
+            List of workload classes (defaults to all registered workloads).
+        select:
+            Optional list of substrings used to filter workloads by name.
+        size:
+            Override the default size of each workload.
+    """
+    results = {}
+    for cls in WORKLOADS if workloads is None else workloads:
+        if select and not any(pattern in cls.name for pattern in select):
+            continue
+        results[cls.name] = run_benchmark(cls(size), min_time, repeat)
+    return results
+
+
+def run_scaling(cls, threads=(1, 2, 4, 8), min_time=0.2, size=None):
+    """
+    Measure how the throughput of a workload scales with the number of
+    threads.
+
+    Each thread renders its own independent workload instance, so any loss of
+    scaling comes from shared state inside Hyperpython or from the GIL.
+
+    Returns:
+        A dictionary with "ops" (total operations per second), "efficiency"
+        (ops divided by n times the single thread throughput) and "gil"
+        (False on free-threaded builds of Python) keys. "ops" and "efficiency"
+        map the number of threads to the measured values.
+    """
+    ops = {n: _threaded_ops_per_second(cls, n, min_time, size) for n in threads}
+    base = ops[min(ops)] / min(ops)
+    efficiency = {n: value / (n * base) for n, value in ops.items()}
+    return {"ops": ops, "efficiency": efficiency, "gil": gil_enabled()}
+
+
+def run_all_scaling(workloads=None, select=None, threads=(1, 2, 4, 8), min_time=0.2, size=None):
+    """
+    Run :func:`run_scaling` for all selected workloads and return a mapping
+    from workload names to results.
+    """
+    results = {}
+    for cls in SCALING_WORKLOADS if workloads is None else workloads:
+        if select and not any(pattern in cls.name for pattern in select):
+            continue
+        results[cls.name] = run_scaling(cls, threads, min_time, size)
+    return results
+
+
+def gil_enabled():
+    """
+    Return True if the interpreter is running with the GIL.
+    """
+    is_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+    return True if is_enabled is None else is_enabled()
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    Compare results against a baseline.
+
+    Returns:
+        A list of (name, ratio, regressed) tuples, in which ratio is the
+        speed of the current run relative to the baseline (> 1 is faster).
+        Regression is signaled if the ratio drops below 1 - tolerance.
+    """
+    rows = []
+    for name, data in results.items():
+        try:
+            reference = baseline[name]
+        except KeyError:
+            continue
+        if data["size"] != reference.get("size", data["size"]):
+            continue
+        ratio = data["ops"] / reference["ops"]
+        rows.append((name, ratio, ratio < 1 - tolerance))
+    return rows
+
+
+def save_baseline(results, path):
+    """
+    Save results as a JSON baseline file.
+    """
+    data = {"python": platform.python_version(), "results": results}
+    with open(path, "w") as fd:
+        json.dump(data, fd, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    Load results saved with :func:`save_baseline`.
+    """
+    with open(path) as fd:
+        return json.load(fd)["results"]
+
+
+def format_results(results, comparison=None, file=None):
+    """
+    Print a human-readable table of results.
+    """
+    file = sys.stdout if file is None else file
+    ratios = {name: (ratio, bad) for name, ratio, bad in comparison or ()}
+    width = max((len(name) for name in results), default=10)
+    for name, data in results.items():
+        line = f"{name:<{width}}  {data['ops']:>12,.1f} ops/s  {data['peak'] / 1024:>10,.1f} KiB"
+        if name in ratios:
+            ratio, bad = ratios[name]
+            line += f"  {ratio:6.2f}x" + ("  REGRESSION" if bad else "")
+        print(line, file=file)
+
+
+def format_scaling(results, file=None):
+    """
+    Print a human-readable table of scaling results.
+    """
+    file = sys.stdout if file is None else file
+    width = max((len(name) for name in results), default=10)
+    for name, data in results.items():
+        for n, ops in data["ops"].items():
+            efficiency = data["efficiency"][n]
+            print(f"{name:<{width}}  {n:>3} threads  {ops:>12,.1f} ops/s  {efficiency:6.1%}", file=file)
+    if results:
+        gil = next(iter(results.values()))["gil"]
+        print(f"GIL {'enabled' if gil else 'disabled'}", file=file)
+
+
+def _threaded_ops_per_second(cls, n, min_time, size):
+    workloads = [cls(size) for _ in range(n)]
+    for workload in workloads:
+        workload.setup()
+    try:
+        for workload in workloads:
+            workload.run()  # warm up caches
+        rates = [0.0] * n
+        start = threading.Barrier(n + 1)
+        stop = threading.Event()
+
+        def worker(i):
+            run = workloads[i].run
+            count = 0
+            start.wait()
+            begin = perf_counter()
+            while not stop.is_set():
+                run()
+                count += 1
+            rates[i] = count / (perf_counter() - begin)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        sleep(min_time)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        for workload in workloads:
+            workload.teardown()
+    return sum(rates)
+
+
+def _ops_per_second(func, min_time):
+    n = 0
+    start = perf_counter()
+    end = start + min_time
+    while True:
+        func()
+        n += 1
+        now = perf_counter()
+        if now >= end:
+            return n / (now - start)
+
+
+def _peak_memory(func):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+        tracemalloc.reset_peak()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return peak - base
@@ -0,0 +1,372 @@
+"""
+Benchmark workloads.
+
+Each workload builds its input data in setup() so only the operation under
+test is measured by run().
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core import Text
+from ..fragment import fragment
+from ..html import html, render
+from ..renderers import render_attrs, render_bytes
+from ..tags import div, span, p, table, thead, tbody, tr, th, td, form
+from ..tags import label, input_, select, option, textarea, button, nav
+
+
+class Workload:
+    """
+    Base class for all benchmark workloads.
+
+    Subclasses must implement run() and may override setup()/teardown().
+    """
+
+    name = None
+    size = 1
+
+    def __init__(self, size=None):
+        if size is not None:
+            self.size = size
+
+    def __repr__(self):
+        return f"{type(self).__name__}(size={self.size})"
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def run(self):
+        raise NotImplementedError
+
+
+#
+# Tree construction and rendering
+#
+def deep_tree(depth):
+    node = span("leaf")
+    for i in range(depth):
+        node = div({"class": ["level", f"level-{i}"]}, [p(f"node {i}"), node])
+    return node
+
+
+def wide_table(rows, cols=10):
+    header = thead(tr([th(f"col {j}") for j in range(cols)]))
+    body = tbody(
+        [tr([td(i * cols + j) for j in range(cols)]) for i in range(rows)]
+    )
+    return table({"class": "table"}, [header, body])
+
+
+def attrs_form(fields):
+    children = []
+    for i in range(fields):
+        name = f"field_{i}"
+        children.append(label(name, for_=name, class_="form-label"))
+        children.append(
+            input_(
+                type="text",
+                id=name,
+                name=name,
+                value=f'value "{i}" & more',
+                placeholder="type something",
+                class_={"form-control": True, "input": True, "invalid": i % 3 == 0},
+                required=True,
+                disabled=i % 5 == 0,
+                data_index=i,
+                data_options={"min": 0, "max": i},
+                aria_label=f"Field {i}",
+            )
+        )
+    children.append(select(name="choice")[[option(x, value=x) for x in "abcde"]])
+    children.append(textarea("some <text>", name="text", rows=3))
+    children.append(button("Send", type="submit", class_="btn btn-primary"))
+    return form(method="post", action="/submit", children=children)
+
+
+class DeepTreeBuild(Workload):
+    name = "deep_tree.build"
+    size = 100
+
+    def run(self):
+        deep_tree(self.size)
+
+
+class DeepTreeRender(Workload):
+    name = "deep_tree.render"
+    size = 100
+
+    def setup(self):
+        self.tree = deep_tree(self.size)
+
+    def run(self):
+        self.tree.render()
+
+
+class WideTableBuild(Workload):
+    name = "wide_table.build"
+    size = 100
+
+    def run(self):
+        wide_table(self.size)
+
+
+class WideTableRender(Workload):
+    name = "wide_table.render"
+    size = 100
+
+    def setup(self):
+        self.tree = wide_table(self.size)
+
+    def run(self):
+        self.tree.render()
+
+
+class WideTableRenderBytes(WideTableRender):
+    name = "wide_table.render_bytes"
+
+    def run(self):
+        render_bytes(self.tree)
+
+
+class FormBuild(Workload):
+    name = "form.build"
+    size = 50
+
+    def run(self):
+        attrs_form(self.size)
+
+
+class FormRender(Workload):
+    name = "form.render"
+    size = 50
+
+    def setup(self):
+        self.tree = attrs_form(self.size)
+
+    def run(self):
+        self.tree.render()
+
+
+class FormPretty(FormRender):
+    name = "form.pretty"
+
+    def run(self):
+        self.tree.pretty()
+
+
+class DumpAttrs(Workload):
+    name = "form.dump_attrs"
+    size = 50
+
+    def setup(self):
+        self.attrs = [x.attrs for x in attrs_form(self.size).walk_tags()]
+
+    def run(self):
+        for attrs in self.attrs:
+            render_attrs(attrs)
+
+
+class IconToolbar(Workload):
+    name = "toolbar.fa_icon"
+    size = 100
+    icons = ["edit", "trash", "save", "search", "github", "twitter", "user", "cog"]
+
+    def run(self):
+        from ..components import fa_icon
+
+        icons = self.icons
+        n = len(icons)
+        children = []
+        for i in range(self.size):
+            name = icons[i % n]
+            children.append(fa_icon(name, href=f"#{name}-{i}", title=name))
+        nav(class_="toolbar", children=children).render()
+
+
+class SemanticButtons(Workload):
+    name = "semantic.button"
+    size = 500
+    flags = [
+        {"primary": True},
+        {"basic": True, "small": True},
+        {"negative": True, "loading": True},
+        {"red": True, "fluid": True, "huge": True},
+    ]
+
+    def run(self):
+        from ..contrib.semantic import button
+
+        flags = self.flags
+        n = len(flags)
+        for i in range(self.size):
+            button("Click", **flags[i % n]).render()
+
+
+class GridGallery(Workload):
+    name = "grid.milligram"
+    size = 1000
+
+    def setup(self):
+        items = [f"Card {i}" for i in range(self.size)]
+        self.rows = [items[i:i + 4] for i in range(0, self.size, 4)]
+
+    def run(self):
+        from ..contrib.milligram import grid
+
+        grid(self.rows, lambda item: div(item, class_="card"), size=25).render()
+
+
+class PageHead(Workload):
+    name = "page.head"
+    size = 100
+
+    def run(self):
+        from ..components import Head
+
+        for i in range(self.size):
+            Head(
+                f"Page {i}",
+                stylesheets=["main.css", "theme.css"],
+                scripts=["main.js"],
+                favicons={"default": "/favicon.ico", 57: "/icon-57.png"},
+                meta_headers={"description": "Benchmark page"},
+            ).render()
+
+
+#
+# Role dispatch
+#
+class Dispatch(Workload):
+    name = "dispatch.html"
+    size = 1000
+
+    def setup(self):
+        values = ["text", 42, 3.14, Text("text"), p("elem"), [1, 2], {"a": 1}]
+        self.data = [values[i % len(values)] for i in range(self.size)]
+
+    def run(self):
+        for obj in self.data:
+            html(obj)
+
+
+class DispatchRender(Dispatch):
+    name = "dispatch.render"
+
+    def run(self):
+        for obj in self.data:
+            render(obj)
+
+
+class DispatchThreads(Dispatch):
+    """
+    Dispatch from several threads at once to expose contention in the
+    dispatch cache.
+    """
+
+    name = "dispatch.html_threads"
+    threads = 4
+
+    def setup(self):
+        super().setup()
+        self.executor = ThreadPoolExecutor(self.threads)
+
+    def teardown(self):
+        self.executor.shutdown()
+
+    def run(self):
+        run = super().run
+        futures = [self.executor.submit(run) for _ in range(self.threads)]
+        for future in futures:
+            future.result()
+
+
+#
+# Fragments
+#
+class FragmentLookup(Workload):
+    name = "fragment.lookup"
+    size = 500
+
+    def setup(self):
+        self._saved = _save_registry()
+        register = fragment.register
+        self.paths = []
+        for i in range(self.size):
+            register(f"benchmark.simple-{i}")(lambda: div("simple"))
+            self.paths.append(f"benchmark.simple-{i}")
+        for i in range(self.size // 10):
+            register(f"benchmark.pattern-{i}/<int:n>")(lambda n: div(n))
+            self.paths.append(f"benchmark.pattern-{i}/{i}")
+
+    def teardown(self):
+        _restore_registry(self._saved)
+
+    def run(self):
+        for path in self.paths:
+            fragment(path)
+
+
+class FragmentLookupThreads(FragmentLookup):
+    name = "fragment.lookup_threads"
+    threads = 4
+
+    def setup(self):
+        super().setup()
+        self.executor = ThreadPoolExecutor(self.threads)
+
+    def teardown(self):
+        self.executor.shutdown()
+        super().teardown()
+
+    def run(self):
+        run = super().run
+        futures = [self.executor.submit(run) for _ in range(self.threads)]
+        for future in futures:
+            future.result()
+
+
+def _save_registry():
+    mod = sys.modules[fragment.__module__]
+    return mod.FRAGMENT_REGISTRY, mod.SIMPLE_PATH_REGISTRY
+
+
+def _restore_registry(saved):
+    mod = sys.modules[fragment.__module__]
+    with mod._registry_lock:
+        mod.FRAGMENT_REGISTRY, mod.SIMPLE_PATH_REGISTRY = saved
+
+
+WORKLOADS = [
+    DeepTreeBuild,
+    DeepTreeRender,
+    WideTableBuild,
+    WideTableRender,
+    WideTableRenderBytes,
+    FormBuild,
+    FormRender,
+    FormPretty,
+    DumpAttrs,
+    IconToolbar,
+    SemanticButtons,
+    GridGallery,
+    PageHead,
+    Dispatch,
+    DispatchRender,
+    DispatchThreads,
+    FragmentLookup,
+    FragmentLookupThreads,
+]
+
+# Workloads without global side effects, used to measure multi-thread scaling
+SCALING_WORKLOADS = [
+    DeepTreeRender,
+    WideTableRender,
+    IconToolbar,
+    SemanticButtons,
+    GridGallery,
+    PageHead,
+    DispatchRender,
+]
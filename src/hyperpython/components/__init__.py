@@ -1,15 +1,45 @@
-from .data import html_map, html_list, html_table, wrap
-from .hyperlinks import a_or_span, a_or_p, a_or_button, hyperlink, breadcrumbs, url
-from .icons import icon, fa_icon
-from .text import markdown, elem_or_span, elem_or_div
-from .page import (
-    meta_properties,
-    meta_headers,
-    meta_og,
-    meta_values,
-    stylesheets,
-    scripts,
-    favicons,
-    google_analytics,
-    Head,
-)
+"""
+Reusable Hyperpython components.
+
+Names are loaded lazily from their submodules on first access.
+"""
+from importlib import import_module
+
+_LAZY_NAMES = {
+    **dict.fromkeys(["html_map", "html_list", "html_table", "wrap"], "data"),
+    **dict.fromkeys(
+        ["a_or_span", "a_or_p", "a_or_button", "hyperlink", "breadcrumbs", "url"],
+        "hyperlinks",
+    ),
+    **dict.fromkeys(["icon", "fa_icon", "SvgIcons"], "icons"),
+    **dict.fromkeys(["markdown", "elem_or_span", "elem_or_div"], "text"),
+    **dict.fromkeys(
+        [
+            "meta_properties",
+            "meta_headers",
+            "meta_og",
+            "meta_values",
+            "stylesheets",
+            "scripts",
+            "favicons",
+            "google_analytics",
+            "Head",
+        ],
+        "page",
+    ),
+}
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_NAMES})
@@ -1,5 +1,16 @@
-from .fa_icons import COLLECTIONS as FA_COLLECTIONS
-from ..tags import i, a
+import os
+import re
+
+from markupsafe import Markup
+
+from .fa_icons import icon_collection
+from ..core import Blob, Block
+from ..renderers.helpers import open_tag
+from ..tags import i, a, h
+
+ICON_NAME = re.compile(r"^[\w-]+$")
+SVG_ROOT = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.DOTALL)
+SVG_VIEWBOX = re.compile(r'\bviewBox\s*=\s*["\']([^"\']*)["\']')
 
 
 def icon(name, href=None, icon_class=lambda x: x, icon_data=lambda x: [], **kwargs):
@@ -44,7 +55,181 @@ def fa_icon(name, href=None, collection=None, **kwargs):
         <i class="fa fa-face"></i>
     """
     if collection is None:
-        collection = FA_COLLECTIONS.get(name, "fa")
+        collection = icon_collection(name)
     if href:
         return a(fa_icon(name, collection=collection, **kwargs), href=href)
     return icon(name, href, lambda x: [collection, f"fa-{name}"], **kwargs)
+
+
+class SvgIcons:
+    """
+    Icon backend that renders icons as references to symbols in an inline
+    SVG sprite.
+
+    Each icon is an ``<svg><use href="#id"></use></svg>`` element. Symbol
+    definitions are read from ``<path>/<name>.svg`` files and cached after the
+    first read. The sprite with the symbols used in a page is created with the
+    :meth:`sprite` or :meth:`inject` methods.
+
+    Args:
+        path (str):
+            Directory with SVG files.
+        prefix (str):
+            Prefix for the ids of symbols in the sprite.
+        icon_class (str):
+            Class added to each icon. Icons also receive an
+            "<icon_class>-<name>" class.
+    """
+
+    def __init__(self, path, prefix="icon-", icon_class="icon"):
+        self.path = path
+        self.prefix = prefix
+        self.icon_class = icon_class
+        self._symbols = {}
+
+    def icon(self, name, href=None, **kwargs):
+        """
+        Return an SVG icon that references the symbol for the given name.
+
+        Args:
+            name (str):
+                Name of the icon (the SVG file name, without extension).
+            href (str):
+                If given, it wraps the results into a anchor link.
+
+            Additional keyword arguments are passed as attributes to the <svg>
+            element.
+        """
+        if href:
+            return a(self.icon(name, **kwargs), href=href)
+        if not ICON_NAME.match(name):
+            raise ValueError(f"invalid icon name: {name!r}")
+        cls = self.icon_class
+        use = h("use", href=f"#{self.prefix}{name}")
+        return h("svg", {"class": [cls, f"{cls}-{name}"]}, [use], **kwargs)
+
+    def symbol(self, name):
+        """
+        Return the <symbol> definition for the given icon as a string.
+        """
+        try:
+            return self._symbols[name]
+        except KeyError:
+            pass
+
+        if not ICON_NAME.match(name):
+            raise ValueError(f"invalid icon name: {name!r}")
+        with open(os.path.join(self.path, name + ".svg"), encoding="utf8") as fd:
+            source = fd.read()
+        m = SVG_ROOT.search(source)
+        if m is None:
+            raise ValueError(f"invalid SVG file for icon: {name!r}")
+        attrs, content = m.groups()
+        viewbox = SVG_VIEWBOX.search(attrs)
+        viewbox = f' viewBox="{viewbox.group(1)}"' if viewbox else ""
+        symbol = f'<symbol id="{self.prefix}{name}"{viewbox}>{content.strip()}</symbol>'
+        self._symbols[name] = symbol
+        return symbol
+
+    def used_icons(self, tree):
+        """
+        Return the list of icon names referenced in tree, in order of first
+        use.
+        """
+        return self._scan(tree)[0]
+
+    def sprite(self, *sources):
+        """
+        Return a hidden SVG sprite with the symbols for the given sources.
+
+        Sources can be icon names or element trees. Each symbol is included
+        only once, no matter how many times the icon is used.
+        """
+        names = {}
+        for src in sources:
+            if isinstance(src, str) and not hasattr(src, "walk_tags"):
+                names[src] = None
+            else:
+                names.update(dict.fromkeys(self.used_icons(src)))
+        data = "".join(map(self.symbol, names))
+        return Blob(
+            f'<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+            f"{data}</svg>"
+        )
+
+    def inject(self, tree):
+        """
+        Insert the sprite with all icons used in tree into the document.
+
+        The sprite is inserted as the first child of the <body> element, if
+        tree contains one. Otherwise, it returns a Block with the sprite
+        followed by the tree.
+        """
+        names, body = self._scan(tree)
+        if not names:
+            return tree
+        if body is not None:
+            body.children.insert(0, self.sprite(*names))
+            return tree
+        return Block([self.sprite(*names), tree])
+
+    def render(self, tree):
+        """
+        Render tree with a sprite containing all icons used in it.
+
+        Icons are collected while the tree is rendered, hence the tree is
+        visited only once and it is not modified. The sprite is placed at the
+        beginning of the <body> element or at the beginning of the output, if
+        there is no <body>.
+        """
+        chunks = []
+        names = {}
+        body = []
+        self._render(tree, chunks, names, body)
+        if names:
+            chunks.insert(body[0] if body else 0, self.sprite(*names))
+        return Markup("".join(chunks))
+
+    def _scan(self, tree):
+        # Visit every node, including Blocks and components nested in elements
+        names = {}
+        body = None
+        for elem in tree.walk():
+            if not elem.is_element:
+                continue
+            elif elem.tag == "use":
+                self._add_name(elem, names)
+            elif elem.tag == "body" and body is None:
+                body = elem
+        return list(names), body
+
+    def _add_name(self, elem, names):
+        start = "#" + self.prefix
+        href = elem.attrs.get("href", "")
+        if href.startswith(start):
+            names[href[len(start):]] = None
+
+    def _render(self, node, chunks, names, body):
+        tree = getattr(node, "_tree", None)
+        if tree is not None:
+            self._render(tree, chunks, names, body)
+        elif not node.is_element:
+            if node.children:
+                for child in node.children:
+                    self._render(child, chunks, names, body)
+            else:
+                chunks.append(node.render())
+        else:
+            self._render_element(node, chunks, names, body)
+
+    def _render_element(self, node, chunks, names, body):
+        tag = node.tag
+        if tag == "use":
+            self._add_name(node, names)
+        chunks.append(open_tag(node))
+        if tag == "body" and not body:
+            body.append(len(chunks))
+        if not node.is_void:
+            for child in node.children:
+                self._render(child, chunks, names, body)
+        chunks.append(f"</{tag}>")
@@ -2,8 +2,11 @@ from types import MappingProxyType
 
 from ..core import Block, Component
 from ..tags import link, meta, script, title, head
+from ..utils.cache import LRUCache, freeze
+from ..utils.descriptors import lazy
 
 APPLE_TOUCH_ICONS = {"57x57", "72x72", "114x114", 57, 72, 114}
+HEAD_CACHE_SIZE = 128
 
 
 def stylesheets(sheets):
@@ -112,8 +115,15 @@ ga('create', '%s', 'auto');"""
 class Head(Component):
     """
     Stores all information typically found on the <head> section of a web page.
+
+    All tags, except for the title, are built and rendered once for each
+    distinct configuration and cached. A configuration is given by the class
+    and by all instance attributes, except for the title. Subclasses that
+    override methods such as css_tags() to depend on other values (e.g.,
+    global settings) should set ``cache_static = False``.
     """
 
+    cache_static = True
     google_analytics_id = None
     stylesheets = ()
     scripts = ()
@@ -141,29 +151,71 @@ class Head(Component):
             setattr(self, k, v)
 
     def html(self):
-        return head(
+        og_title = getattr(self, "og_title", self.title)
+        og_title = [] if og_title is None else meta_og({"title": og_title}).children
+        if self.cache_static:
+            charset, before_og, after_og = self.static_parts()
+        else:
+            charset, before_og, after_og = map(Block, self._static_tags())
+        return head([charset, title(self.title), before_og, *og_title, after_og])
+
+    def static_parts(self):
+        """
+        Return a tuple of (charset, before_og_title, after_og_title) Blocks
+        with the tags that do not depend on the page title.
+
+        Blocks are rendered from HTML cached for all heads with the same
+        settings. Their children are copies of the cached elements, created
+        only when accessed. Unhashable settings disable the cache.
+        """
+        try:
+            key = self._static_key()
+        except TypeError:
+            return tuple(map(Block, self._static_tags()))
+
+        parts = _HEAD_CACHE.get(key)
+        if parts is None:
+            parts = tuple(
+                (tuple(tags), "".join(tag.render() for tag in tags))
+                for tags in self._static_tags()
+            )
+            _HEAD_CACHE.set(key, parts)
+        return tuple(_StaticTags(tags, data) for tags, data in parts)
+
+    def _static_key(self):
+        settings = {
+            k: v
+            for k, v in vars(self).items()
+            if k not in ("title", "og_title") and not k.startswith("_")
+        }
+        key = (type(self), freeze(settings))
+        hash(key)  # fail early on unhashable settings
+        return key
+
+    def _static_tags(self):
+        return (
+            [meta(charset=self.charset)],
             [
-                meta(charset=self.charset),
-                title(self.title),
                 meta(name="viewport", content=self.viewport),
                 *self.meta_values_tags(),
                 *self.meta_headers_tags(),
                 *self.meta_properties_tags(),
+            ],
+            [
                 *self.open_graph_tags(),
                 *self.css_tags(),
                 *self.script_tags(),
                 *self.google_analytics_tag(),
                 *self.favicon_tags(),
-            ]
+            ],
         )
 
     def open_graph_tags(self):
-        data = {
-            "title": getattr(self, "og_title", self.title),
-            "type": getattr(self, "og_type", "website"),
-        }
-        clean_data = {k: v for k, v in data.items() if v is not None}
-        return meta_og(clean_data).children
+        """
+        Open Graph tags, except for og:title.
+        """
+        og_type = getattr(self, "og_type", "website")
+        return [] if og_type is None else meta_og({"type": og_type}).children
 
     def meta_values_tags(self):
         return meta_values(self.meta_values).children
@@ -176,7 +228,7 @@ class Head(Component):
 
     def google_analytics_tag(self):
         if self.google_analytics_id:
-            return google_analytics(self.google_analytics_id).children
+            return [google_analytics(self.google_analytics_id)]
         else:
             return []
 
@@ -190,6 +242,34 @@ class Head(Component):
         return favicons(self.favicons).children
 
 
+class _StaticTags(Block):
+    """
+    A Block of cached tags that is rendered from cached HTML.
+
+    Children are copies of the cached tags, created on first access. Once
+    they are accessed, the block is rendered from its children, hence changes
+    to them are not lost.
+    """
+
+    def __init__(self, tags, data):
+        self.tags = tags
+        self.data = data
+        self.requires = []
+
+    @lazy
+    def children(self):
+        return [tag.copy() for tag in self.tags]
+
+    def dump(self, file):
+        if "children" in self.__dict__:
+            super().dump(file)
+        else:
+            file.write(self.data)
+
+
+_HEAD_CACHE = LRUCache(maxsize=HEAD_CACHE_SIZE)
+
+
 #
 #  Auxiliary functions
 #
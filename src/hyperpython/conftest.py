@@ -1,6 +1,8 @@
+import importlib.util
 import sys
-import mock
 
+import mock
+import pytest
 from sidekick import Record, record
 
 
@@ -19,10 +21,27 @@ class User(Model, Record):
         return self.first_name or self.username
 
 
-sys.modules["django"] = record()
-sys.modules["django.contrib"] = record()
-sys.modules["django.contrib.auth"] = record(get_user_model=lambda: User)
-sys.modules["django.template"] = record()
-sys.modules["django.template.loader"] = record(get_template=mock.Mock())
-sys.modules["django.middleware"] = record()
-sys.modules["django.middleware.csrf"] = record(get_token=lambda _: "csrf-token-value")
+class StreamingHttpResponse(dict):
+    def __init__(self, streaming_content=(), **kwargs):
+        super().__init__()
+        self.streaming_content = streaming_content
+
+
+# Doctests of hyperpython.django are collected even when Django is not
+# installed. Fake the modules they import in that case only: replacing them
+# would break tests that already use the real Django.
+if importlib.util.find_spec("django") is None:
+    sys.modules["django"] = record()
+    sys.modules["django.contrib"] = record()
+    sys.modules["django.template"] = record()
+    sys.modules["django.template.loader"] = record(get_template=mock.Mock())
+    sys.modules["django.http"] = record(StreamingHttpResponse=StreamingHttpResponse)
+    sys.modules["django.utils"] = record()
+    sys.modules["django.utils.cache"] = record(get_conditional_response=lambda *args, **kwargs: None)
+    sys.modules["django.middleware"] = record()
+    sys.modules["django.middleware.csrf"] = record(get_token=lambda _: "csrf-token-value")
+
+
+@pytest.fixture(autouse=True)
+def django_user_model(monkeypatch):
+    monkeypatch.setitem(sys.modules, "django.contrib.auth", record(get_user_model=lambda: User))
@@ -0,0 +1,69 @@
+"""
+Request-scoped values available to renderers and components.
+
+Values such as the current request, locale or user can be set once with
+:func:`render_context` instead of being passed as keyword arguments through
+every call to :func:`hyperpython.html`. The context is stored in a
+:class:`contextvars.ContextVar`, hence each thread and each asyncio task sees
+only its own values.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from types import MappingProxyType
+
+_context = ContextVar("hyperpython_render_context", default=MappingProxyType({}))
+
+
+@contextmanager
+def render_context(**values):
+    """
+    Context manager that sets values in the render context.
+
+    Values are merged with the current context and restored on exit.
+
+    Examples:
+        >>> with render_context(locale='pt-BR'):
+        ...     context_value('locale')
+        'pt-BR'
+        >>> context_value('locale') is None
+        True
+    """
+    token = _context.set(MappingProxyType({**_context.get(), **values}))
+    try:
+        yield get_context()
+    finally:
+        _context.reset(token)
+
+
+def get_context():
+    """
+    Return a read-only mapping with all values in the current render context.
+    """
+    return _context.get()
+
+
+def context_value(name, default=None):
+    """
+    Return value from the current render context, or default if not set.
+    """
+    return _context.get().get(name, default)
+
+
+def iter_in_context(iterable, **values):
+    """
+    Iterate over iterable with the given values set in the render context.
+
+    The context is preserved across iterations, even when the consumer
+    switches to other tasks or threads between steps. This is useful for
+    streaming renderers, which generate content after the view function has
+    returned.
+    """
+    ctx = copy_context()
+    ctx.run(_context.set, MappingProxyType({**_context.get(), **values}))
+    iterator = iter(iterable)
+    sentinel = object()
+    while True:
+        item = ctx.run(next, iterator, sentinel)
+        if item is sentinel:
+            return
+        yield item
@@ -1,52 +1,120 @@
+import hashlib
+import os
+import re
+from functools import lru_cache
+
 import hyperpython as hp
 from hyperpython import *  # noqa: F403
 
 # TODO: this is a work in progress.
 # See more: https://jenil.github.io/chota/
+from hyperpython.assets import AssetManifest
 from hyperpython.core import Blob
 
 CHOTA_CSS = hp.link(rel="stylesheet", href="//unpkg.com/chota@latest")
-ROOT_CSS = """
-:root {{
-  --color-primary: {color_primary};
-  --color-lightGrey: {color_light_grey};
-  --color-grey: {color_grey};
-  --color-darkGrey: {color_dark_grey};
-  --color-error: {color_error};
-  --color-success: {color_success};
-  --grid-maxWidth: {grid_max_width};
-  --grid-gutter: {grid_gutter};
-  --font-size: {font_size};
-  --font-family: {font_family};
-}}
-"""
+CDN = AssetManifest({"chota": {"url": CHOTA_CSS.attrs["href"], "type": "css"}})
+THEME_PROPERTIES = {
+    "color_primary": "--color-primary",
+    "color_light_grey": "--color-lightGrey",
+    "color_grey": "--color-grey",
+    "color_dark_grey": "--color-darkGrey",
+    "color_error": "--color-error",
+    "color_success": "--color-success",
+    "grid_max_width": "--grid-maxWidth",
+    "grid_gutter": "--grid-gutter",
+    "font_size": "--font-size",
+    "font_family": "--font-family",
+}
+INVALID_CSS_VALUE = re.compile(r"[;{}<>\\]|/\*")
+
+
+def theme_css(**kwargs):
+    """
+    Return CSS that sets the chota custom properties for the given options.
+
+    Valid options are the keys of THEME_PROPERTIES. Properties are always
+    emitted in the same order, so equivalent option sets produce the same CSS.
+
+    Examples:
+        >>> print(theme_css(font_size='18px', color_primary='#14854F'))
+        :root {
+          --color-primary: #14854F;
+          --font-size: 18px;
+        }
+    """
+    return _theme_css(_theme_key(kwargs))
 
 
 def options(**kwargs):
-    lines = [":root {"]
-    properties = {
-        "color_primary": "--color-primary",
-        "color_light_grey": "--color-lightGrey",
-        "color_grey": "--color-grey",
-        "color_dark_grey": "--color-darkGrey",
-        "color_error": "--color-error",
-        "color_success": "--color-success",
-        "grid_max_width": "--grid-maxWidth",
-        "grid_gutter": "--grid-gutter",
-        "font_size": "--font-size",
-        "font_family": "--font-family",
-    }
-    for k, v in kwargs.items():
-        lines.append(f"  {properties[k]}: {v}")
+    """
+    Return a <style> tag that customizes chota with the given options.
+
+    The tag is built only once for each set of options and each call returns
+    a copy of it.
+    """
+    return _theme_style(_theme_key(kwargs)).copy()
 
-    return hp.style(Blob("\n".join(lines)))
 
+def write_css(directory, name="chota-theme", **kwargs):
+    """
+    Write theme CSS to a file named after a hash of its content and return
+    the file name.
 
-def cdn(**kwargs):
+    Since the name changes whenever the theme changes, the file can be served
+    with long-lived cache headers. The file is not rewritten if it already
+    exists.
+    """
+    css = theme_css(**kwargs)
+    digest = hashlib.blake2b(css.encode("utf8"), digest_size=8).hexdigest()
+    filename = f"{name}.{digest}.css"
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf8") as fd:
+            fd.write(css)
+        os.replace(tmp, path)
+    return filename
+
+
+def cdn(static_dir=None, static_url="/static/", **kwargs):
     """
     Provides basic imports from a CDN for chota.css.
+
+    Theme options (see :func:`options`) are inlined in a <style> tag, unless
+    static_dir is given. In that case, the theme is saved to a content-hashed
+    file in static_dir (see :func:`write_css`) and linked from static_url.
     """
-    return hp.Block([CHOTA_CSS, options(**kwargs)])
+    imports = [*CDN.render("chota").children]
+    if kwargs:
+        if static_dir is None:
+            imports.append(options(**kwargs))
+        else:
+            filename = write_css(static_dir, **kwargs)
+            imports.append(hp.link(rel="stylesheet", href=static_url + filename))
+    return hp.Block(imports)
+
+
+def _theme_key(kwargs):
+    for name, value in kwargs.items():
+        if name not in THEME_PROPERTIES:
+            raise TypeError(f"invalid chota option: {name}")
+        if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+            raise TypeError(f"invalid value for {name}: {value!r}")
+        if INVALID_CSS_VALUE.search(str(value)):
+            raise ValueError(f"invalid value for {name}: {value!r}")
+    return tuple((k, str(kwargs[k])) for k in THEME_PROPERTIES if k in kwargs)
+
+
+@lru_cache(maxsize=64)
+def _theme_css(key):
+    lines = [f"  {THEME_PROPERTIES[k]}: {v};" for k, v in key]
+    return "\n".join([":root {", *lines, "}"])
+
+
+@lru_cache(maxsize=64)
+def _theme_style(key):
+    return hp.style(Blob(_theme_css(key)))
 
 
 #
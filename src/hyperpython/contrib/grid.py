@@ -0,0 +1,166 @@
+"""
+Grid layouts rendered directly from tabular data.
+
+Used by the grid builders of CSS frameworks such as Milligram and Skeleton.
+"""
+from hyperpython.core import BaseElement, Block
+from hyperpython.html import html, render
+from hyperpython.tags import div
+from hyperpython.utils import escape
+from hyperpython.utils.descriptors import lazy
+
+
+class Grid(BaseElement):
+    """
+    A grid of rows and cells built from a 2D data source.
+
+    Each item in a row is converted to HTML by the cell function and wrapped
+    in a <div> with the corresponding column classes. Tags for rows and
+    columns are computed once per grid and not for each cell, and no
+    intermediate elements are created.
+
+    The grid is rendered in batches of rows. When used with
+    :func:`hyperpython.renderers.iter_render` (e.g., in streaming responses),
+    each batch is sent as soon as it is ready.
+
+    Tools that inspect the structure of a tree, such as
+    :mod:`hyperpython.hyperjson`, :mod:`hyperpython.diff` and
+    :class:`hyperpython.TreeIndex`, see the equivalent tree of <div>
+    elements. It is built on first use and stored in the grid.
+
+    Args:
+        rows:
+            An iterable of rows. Each row is an iterable of items. If rows is
+            an iterator, the grid can be rendered only once.
+        cell:
+            Function that converts each item to a Hyperpython object. Items
+            are rendered with :func:`hyperpython.render` by default.
+        row_class:
+            Classes of each row.
+        column_class:
+            Classes of each cell. It can be a string, a sequence with the
+            classes of each column (the last value is reused for extra
+            columns) or a function that receives the number of cells in a row
+            and return such sequence.
+        container_class:
+            If given, wrap grid in a <div> with the given classes.
+        batch_size:
+            Number of rows rendered at once.
+
+    Examples:
+        >>> grid = Grid([[1, 2], [3]], row_class='row', column_class='cell')
+        >>> print(grid)
+        <div class="row"><div class="cell">1</div><div class="cell">2</div></div><div class="row"><div class="cell">3</div></div>
+    """
+
+    def __init__(
+        self,
+        rows,
+        cell=None,
+        *,
+        row_class="row",
+        column_class="column",
+        container_class=None,
+        batch_size=64,
+    ):
+        self.rows = rows
+        self.cell = cell
+        self.row_class = row_class
+        self.column_class = column_class
+        self.container_class = container_class
+        self.batch_size = batch_size
+        self._row_open = _open_tag(row_class)
+        self._column_tags = {}
+
+    def __repr__(self):
+        return f"Grid({self.rows!r}, row_class={self.row_class!r}, column_class={self.column_class!r})"
+
+    def iter_chunks(self):
+        """
+        Iterate over strings of HTML, each with at most batch_size rows.
+        """
+        batch = []
+        append = batch.append
+        row_open = self._row_open
+        columns_for = self._columns_for
+        cell = self.cell
+        size = 0
+
+        if self.container_class is not None:
+            append(_open_tag(self.container_class))
+        for row in self.rows:
+            if not isinstance(row, (list, tuple)):
+                row = list(row)
+            append(row_open)
+            for col, item in zip(columns_for(len(row)), row):
+                append(col)
+                append(render(item if cell is None else cell(item)))
+                append("</div>")
+            append("</div>")
+            size += 1
+            if size >= self.batch_size:
+                yield "".join(batch)
+                batch.clear()
+                size = 0
+        if self.container_class is not None:
+            append("</div>")
+        if batch:
+            yield "".join(batch)
+
+    def dump(self, file):
+        write = file.write
+        for chunk in self.iter_chunks():
+            write(chunk)
+
+    def json(self):
+        return self._tree.json()
+
+    def copy(self):
+        return Grid(
+            self.rows,
+            self.cell,
+            row_class=self.row_class,
+            column_class=self.column_class,
+            container_class=self.container_class,
+            batch_size=self.batch_size,
+        )
+
+    @lazy
+    def _tree(self):
+        cell = self.cell
+        rows = []
+        for row in self.rows:
+            if not isinstance(row, (list, tuple)):
+                row = list(row)
+            cells = [
+                div(html(item if cell is None else cell(item)), class_=cls)
+                for cls, item in zip(self._column_classes(len(row)), row)
+            ]
+            rows.append(div(cells, class_=self.row_class))
+        if self.container_class is None:
+            return Block(rows)
+        return div(rows, class_=self.container_class)
+
+    def _columns_for(self, n):
+        try:
+            return self._column_tags[n]
+        except KeyError:
+            pass
+        tags = self._column_tags[n] = list(map(_open_tag, self._column_classes(n)))
+        return tags
+
+    def _column_classes(self, n):
+        classes = self.column_class
+        if callable(classes):
+            classes = classes(n)
+        if isinstance(classes, str):
+            return [classes] * n
+        classes = list(classes)
+        classes.extend(classes[-1:] * (n - len(classes)))
+        return classes[:n]
+
+
+def _open_tag(classes):
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+    return f'<div class="{escape(classes)}">' if classes else "<div>"
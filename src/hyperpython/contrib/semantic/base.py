@@ -1,4 +1,6 @@
-from functools import wraps
+from functools import lru_cache, wraps
+
+from hyperpython.helpers import classes as _classes
 
 
 def extract_classes(flags):
@@ -6,8 +8,17 @@ def extract_classes(flags):
     Create a function that receives a dictionary of keyword arguments and
     extract classes from it.
 
-    Function invocation changes the dictionary inplace.
+    Flags with a true value are returned as a tuple of class names, in the
+    order they were declared in flags. Function invocation changes the
+    dictionary inplace.
+
+    Examples:
+        >>> extractor = extract_classes(['primary', 'basic', 'huge'])
+        >>> kwargs = {'huge': True, 'primary': True, 'basic': False, 'id': 'x'}
+        >>> extractor(kwargs), kwargs
+        (('primary', 'huge'), {'id': 'x'})
     """
+    index = {flag: i for i, flag in enumerate(flags)}
     flags = set(flags)
 
     def extractor(kwargs):
@@ -16,22 +27,54 @@ def extract_classes(flags):
 
         common = flags.intersection(kwargs)
         if common:
-            return [kwargs.pop(k) for k in common]
+            active = [k for k in common if kwargs.pop(k)]
+            return tuple(sorted(active, key=index.__getitem__))
         else:
             return ()
 
     return extractor
 
 
-def component(function=None, flags=(), prefix_classes=None, suffix_classes=None):
+def component(
+    function=None,
+    flags=(),
+    prefix_classes=None,
+    suffix_classes=None,
+    compiled=False,
+    maxsize=256,
+):
     """
     Basic component builder.
+
+    Args:
+        function:
+            Factory function that creates the element.
+        flags:
+            Names of boolean keyword arguments that are converted to classes.
+        prefix_classes, suffix_classes:
+            Classes added before and after the other classes of the element.
+        compiled:
+            If True, the class list for each combination of flags is computed
+            once and cached (keeping at most maxsize combinations). The
+            element is created with its final class attribute, instead of
+            being modified after creation.
+
+    Examples:
+        >>> btn = component(button, ['primary', 'big'], ['ui'], ['button'], compiled=True)
+        >>> print(btn('Ok', big=True, primary=True, class_='submit'))
+        <button class="ui submit primary big button">Ok</button>
     """
 
     if function is None:
-        return lambda func: component(func, flags, prefix_classes)
+        return lambda func: component(
+            func, flags, prefix_classes, suffix_classes, compiled, maxsize
+        )
 
     extractor = extract_classes(flags)
+    if compiled:
+        return _compiled_component(
+            function, extractor, prefix_classes, suffix_classes, maxsize
+        )
 
     @wraps(function)
     def method(*args, **kwargs):
@@ -47,6 +90,26 @@ def component(function=None, flags=(), prefix_classes=None, suffix_classes=None)
     return method
 
 
+def _compiled_component(function, extractor, prefix_classes, suffix_classes, maxsize):
+    prefix = tuple(_classes(prefix_classes))
+    suffix = tuple(_classes(suffix_classes))
+
+    @lru_cache(maxsize)
+    def class_table(active):
+        return tuple(dict.fromkeys((*prefix, *active, *suffix)))
+
+    @wraps(function)
+    def method(*args, class_=None, **kwargs):
+        classes = class_table(extractor(kwargs))
+        if class_ is not None:
+            extra = tuple(_classes(class_))
+            classes = tuple(dict.fromkeys((*prefix, *extra, *classes)))
+        return function(*args, class_=classes, **kwargs)
+
+    method.class_table = class_table
+    return method
+
+
 def ui(elem):
     """
     Adds the ui class to the list of classes of element.
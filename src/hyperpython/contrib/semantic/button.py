@@ -58,6 +58,7 @@ button = component(
     ],
     prefix_classes=["ui"],
     suffix_classes=["button"],
+    compiled=True,
 )
 
 
@@ -1,4 +1,7 @@
-import hyperpython as hp
+import warnings
+from functools import lru_cache
+
+from hyperpython.assets import AssetManifest
 
 prefix = "//cdnjs.cloudflare.com/ajax/libs/semantic-ui"
 version = "2.4.1"
@@ -56,72 +59,99 @@ js_components = {"api", "visibility"}
 all_components = {*full_components, *css_components, *js_components}
 
 
+THEME_FONTS = {
+    "basic": {"icons": ["eot", "svg", "ttf", "woff"]},
+    "default": {
+        "brand-icons": ["eot", "svg", "ttf", "woff", "woff2"],
+        "icons": ["eot", "otf", "svg", "ttf", "woff", "woff2"],
+        "outline-icons": ["eot", "svg", "ttf", "woff", "woff2"],
+    },
+    "github": {"octicons-local": ["ttf"], "octicons": ["svg", "ttf", "woff"]},
+    "material": {"icons": ["eot", "svg", "ttf", "woff", "woff2"]},
+}
+
+# Loaded first, since the other stylesheets build on them
+BASE_COMPONENTS = ("reset", "site")
+
+
 def cdn(components=None, exclude=None):
     """
     Return the default imports from Cloudflare CDN.
+
+    Args:
+        components:
+            List of components to import. Imports the full Semantic UI bundle
+            if not given.
+        exclude:
+            List of components that should not be imported. When no
+            components are given, imports all components except the excluded
+            ones.
     """
-    return hp.Block(cdn_link("all"))
+    exclude = set(exclude or ())
+    if components is None:
+        if not exclude:
+            return _manifest().render("all")
+        components = all_components
+    components = [c for c in components if c not in exclude]
+    base = [c for c in BASE_COMPONENTS if c in components]
+    rest = sorted(c for c in set(components) if c not in BASE_COMPONENTS)
+    return _manifest().render(*base, *rest)
 
 
-def cdn_link(which=None, prefix=prefix, version=version, minify=True):
-    path = f"{which}.min" if minify else which
-    if which == "all":
-        src = f"{prefix}/{version}/semantic"
-        return [
-            hp.script(src=src + ".js"),
-            hp.link(rel="stylesheet", href=src + ".css"),
-        ]
-    elif which in css_components:
-        src = f"{prefix}/{version}/components/{path}.css"
-        return [hp.link(rel="stylesheet", href=src)]
-    elif which in js_components:
-        src = f"{prefix}/{version}/components/{path}.js"
-        return [hp.script(src=src)]
-    elif which in full_components:
-        src = f"{prefix}/{version}/components/{path}"
-        return [
-            hp.script(src=src + ".js"),
-            hp.link(rel="stylesheet", href=src + ".css"),
-        ]
-    elif which == "theme-basic":
-        return [
-            cdn_font(prefix, version, "basic", "icons", ext)
-            for ext in ["eot", "svg", "ttf", "woff"]
-        ]
-    elif which == "theme-default":
-        return [
-            *(
-                cdn_font(prefix, version, "default", "brand-icons", ext)
-                for ext in ["eot", "svg", "ttf", "woff", "woff2"]
-            ),
-            *(
-                cdn_font(prefix, version, "default", "icons", ext)
-                for ext in ["eot", "otf", "svg", "ttf", "woff", "woff2"]
-            ),
-            *(
-                cdn_font(prefix, version, "default", "outline-icons", ext)
-                for ext in ["eot", "svg", "ttf", "woff", "woff2"]
-            )
-            # ../themes/default/assets/images/flags.png ?
-        ]
+def manifest(prefix=prefix, version=version, minify=True):
+    """
+    Return an :class:`hyperpython.assets.AssetManifest` with all Semantic UI
+    components and themes in the given CDN.
 
-    elif which == "theme-github":
-        return [
-            cdn_font(prefix, version, "github", "octicons-local", "ttf"),
-            *(
-                cdn_font(prefix, version, "github", "octicons", ext)
-                for ext in ["svg", "ttf", "woff"]
-            ),
-        ]
-    elif which == "theme-material":
-        return [
-            cdn_font(prefix, version, "material", "icons", ext)
-            for ext in ["eot", "svg", "ttf", "woff", "woff2"]
+    Each call returns a new copy that can be safely modified (e.g., with
+    :meth:`hyperpython.assets.AssetManifest.add_integrity`).
+    """
+    return _manifest(prefix, version, minify).copy()
+
+
+@lru_cache(maxsize=8)
+def _manifest(prefix=prefix, version=version, minify=True):
+    # Shared by cdn() and cdn_link(), which never modify it.
+    ext = ".min" if minify else ""
+    root = f"{prefix}/{version}"
+    assets = {"all": [f"{root}/semantic{ext}.js", f"{root}/semantic{ext}.css"]}
+    for name in css_components:
+        assets[name] = f"{root}/components/{name}{ext}.css"
+    for name in js_components:
+        assets[name] = f"{root}/components/{name}{ext}.js"
+    for name in full_components:
+        path = f"{root}/components/{name}{ext}"
+        assets[name] = [path + ".js", path + ".css"]
+    for theme, fonts in THEME_FONTS.items():
+        assets[f"theme-{theme}"] = [
+            f"{root}/themes/{theme}/assets/fonts/{font}.{font_ext}"
+            for font, extensions in fonts.items()
+            for font_ext in extensions
         ]
-    else:
-        raise ValueError(f"invalid asset: {which}")
+    return AssetManifest(assets)
+
+
+def cdn_link(which=None, prefix=prefix, version=version, minify=True):
+    """
+    Return a list of elements that import the given component or theme.
+    """
+    return _manifest(prefix, version, minify).elements(which)
 
 
 def cdn_font(prefix, version, theme, which, ext):
-    src = f"{prefix}/{version}/themes/{theme}/assets/fonts/{which}.{ext}"
-    return hp.font(src=src)
+    """
+    Return the tag that loads a single font of a Semantic UI theme.
+
+    .. deprecated::
+        Use ``cdn_link("theme-<name>")`` to load all fonts of a theme.
+    """
+    warnings.warn(
+        "cdn_font() is deprecated, use cdn_link('theme-<name>') instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    url = f"{prefix}/{version}/themes/{theme}/assets/fonts/{which}.{ext}"
+    for elem in _manifest(prefix, version).elements(f"theme-{theme}"):
+        if elem.attrs["href"] == url:
+            return elem
+    raise ValueError(f"invalid font: {theme}/{which}.{ext}")
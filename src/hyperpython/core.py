@@ -4,12 +4,14 @@ import json
 from collections.abc import Sequence
 
 from markupsafe import Markup
-from sidekick import lazy, delegate_to
+from sidekick import delegate_to
 from types import MappingProxyType
 
+from . import profiling as _profiling
 from .helpers import classes
-from .renderers import dump_attrs, render_pretty
+from .renderers import dump_attrs, dump_minified, render_minified, render_pretty
 from .utils import escape as _escape
+from .utils.descriptors import lazy
 
 # https://www.w3.org/TR/html5/syntax.html#void-elements
 VOID_ELEMENTS = {
@@ -50,7 +52,10 @@ class BaseElement:
         setitem = getattr(self.attrs, "__setitem__", None)
         if setitem is None:
             raise AttributeError("cannot set id of immutable type")
+        old = self.attrs.get("id")
         setitem("id", value)
+        if self._index is not None:
+            self._index._id_changed(self, old)
 
     children = ()
     requires = ()
@@ -58,6 +63,9 @@ class BaseElement:
     is_element = False
     is_void = False
 
+    # TreeIndex the element belongs to (see hyperpython.index)
+    _index = None
+
     def __html__(self):
         return self.render()
 
@@ -70,12 +78,24 @@ class BaseElement:
     def _repr_child(self):
         return self.__repr__()
 
-    def render(self):
+    def render(self, minify=False, collapse_whitespace=False):
         """
         Renders object as string.
+
+        Args:
+            minify (bool):
+                If True, emit the smallest valid HTML5 output: end tags of void
+                elements are omitted, boolean attributes have no values and
+                attribute values are unquoted when it is safe to do so.
+            collapse_whitespace (bool):
+                In minify mode, also collapse whitespace in text nodes outside
+                <pre>, <textarea>, <script> and <style> tags.
         """
         file = io.StringIO()
-        self.dump(file)
+        if minify:
+            dump_minified(self, file, collapse_whitespace)
+        else:
+            self.dump(file)
         return file.getvalue()
 
     def dump(self, file):
@@ -132,7 +152,10 @@ class BaseElement:
         if append is None:
             raise TypeError("cannot change immutable structure")
         else:
-            append(as_child(value))
+            child = as_child(value)
+            append(child)
+            if self._index is not None:
+                self._index._children_added(self, [child])
         return self
 
 
@@ -153,7 +176,10 @@ class Component(BaseElement):
 
     @lazy
     def _tree(self):
-        return self.html()
+        profiler = _profiling.active
+        if profiler is None:
+            return self.html()
+        return profiler.measure("component", type(self).__qualname__, self.html)
 
     def html(self, **kwargs):
         raise NotImplementedError("must be implemented in subclasses")
@@ -193,12 +219,15 @@ class Element(BaseElement):
         if self.is_void:
             raise ValueError("void elements cannot define children")
 
+        size = len(self.children)
         if isinstance(item, SEQUENCE_TYPES):
             self.children.extend(map(as_child, item))
         elif item is None:
             pass
         else:
             self.children.append(as_child(item))
+        if self._index is not None:
+            self._index._children_added(self, self.children[size:])
         return self
 
     def __repr__(self):
@@ -289,6 +318,8 @@ class Element(BaseElement):
             else:
                 class_set = set(old_classes)
                 old_classes.extend(x for x in new_classes if x not in class_set)
+        if self._index is not None:
+            self._index._classes_changed(self)
         return self
 
     def set_class(self, cls=()):
@@ -296,6 +327,8 @@ class Element(BaseElement):
         Replace all current classes by the new ones.
         """
         self.attrs["class"] = list(classes(cls))
+        if self._index is not None:
+            self._index._classes_changed(self)
         return self
 
 
@@ -317,7 +350,9 @@ class Text(str, BaseElement):
     def _repr_child(self):
         return repr(str(self))
 
-    def render(self):
+    def render(self, minify=False, collapse_whitespace=False):
+        if minify and collapse_whitespace:
+            return render_minified(self, collapse_whitespace=True)
         return _escape(self)
 
     def dump(self, file):
@@ -350,7 +385,7 @@ class Blob(Markup, BaseElement):
     def _repr_child(self):
         return repr(self)
 
-    def render(self):
+    def render(self, minify=False, collapse_whitespace=False):
         return self.__html__()
 
     def dump(self, file):
@@ -414,6 +449,10 @@ class Block(BaseElement, Sequence):
     def __len__(self):
         return len(self.children)
 
+    def __repr__(self):
+        data = ", ".join(repr_child(x) for x in self.children)
+        return f"Block([{data}])"
+
     def dump(self, file):
         for child in self.children:
             child.dump(file)
@@ -422,7 +461,7 @@ class Block(BaseElement, Sequence):
         return Block(list(self.children), requires=list(self.requires))
 
     def json(self):
-        return {"body": [x.to_json() for x in self.children]}
+        return {"body": [x.json() for x in self.children]}
 
 
 #
@@ -495,11 +534,11 @@ class Tag:
         try:
             h = self._h_function
         except AttributeError:
+            # hyperpython.tags sets Tag._h_function when it is imported
             from .tags import h
-            Tag._h_function = h
         return h(self.tag, *args, **kwargs)
 
     def __getitem__(self, item):
-        return self._h_function(self.tag)[item]
+        return self()[item]
 
 
@@ -0,0 +1,370 @@
+"""
+Compute minimal patches between two Hyperpython trees.
+
+:func:`diff` returns a list of JSON-serializable operations. Each operation is
+a list whose first item is the operation name and second item is the path of
+the target node, given as a list of child indexes starting from the root:
+
+    ["attr", path, name, value]
+        Set attribute. Class is always given as a list of strings.
+    ["unattr", path, name]
+        Remove attribute.
+    ["text", path, value]
+        Replace the text node at path.
+    ["replace", path, node]
+        Replace node at path by the given HyperJSON node.
+    ["insert", path, index, node]
+        Insert HyperJSON node as the child at the given index.
+    ["remove", path, index]
+        Remove child at index.
+    ["move", path, from, to]
+        Remove child at index ``from`` and re-insert it at index ``to``.
+
+Operations must be applied in order: indexes always refer to the state of
+the tree after applying the previous operations.
+"""
+import json
+
+from .core import Text, Blob, Block, Json, as_child
+from .hyperjson import to_data, from_data, _skip_attr, _attr_value
+from .utils.cache import freeze
+
+
+def diff(old, new):
+    """
+    Return a list of patch operations that transform the old tree into the
+    new one.
+
+    Subtrees with the same structural hash are skipped without being visited.
+    Children of elements are matched by their "key" attributes when all of
+    them define unique keys, and positionally otherwise.
+
+    Examples:
+        >>> diff(ul([li('foo', key=1), li('bar', key=2)]),
+        ...      ul([li('bar', key=2), li('foo!', key=1)]))
+        [['move', [], 1, 0], ['text', [1, 0], 'foo!']]
+    """
+    ops = []
+    _diff(as_child(old), as_child(new), [], ops, {})
+    return ops
+
+
+def patch(tree, ops):
+    """
+    Apply a list of operations produced by :func:`diff` to tree.
+
+    The tree is modified inplace, except when the root node itself is
+    replaced. Return the resulting tree.
+    """
+    for op in ops:
+        kind, path, *args = op
+        try:
+            func = _PATCH_OPS[kind]
+        except KeyError:
+            raise ValueError(f"invalid operation: {kind!r}")
+        tree = func(tree, path, *args)
+    return tree
+
+
+def _replace_at(tree, path, node):
+    if not path:
+        return node
+    _node_at(tree, path[:-1]).children[path[-1]] = node
+    return tree
+
+
+def _set_attr(node, name, value):
+    node.attrs[name] = value
+
+
+def _move_child(node, src, dest):
+    node.children.insert(dest, node.children.pop(src))
+
+
+def _at_node(func):
+    def op(tree, path, *args):
+        func(_node_at(tree, path), *args)
+        return tree
+
+    return op
+
+
+_PATCH_OPS = {
+    "text": lambda tree, path, value: _replace_at(tree, path, Text(value)),
+    "replace": lambda tree, path, data: _replace_at(tree, path, from_data(data)),
+    "attr": _at_node(_set_attr),
+    "unattr": _at_node(lambda node, name: node.attrs.__delitem__(name)),
+    "insert": _at_node(lambda node, idx, data: node.children.insert(idx, from_data(data))),
+    "remove": _at_node(lambda node, idx: node.children.__delitem__(idx)),
+    "move": _at_node(_move_child),
+}
+
+
+def structural_hash(node, memo=None):
+    """
+    Hash of the tree structure: tag, attributes, children and text content.
+
+    Two trees that render to the same HTML have the same hash. Hashes are
+    computed with Python's hash() and thus are not stable across different
+    processes.
+
+    Args:
+        node:
+            Root of the tree.
+        memo:
+            An optional dictionary mapping ids of nodes to their hashes. The
+            caller must keep all nodes alive while the memo is in use.
+    """
+    node = _unwrap(as_child(node))
+    if memo is None:
+        memo = {}
+    return _hash(node, memo)
+
+
+#
+# Hashing
+#
+def _hash(node, memo):
+    key = id(node)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+
+    if node.is_element:
+        attrs = tuple(sorted((k, freeze(v)) for k, v in node.attrs.items()))
+        children = tuple(_hash(_unwrap(x), memo) for x in node.children)
+        value = hash(("e", node.tag, attrs, children))
+    elif isinstance(node, Text):
+        value = hash(("t", str(node)))
+    elif isinstance(node, Blob):
+        value = hash(("r", str(node)))
+    elif isinstance(node, Json):
+        value = hash(("j", json.dumps(node.data, sort_keys=True)))
+    elif isinstance(node, Block):
+        value = hash(("b", tuple(_hash(_unwrap(x), memo) for x in node.children)))
+    else:
+        value = hash(("x", str(node)))
+
+    memo[key] = value
+    return value
+
+
+def _node_at(tree, path):
+    node = _unwrap(tree)
+    for idx in path:
+        node = _unwrap(node.children[idx])
+    return node
+
+
+def _unwrap(node):
+    tree = getattr(node, "_tree", None)
+    return node if tree is None else _unwrap(tree)
+
+
+#
+# Diff
+#
+def _diff(old, new, path, ops, memo):
+    old, new = _unwrap(old), _unwrap(new)
+    if old is new or _hash(old, memo) == _hash(new, memo):
+        return
+
+    if old.is_element and new.is_element:
+        if old.tag == new.tag and old.is_void == new.is_void:
+            _diff_attrs(old.attrs, new.attrs, path, ops)
+            _diff_children(old.children, new.children, path, ops, memo)
+            return
+    elif type(old) is Text and type(new) is Text:
+        ops.append(["text", path, str(new)])
+        return
+    elif isinstance(old, Block) and isinstance(new, Block):
+        _diff_children(old.children, new.children, path, ops, memo)
+        return
+    ops.append(["replace", path, to_data(new)])
+
+
+def _diff_attrs(old, new, path, ops):
+    old = _json_attrs(old)
+    for name, value in _json_attrs(new).items():
+        if old.pop(name, _missing) != value:
+            ops.append(["attr", path, name, value])
+    for name in old:
+        ops.append(["unattr", path, name])
+
+
+def _json_attrs(attrs):
+    return {
+        name: _attr_value(name, value)
+        for name, value in attrs.items()
+        if not _skip_attr(name, value)
+    }
+
+
+def _diff_children(old, new, path, ops, memo):
+    old_keys = _keys(old)
+    new_keys = old_keys and _keys(new)
+    if new_keys:
+        _diff_keyed(old, new, old_keys, new_keys, path, ops, memo)
+        return
+
+    size = min(len(old), len(new))
+    for i in range(size):
+        _diff(old[i], new[i], [*path, i], ops, memo)
+    for i in range(len(old) - 1, size - 1, -1):
+        ops.append(["remove", path, i])
+    for i in range(size, len(new)):
+        ops.append(["insert", path, i, to_data(new[i])])
+
+
+def _diff_keyed(old, new, old_keys, new_keys, path, ops, memo):
+    current = _remove_missing(old_keys, set(new_keys), path, ops)
+    position = {k: i for i, k in enumerate(current)}
+    _reorder(current, position, new, new_keys, path, ops)
+
+    old_map = dict(zip(old_keys, old))
+    for i, key in enumerate(new_keys):
+        if key in position:
+            _diff(old_map[key], new[i], [*path, i], ops, memo)
+
+
+def _remove_missing(old_keys, new_set, path, ops):
+    """
+    Remove children whose keys are not present in the new list and return
+    the list of remaining keys.
+    """
+    current = []
+    for i in range(len(old_keys) - 1, -1, -1):
+        if old_keys[i] in new_set:
+            current.append(old_keys[i])
+        else:
+            ops.append(["remove", path, i])
+    current.reverse()
+    return current
+
+
+def _reorder(current, position, new, new_keys, path, ops):
+    """
+    Move and insert children to match the order of new keys.
+
+    Children in the longest increasing sequence of old positions stay in
+    place. Other children are moved or inserted right before the next child
+    in the new order, going from right to left.
+
+    Each child is given a sort key that is consistent with its place in the
+    list of children both before and after it is moved, hence the current
+    index of any child is the number of children present with a smaller sort
+    key. Those counts are kept in a Fenwick tree, which makes this
+    O(n log n).
+    """
+    stable = _longest_increasing(
+        [k for k in new_keys if k in position], position.__getitem__
+    )
+
+    # Sort keys: (old position, 1, 0) for old children and (anchor, 0, i) for
+    # children placed before the old position of the next stable child.
+    anchor = len(current)
+    targets = {}
+    for i in range(len(new_keys) - 1, -1, -1):
+        key = new_keys[i]
+        if key in stable:
+            anchor = position[key]
+        else:
+            targets[i] = (anchor, 0, i)
+    sort_keys = [(i, 1, 0) for i in range(len(current))]
+    rank = {k: r for r, k in enumerate(sorted([*sort_keys, *targets.values()]))}
+    counts = _Fenwick(len(rank))
+    for k in sort_keys:
+        counts.add(rank[k], 1)
+
+    for i in range(len(new_keys) - 1, -1, -1):
+        if i not in targets:
+            continue
+        key = new_keys[i]
+        target = rank[targets[i]]
+        if key in position:
+            source = rank[(position[key], 1, 0)]
+            src = counts.prefix(source)
+            counts.add(source, -1)
+            ops.append(["move", path, src, counts.prefix(target)])
+        else:
+            ops.append(["insert", path, counts.prefix(target), to_data(new[i])])
+        counts.add(target, 1)
+
+
+class _Fenwick:
+    """
+    Fenwick tree with prefix sums of counts.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, size):
+        self.data = [0] * (size + 1)
+
+    def add(self, idx, delta):
+        data = self.data
+        idx += 1
+        while idx < len(data):
+            data[idx] += delta
+            idx += idx & -idx
+
+    def prefix(self, idx):
+        """
+        Sum of counts with index smaller than idx.
+        """
+        data = self.data
+        total = 0
+        while idx > 0:
+            total += data[idx]
+            idx -= idx & -idx
+        return total
+
+
+def _keys(children):
+    keys = []
+    for child in children:
+        child = _unwrap(child)
+        if not child.is_element or "key" not in child.attrs:
+            return None
+        keys.append(child.attrs["key"])
+    try:
+        unique = len(set(keys)) == len(keys)
+    except TypeError:
+        return None
+    return keys if unique else None
+
+
+def _longest_increasing(seq, key):
+    """
+    Return the set of items in the longest increasing subsequence of seq.
+    """
+    tails = []
+    tail_idx = []
+    parent = [None] * len(seq)
+    for i, item in enumerate(seq):
+        value = key(item)
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(value)
+            tail_idx.append(i)
+        else:
+            tails[lo] = value
+            tail_idx[lo] = i
+        parent[i] = tail_idx[lo - 1] if lo else None
+
+    result = set()
+    i = tail_idx[-1] if tail_idx else None
+    while i is not None:
+        result.add(seq[i])
+        i = parent[i]
+    return result
+
+
+_missing = object()
@@ -1 +1,2 @@
 from .components import csrf_input
+from .response import HyperpythonStreamingResponse, stream, tree_etag
@@ -3,5 +3,8 @@ from sidekick import record
 
 
 @pytest.fixture(autouse=True)
-def add_django_ns(doctest_namespace):
+def add_django_ns(doctest_namespace, monkeypatch):
+    from hyperpython.django import components
+
+    monkeypatch.setattr(components, "get_token", lambda request: "csrf-token-value")
     doctest_namespace.update(request=record())
@@ -0,0 +1,107 @@
+import hashlib
+
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+
+from .. import hyperjson
+from ..context import iter_in_context, render_context
+from ..core import as_child
+from ..renderers.stream import iter_render
+
+
+class HyperpythonStreamingResponse(StreamingHttpResponse):
+    """
+    A streaming response that renders a Hyperpython tree incrementally.
+
+    The <head> section is flushed as soon as it is rendered, so browsers can
+    start fetching assets before the rest of the page is produced.
+
+    Args:
+        content:
+            An Element, Component or any Hyperpython object.
+        chunk_size:
+            Approximate size of each chunk sent to the client.
+        doctype:
+            If True (default), prepend "<!DOCTYPE html>" to the output when
+            the root element is an <html> tag.
+        request:
+            If given, the request is available in the render context (see
+            :mod:`hyperpython.context`) while the tree is rendered.
+
+    Additional keyword arguments are passed to StreamingHttpResponse.
+    """
+
+    def __init__(
+        self,
+        content,
+        chunk_size=8192,
+        doctype=True,
+        request=None,
+        content_type="text/html; charset=utf-8",
+        **kwargs,
+    ):
+        content = as_child(content)
+        chunks = _iter_document(content, chunk_size, doctype)
+        if request is not None:
+            chunks = iter_in_context(chunks, request=request)
+        super().__init__(chunks, content_type=content_type, **kwargs)
+        self.tree = content
+
+
+def stream(request, content, etag=False, **kwargs):
+    """
+    Return a streaming response for the given Hyperpython tree.
+
+    Args:
+        request:
+            The current request.
+        content:
+            An Element, Component or any Hyperpython object.
+        etag:
+            If True, compute an ETag from the structure of the tree and
+            answer conditional GET requests with a "304 Not Modified" response
+            when the tree did not change. The tree is hashed, but not rendered.
+            It can also be a string with a precomputed ETag.
+
+    Additional keyword arguments are passed to
+    :class:`HyperpythonStreamingResponse`.
+    """
+    if etag:
+        if etag is True:
+            with render_context(request=request):
+                etag = tree_etag(content)
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
+
+    response = HyperpythonStreamingResponse(content, request=request, **kwargs)
+    if etag:
+        response["ETag"] = etag
+    return response
+
+
+def tree_etag(tree):
+    """
+    Return a quoted ETag computed from a stable hash of the tree structure.
+
+    The hash is computed from the tree HyperJSON representation and thus is the
+    same across different processes and servers.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hyperjson.dump(tree, _HashWriter(hasher.update))
+    return f'"{hasher.hexdigest()}"'
+
+
+class _HashWriter:
+    __slots__ = ("write",)
+
+    def __init__(self, write):
+        self.write = write
+
+
+def _iter_document(content, chunk_size, doctype):
+    # Components only build their trees when the response is consumed
+    chunks = iter_render(content, chunk_size)
+    if doctype and content.tag == "html":
+        yield "<!DOCTYPE html>" + next(chunks, "")
+    yield from chunks
@@ -1,11 +1,17 @@
 import re
-from collections import OrderedDict
+import threading
 
+from . import profiling as _profiling
 from .core import BaseElement
 
 identity = lambda x: x
-FRAGMENT_REGISTRY = OrderedDict()
+
+# Registries are copy-on-write snapshots: register() builds a new dictionary
+# and swaps it under _registry_lock, so lookups never need a lock. Do not
+# mutate them inplace.
+FRAGMENT_REGISTRY = {}
 SIMPLE_PATH_REGISTRY = {}
+_registry_lock = threading.Lock()
 PATH_REGEX = re.compile(r"<[a-zA-Z]\w*(?::[a-zA-Z]\w*)?>")
 KIND_REGEX_MAP = {
     "str": r".+",
@@ -28,6 +34,13 @@ def fragment(path, **kwargs):
         >>> fragment('page.header', user='me!')                  # doctest: +SKIP
         h('header', ['Hello me!'])
     """
+    profiler = _profiling.active
+    if profiler is not None:
+        return profiler.measure("fragment", path, _fragment, path, kwargs)
+    return _fragment(path, kwargs)
+
+
+def _fragment(path, kwargs):
     try:
         func = SIMPLE_PATH_REGISTRY[path]
     except KeyError:
@@ -62,10 +75,15 @@ def register(path):
     """
 
     def decorator(func):
+        global FRAGMENT_REGISTRY, SIMPLE_PATH_REGISTRY
+
         if "<" in path or ">" in path:
-            FRAGMENT_REGISTRY[make_validator(path)] = func
+            validator = make_validator(path)
+            with _registry_lock:
+                FRAGMENT_REGISTRY = {**FRAGMENT_REGISTRY, validator: func}
         else:
-            SIMPLE_PATH_REGISTRY[path] = func
+            with _registry_lock:
+                SIMPLE_PATH_REGISTRY = {**SIMPLE_PATH_REGISTRY, path: func}
         return func
 
     return decorator
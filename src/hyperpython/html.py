@@ -3,7 +3,9 @@ from functools import wraps
 from markupsafe import Markup
 from sidekick import import_later, Proxy
 
+from .context import context_value
 from .core import Text, Element, Block, Blob
+from .utils.cache import LRUCache, freeze
 from .utils.role_dispatch import role_singledispatch, error
 
 django_loader = import_later("django.template.loader")
@@ -58,7 +60,9 @@ def html(obj, role=None, **kwargs):
 #
 # Auxiliary functions
 #
-def register_template(cls, template, role=None):
+def register_template(
+    cls, template, role=None, *, cache_key=None, ttl=None, maxsize=128, cache=None
+):
     """
     Decorator that registers a template-based renderer.
 
@@ -71,6 +75,22 @@ def register_template(cls, template, role=None):
             Template name or list of template names.
         role:
             Optional role for the template.
+        cache_key:
+            Enable caching of rendered output. It is a function that receives
+            the context dictionary and return a hashable key (or None, to skip
+            the cache for that context). If True, uses the whole context as
+            key and skips the cache when rendering with a request, since
+            context processors make the output depend on it. Custom functions
+            must include any request-dependent value used by the template in
+            the key. Contexts with unhashable keys are not cached.
+        ttl:
+            Time (in seconds) rendered output is kept in the cache.
+        maxsize:
+            Maximum number of cached outputs.
+        cache:
+            An existing :class:`hyperpython.utils.cache.LRUCache` instance.
+            Can be used to share a single cache between several roles or
+            templates. If given, ttl and maxsize are ignored.
 
     Examples:
         The decorated function must receive an instance of `cls` as first
@@ -96,23 +116,107 @@ def register_template(cls, template, role=None):
                 'user': user,
                 'role': role,
             }
+
+        Output can be cached when it depends only on a few context values:
+
+        @render.register_template(User, 'users/badge.html', 'badge',
+                                  cache_key=lambda ctx: ctx['user'].pk, ttl=60)
+        def user_badge(user, **kwargs):
+            return {'user': user}
+
+    When the context dictionary has no "request", the request is taken from
+    the render context (see :mod:`hyperpython.context`).
+
+    The decorated renderer has a ``render_many(objs, **kwargs)`` method that
+    renders a sequence of objects into a Block reusing a single template
+    context. The ``cache`` attribute stores the output cache (or None).
     """
+    template_name = template if isinstance(template, str) else tuple(template)
     template = django_loader.get_template(template)
-    renderer = template.render
+    if cache_key is not None and cache is None:
+        cache = LRUCache(maxsize, ttl)
+    get_key = _template_key_function(template_name, role, cache_key)
 
     def decorator(func):
-        @html.register(cls, role)
         def wrapped(obj, **kwargs):
             ctx = func(obj, **kwargs)
-            request = ctx.get("request")
-            data = renderer(context=ctx, request=request)
-            return Blob(data)
-
+            request = ctx.get("request") or context_value("request")
+            render = lambda: Blob(template.render(context=ctx, request=request))
+            return _render_cached(cache, get_key(ctx, request), render)
+
+        def render_many(objs, request=None, **kwargs):
+            if request is not None:
+                kwargs["request"] = request
+            if getattr(template, "template", None) is None:
+                return Block([wrapped(obj, **kwargs) for obj in objs])
+            if request is None:
+                request = context_value("request")
+            return _render_many(template.template, func, objs, request, kwargs, cache, get_key)
+
+        wrapped.cache = cache
+        wrapped.render_many = render_many
+        html.register(cls, role)(wrapped)
         return wrapped
 
     return decorator
 
 
+def _template_key_function(template_name, role, cache_key):
+    """
+    Return a function that computes the cache key of a template context and
+    request, or None when the output should not be cached.
+    """
+    if cache_key is None:
+        return lambda ctx, request: None
+    whole_context = cache_key is True
+    if whole_context:
+        cache_key = freeze
+
+    def get_key(ctx, request):
+        # Context processors (request, user, csrf_token, ...) make the output
+        # depend on the request, which is not part of the context dictionary.
+        if whole_context and request is not None:
+            return None
+        key = cache_key(ctx)
+        if key is None:
+            return None
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return (template_name, role, key)
+
+    return get_key
+
+
+def _render_cached(cache, key, render):
+    if key is None:
+        return render()
+    result = cache.get(key)
+    if result is None:
+        result = render()
+        cache.set(key, result)
+    return result
+
+
+def _render_many(engine_template, func, objs, request, kwargs, cache, get_key):
+    # Push each context in a single Context object instead of creating and
+    # populating a new one for each object.
+    from django.template.context import make_context
+
+    context = make_context(None, request, autoescape=engine_template.engine.autoescape)
+    children = []
+    for obj in objs:
+        ctx = func(obj, **kwargs)
+
+        def render():
+            with context.push(ctx):
+                return Blob(engine_template.render(context))
+
+        children.append(_render_cached(cache, get_key(ctx, request), render))
+    return Block(children)
+
+
 html.register_template = register_template
 
 
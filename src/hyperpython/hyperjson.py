@@ -0,0 +1,276 @@
+"""
+HyperJSON serialization.
+
+HyperJSON represents HTML trees as S-expressions (see docs/hyperjson.rst)::
+
+    ["div", {"class": ["foo"]}, [["h1", "Title"], ["p", "Hello world!"]]]
+
+Nodes that are not tags use single-key objects: {"raw": "<b>html</b>"} for
+raw HTML blobs, {"json": data} for Json nodes and {"body": [...]} for
+Blocks.
+"""
+import io
+import json
+from json.encoder import encode_basestring
+
+from .core import Element, Text, Blob, Block, Json, VOID_ELEMENTS, as_child
+
+
+def dumps(obj):
+    """
+    Serialize Hyperpython tree to a HyperJSON string.
+
+    Examples:
+        >>> dumps(div(class_='foo')[h1('Title'), p('Hello world!')])
+        '["div",{"class":["foo"]},[["h1","Title"],["p","Hello world!"]]]'
+    """
+    chunks = []
+    _dump(as_child(obj), chunks.append)
+    return "".join(chunks)
+
+
+def dump(obj, file, encoding="utf8"):
+    """
+    Write HyperJSON data to file.
+
+    File can be a text file, a binary file or a bytearray. Data is written
+    while the tree is traversed, without building intermediate objects.
+    """
+    if isinstance(file, io.TextIOBase):
+        write = file.write
+    else:
+        binary_write = file.extend if isinstance(file, bytearray) else file.write
+        write = lambda data: binary_write(data.encode(encoding))
+    _dump(as_child(obj), write)
+
+
+def loads(data):
+    """
+    Rebuild Hyperpython tree from a HyperJSON string (or bytes).
+
+    Examples:
+        >>> loads('["p", {"class": ["foo"]}, "hello"]')
+        h('p', {'class': ['foo']}, 'hello')
+    """
+    return from_data(json.loads(data))
+
+
+def load(file):
+    """
+    Rebuild Hyperpython tree from HyperJSON data read from file.
+    """
+    return from_data(json.load(file))
+
+
+def to_data(obj):
+    """
+    Convert Hyperpython tree to HyperJSON data (i.e., lists, dicts and
+    strings) that can be passed to json.dumps() or embedded in other
+    JSON-serializable structures.
+
+    Examples:
+        >>> to_data(p(class_='foo')['hello'])
+        ['p', {'class': ['foo']}, 'hello']
+    """
+    node = as_child(obj)
+    return _dispatch(_TO_DATA, node)(node)
+
+
+def from_data(data):
+    """
+    Create Hyperpython tree from decoded HyperJSON data (i.e., lists, dicts
+    and strings).
+    """
+    try:
+        func = _FROM_DATA[type(data)]
+    except KeyError:
+        raise ValueError(f"invalid HyperJSON node: {data!r}")
+    return func(data)
+
+
+def _dispatch(table, node):
+    """
+    Return the function registered for the type of node in table.
+
+    Subclasses use the function of their first registered base class and
+    other objects are converted using their _tree attribute (e.g.,
+    components).
+    """
+    cls = type(node)
+    try:
+        return table[cls]
+    except KeyError:
+        pass
+    for base in cls.__mro__:
+        if base in table:
+            func = table[base]
+            break
+    else:
+        func = table[None]
+    table[cls] = func
+    return func
+
+
+def _tree_of(node):
+    tree = getattr(node, "_tree", None)
+    if tree is None:
+        raise TypeError(f"cannot serialize {type(node).__name__} objects")
+    return tree
+
+
+#
+# Conversion to and from data
+#
+def _element_to_data(node):
+    data = [node.tag]
+    attrs = {
+        name: _attr_value(name, value)
+        for name, value in node.attrs.items()
+        if not _skip_attr(name, value)
+    }
+    if attrs:
+        data.append(attrs)
+    children = node.children
+    if len(children) == 1 and isinstance(children[0], Text):
+        data.append(str(children[0]))
+    elif children:
+        data.append([to_data(child) for child in children])
+    return data
+
+
+_TO_DATA = {
+    Element: _element_to_data,
+    Text: str,
+    Blob: lambda node: {"raw": str(node)},
+    Json: lambda node: {"json": node.data},
+    Block: lambda node: {"body": [to_data(child) for child in node.children]},
+    None: lambda node: to_data(_tree_of(node)),
+}
+
+
+def _element_from_data(data):
+    tag, *args = data
+    attrs = {}
+    children = ()
+    if args and isinstance(args[0], dict):
+        attrs, *args = args
+    if args:
+        children, = args
+        if isinstance(children, str):
+            children = [children]
+    return Element(tag, attrs, list(map(from_data, children)), tag in VOID_ELEMENTS)
+
+
+def _special_from_data(data):
+    if len(data) == 1:
+        (kind, value), = data.items()
+        if kind in _SPECIAL_NODES:
+            return _SPECIAL_NODES[kind](value)
+    raise ValueError(f"invalid HyperJSON node: {data!r}")
+
+
+_SPECIAL_NODES = {
+    "raw": Blob,
+    "json": Json,
+    "body": lambda value: Block(list(map(from_data, value))),
+}
+
+_FROM_DATA = {
+    str: Text,
+    list: _element_from_data,
+    dict: _special_from_data,
+}
+
+
+#
+# Encoder
+#
+def _dump(node, write):
+    _dispatch(_DUMP, node)(node, write)
+
+
+def _dump_element(node, write):
+    write("[")
+    write(encode_basestring(node.tag))
+    attrs = node.attrs
+    if attrs:
+        _dump_attrs(attrs, write)
+    children = node.children
+    if len(children) == 1 and isinstance(children[0], Text):
+        write(",")
+        write(encode_basestring(children[0]))
+    elif children:
+        write(",[")
+        _dump_children(children, write)
+        write("]")
+    write("]")
+
+
+def _dump_blob(node, write):
+    write('{"raw":')
+    write(encode_basestring(node))
+    write("}")
+
+
+def _dump_json(node, write):
+    write('{"json":')
+    write(json.dumps(node.data, separators=(",", ":")))
+    write("}")
+
+
+def _dump_block(node, write):
+    write('{"body":[')
+    _dump_children(node.children, write)
+    write("]}")
+
+
+_DUMP = {
+    Element: _dump_element,
+    Text: lambda node, write: write(encode_basestring(node)),
+    Blob: _dump_blob,
+    Json: _dump_json,
+    Block: _dump_block,
+    None: lambda node, write: _dump(_tree_of(node), write),
+}
+
+
+def _dump_children(children, write):
+    first = True
+    for child in children:
+        if first:
+            first = False
+        else:
+            write(",")
+        _dump(child, write)
+
+
+def _dump_attrs(attrs, write):
+    # The opening brace is only written with the first kept attribute, so
+    # elements whose attributes are all skipped encode without an empty
+    # object, just like in to_data().
+    sep = ",{"
+    for name, value in attrs.items():
+        if _skip_attr(name, value):
+            continue
+        write(sep)
+        sep = ","
+        write(encode_basestring(name))
+        write(":")
+        if isinstance(value, str):
+            write(encode_basestring(value))
+        else:
+            write(json.dumps(_attr_value(name, value), separators=(",", ":")))
+    if sep == ",":
+        write("}")
+
+
+def _skip_attr(name, value):
+    return value is None or value is False or (name == "class" and not value)
+
+
+def _attr_value(name, value):
+    if name == "class" and not isinstance(value, str):
+        if isinstance(value, dict):
+            return [k for k, v in value.items() if v]
+        return list(value)
+    return value
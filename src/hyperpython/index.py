@@ -0,0 +1,338 @@
+"""
+Indexes for fast queries on Hyperpython trees.
+"""
+import re
+
+SELECTOR_TOKEN = re.compile(
+    r"""
+    (?P<tag>\*|[\w-]+)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<cls>[\w-]+)
+    | \[\s*(?P<attr>[\w-]+)\s*(?:=\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+    """,
+    re.VERBOSE,
+)
+COMBINATOR = re.compile(r"\s*(>)\s*|\s+")
+
+
+class TreeIndex:
+    """
+    Index elements of a tree by id, class and tag.
+
+    The index is built in a single pass over the tree and is kept up to date
+    when elements are inserted with .add_child() or the [] operator, when
+    classes are changed with .add_class() or .set_class() and when ids are
+    assigned with the id property. Changes made directly to the attrs dict
+    or to the list of children are not tracked: call .rebuild() after those.
+    Call .close() when the index is no longer needed to stop tracking
+    changes to the tree. Several indexes may share elements: all of them are
+    notified of changes.
+
+    Examples:
+        >>> tree = div([p('foo', class_='a', id='first'), p('bar', class_='a b')])
+        >>> index = TreeIndex(tree)
+        >>> index.by_id('first')
+        h('p', {'class': ['a'], 'id': 'first'}, 'foo')
+        >>> index.select('div > p.b')
+        [h('p', {'class': ['a', 'b']}, 'bar')]
+    """
+
+    def __init__(self, tree):
+        self.root = tree
+        self.rebuild()
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __iter__(self):
+        return iter(self._elements.values())
+
+    def rebuild(self):
+        """
+        Recompute index from scratch.
+        """
+        self._clear()
+        self._add(self.root, None)
+
+    def close(self):
+        """
+        Detach index from the tree and clear it.
+
+        Elements no longer notify the index of changes after it is closed.
+        Call .rebuild() to attach it again.
+        """
+        self._clear()
+
+    def by_id(self, id):
+        """
+        Return the element with the given id or None.
+        """
+        elem = self._ids.get(id)
+        if elem is not None and elem.attrs.get("id") == id:
+            return elem
+        return None
+
+    def by_class(self, cls):
+        """
+        Return a list of elements with the given class.
+        """
+        return list(self._classes.get(cls, {}).values())
+
+    def by_tag(self, tag):
+        """
+        Return a list of elements with the given tag.
+        """
+        return list(self._tags.get(tag, {}).values())
+
+    def select(self, selector):
+        """
+        Return the list of elements matching a CSS selector.
+
+        Only a subset of CSS is supported: type (div), universal (*),
+        id (#id), class (.cls) and attribute ([attr] and [attr=value])
+        selectors, descendant (div p) and child (div > p) combinators and
+        selector groups (h1, h2).
+        """
+        found = {}
+        for chain in parse_selector(selector):
+            for elem in self._candidates(chain[0][0]):
+                if id(elem) not in found and self._match_chain(elem, chain, 0):
+                    found[id(elem)] = elem
+        if len(found) > 1:
+            if self._order_stale:
+                self._update_order()
+            order = self._order
+            size = len(order)
+            return [found[k] for k in sorted(found, key=lambda k: order.get(k, size))]
+        return list(found.values())
+
+    def select_one(self, selector):
+        """
+        Return the first element matching a CSS selector or None.
+        """
+        result = self.select(selector)
+        return result[0] if result else None
+
+    #
+    # Update hooks: called by elements that belong to the index.
+    #
+    def _children_added(self, node, children):
+        parent = node if node.is_element else self._parents.get(id(node))
+        for child in children:
+            self._add(child, parent)
+        # Children might have been inserted anywhere in the document
+        self._order_stale = True
+
+    def _id_changed(self, elem, old):
+        if old is not None and self._ids.get(old) is elem:
+            del self._ids[old]
+        new = elem.attrs.get("id")
+        if new is not None:
+            self._ids[new] = elem
+
+    def _classes_changed(self, elem):
+        key = id(elem)
+        old = self._classes_of.get(key, ())
+        new = set(elem.attrs.get("class", ()))
+        for cls in old:
+            if cls not in new:
+                self._classes[cls].pop(key, None)
+        for cls in new:
+            if cls not in old:
+                self._classes.setdefault(cls, {})[key] = elem
+        self._classes_of[key] = new
+
+    #
+    # Auxiliary methods
+    #
+    def _clear(self):
+        for node in getattr(self, "_attached", {}).values():
+            self._detach(node)
+        self._attached = {}
+        self._elements = {}
+        self._order = {}
+        self._order_stale = False
+        self._parents = {}
+        self._ids = {}
+        self._tags = {}
+        self._classes = {}
+        self._classes_of = {}
+
+    def _attach(self, node):
+        current = node._index
+        if current is None or current is self:
+            node._index = self
+        elif isinstance(current, _Indexes):
+            if self not in current:
+                node._index = _Indexes((*current, self))
+        else:
+            node._index = _Indexes((current, self))
+        self._attached[id(node)] = node
+
+    def _detach(self, node):
+        current = node._index
+        if current is self:
+            del node._index
+        elif isinstance(current, _Indexes) and self in current:
+            rest = tuple(index for index in current if index is not self)
+            node._index = rest[0] if len(rest) == 1 else _Indexes(rest)
+
+    def _update_order(self):
+        order = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            tree = getattr(node, "_tree", None)
+            while tree is not None:
+                node, tree = tree, getattr(tree, "_tree", None)
+            if node.is_element:
+                order[id(node)] = len(order)
+            stack.extend(reversed(node.children))
+        self._order = order
+        self._order_stale = False
+
+    def _add(self, node, parent):
+        stack = [(node, parent)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node, parent = pop()
+            tree = getattr(node, "_tree", None)
+            while tree is not None:
+                node, tree = tree, getattr(tree, "_tree", None)
+
+            if node.is_element:
+                self._register(node, parent)
+                parent = node
+            elif node.children:
+                self._attach(node)
+                self._parents[id(node)] = parent
+            for child in reversed(node.children):
+                push((child, parent))
+
+    def _register(self, elem, parent):
+        key = id(elem)
+        self._attach(elem)
+        self._elements[key] = elem
+        self._order.setdefault(key, len(self._order))
+        self._parents[key] = parent
+        self._tags.setdefault(elem.tag, {})[key] = elem
+        elem_id = elem.attrs.get("id")
+        if elem_id is not None:
+            self._ids[elem_id] = elem
+        self._classes_changed(elem)
+
+    def _candidates(self, compound):
+        tag, elem_id, classes, _ = compound
+        if elem_id is not None:
+            elem = self.by_id(elem_id)
+            return [] if elem is None else [elem]
+        if classes:
+            sets = [self._classes.get(cls, {}) for cls in classes]
+            return list(min(sets, key=len).values())
+        if tag is not None:
+            return list(self._tags.get(tag, {}).values())
+        return list(self._elements.values())
+
+    def _match_chain(self, elem, chain, pos):
+        compound, combinator = chain[pos]
+        if not _match(elem, compound):
+            return False
+        if combinator is None:
+            return True
+
+        parent = self._parents.get(id(elem))
+        if combinator == ">":
+            return parent is not None and self._match_chain(parent, chain, pos + 1)
+        while parent is not None:
+            if self._match_chain(parent, chain, pos + 1):
+                return True
+            parent = self._parents.get(id(parent))
+        return False
+
+
+class _Indexes(tuple):
+    """
+    Several indexes attached to the same node. Forwards update hooks to each
+    of them.
+    """
+
+    __slots__ = ()
+
+    def _children_added(self, node, children):
+        for index in self:
+            index._children_added(node, children)
+
+    def _id_changed(self, elem, old):
+        for index in self:
+            index._id_changed(elem, old)
+
+    def _classes_changed(self, elem):
+        for index in self:
+            index._classes_changed(elem)
+
+
+def parse_selector(selector):
+    """
+    Parse CSS selector into a list of chains, one for each selector in a
+    group.
+
+    Each chain is a list of (compound, combinator) pairs starting from the
+    rightmost compound selector. The combinator (either ">" or " ") relates
+    each compound to the next one in the list. Compounds are tuples of
+    (tag, id, classes, attrs).
+    """
+    chains = []
+    for group in selector.split(","):
+        parts = COMBINATOR.split(group.strip())
+        compounds = [_parse_compound(x, selector) for x in parts[::2]]
+        combinators = [x or " " for x in parts[1::2]]
+        chains.append(list(zip(compounds[::-1], [*combinators[::-1], None])))
+    return chains
+
+
+def _parse_compound(source, selector):
+    tag = elem_id = None
+    classes = []
+    attrs = []
+    pos = 0
+    while pos < len(source):
+        m = SELECTOR_TOKEN.match(source, pos)
+        if m is None or (m.group("tag") and pos):
+            raise ValueError(f"invalid or unsupported selector: {selector!r}")
+        pos = m.end()
+        if m.group("tag"):
+            tag = None if m.group("tag") == "*" else m.group("tag")
+        elif m.group("id"):
+            elem_id = m.group("id")
+        elif m.group("cls"):
+            classes.append(m.group("cls"))
+        else:
+            value = m.group("value")
+            if value and value[0] in "\"'":
+                value = value[1:-1]
+            attrs.append((m.group("attr"), value))
+    if not source:
+        raise ValueError(f"invalid or unsupported selector: {selector!r}")
+    return tag, elem_id, classes, attrs
+
+
+def _match(elem, compound):
+    tag, elem_id, classes, attrs = compound
+    elem_attrs = elem.attrs
+    if tag is not None and elem.tag != tag:
+        return False
+    if elem_id is not None and elem_attrs.get("id") != elem_id:
+        return False
+    if classes:
+        elem_classes = elem_attrs.get("class", ())
+        if not all(cls in elem_classes for cls in classes):
+            return False
+    for name, value in attrs:
+        attr = elem_attrs.get(name)
+        if attr is None or attr is False:
+            return False
+        if value is not None and str(attr) != value:
+            return False
+    return True
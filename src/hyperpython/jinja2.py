@@ -1,6 +1,15 @@
+import hashlib
+import threading
+
+import jinja2
+from jinja2 import nodes, Environment, FileSystemBytecodeCache
+from jinja2.ext import Extension
 from jinja2.filters import contextfilter
+from markupsafe import Markup
 
 from hyperpython import html
+from hyperpython.context import render_context, iter_in_context
+from hyperpython.utils.cache import LRUCache
 
 
 @contextfilter
@@ -8,16 +17,173 @@ def role(ctx, obj, role_name=None, **kwargs):
     """
     A filter that renders object according to the given role. In jinja, this
     is accomplished by ``obj|role('role name')``
+
+    The request in the template context, if present, is passed to the
+    renderer as the ``request`` keyword argument. Environments created by
+    :func:`environment` use a version of this filter that does not pass the
+    request: renderers read it with
+    :func:`hyperpython.context.context_value` instead.
+    """
+    request = ctx.get("request")
+    if request is not None:
+        kwargs.setdefault("request", request)
+    return html(obj, role_name, **kwargs)
+
+
+def context_role(obj, role_name=None, **kwargs):
+    """
+    Like the :func:`role` filter, but for templates that publish the request
+    in the render context (see :class:`Template`).
+    """
+    return html(obj, role_name, **kwargs)
+
+
+class Template(jinja2.Template):
+    """
+    Jinja2 template that exposes the request in the template context through
+    :func:`hyperpython.context.context_value`.
+
+    The render context is set once for each call to render() or generate(),
+    and not for each object rendered by the template.
+    """
+
+    def render(self, *args, **kwargs):
+        request = _template_request(args, kwargs)
+        if request is None:
+            return super().render(*args, **kwargs)
+        with render_context(request=request):
+            return super().render(*args, **kwargs)
+
+    def generate(self, *args, **kwargs):
+        request = _template_request(args, kwargs)
+        events = super().generate(*args, **kwargs)
+        if request is None:
+            return events
+        return iter_in_context(events, request=request)
+
+
+class HyperpythonExtension(Extension):
+    """
+    Jinja2 extension with tags that render Hyperpython objects.
+
+    ``{% hyper obj, role="card" %}``
+        Render object with the given role. Other keyword arguments are passed
+        to :func:`hyperpython.html`. Templates of environments created by
+        :func:`environment` expose the request through the render context.
+        In other environments, the request in the template context, if
+        present, is passed to the renderer as the ``request`` argument.
+
+    ``{% hypercache key, ttl %}...{% endhypercache %}``
+        Cache the rendered content of the block across template evaluations.
+        The key can be any hashable expression and ttl (optional) is the
+        time in seconds the content is kept in the cache.
+
+    The cache is stored in the ``hyperpython_cache`` attribute of the
+    environment. Blocks are identified by template name, line number and a
+    hash of the template source, so blocks from templates created with
+    ``Environment.from_string()`` and blocks of templates that were modified
+    and reloaded do not share keys.
     """
-    try:
-        request = ctx["request"]
-    except KeyError:
-        return html(obj, role_name, **kwargs)
-    else:
-        return html(obj, role_name, request=request, **kwargs)
+
+    tags = {"hyper", "hypercache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(hyperpython_cache=LRUCache(maxsize=1024))
+        self._source = threading.local()
+
+    def preprocess(self, source, name, filename=None):
+        # Templates are parsed right after preprocessing, in the same thread
+        digest = hashlib.blake2b(source.encode("utf8"), digest_size=8).hexdigest()
+        self._source.digest = digest
+        return source
+
+    def parse(self, parser):
+        token = next(parser.stream)
+        if token.value == "hyper":
+            return self._parse_hyper(parser, token.lineno)
+        else:
+            return self._parse_hypercache(parser, token.lineno)
+
+    def _parse_hyper(self, parser, lineno):
+        obj = parser.parse_expression()
+        kwargs = []
+        while parser.stream.skip_if("comma"):
+            name = parser.stream.expect("name")
+            parser.stream.expect("assign")
+            kwargs.append(nodes.Keyword(name.value, parser.parse_expression()))
+        if issubclass(self.environment.template_class, Template):
+            method = "_render_hyper"
+        else:
+            method = "_render_hyper_with_request"
+        call = self.call_method(
+            method, [nodes.ContextReference(), obj], kwargs, lineno=lineno
+        )
+        return nodes.Output([call], lineno=lineno)
+
+    def _parse_hypercache(self, parser, lineno):
+        key = parser.parse_expression()
+        ttl = nodes.Const(None)
+        if parser.stream.skip_if("comma"):
+            ttl = parser.parse_expression()
+        body = parser.parse_statements(["name:endhypercache"], drop_needle=True)
+        block_id = nodes.Const((parser.name, self._source.digest, lineno))
+        call = self.call_method("_render_cached", [block_id, key, ttl])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render_hyper(self, context, obj, role=None, **kwargs):
+        return Markup(html(obj, role, **kwargs).__html__())
+
+    def _render_hyper_with_request(self, context, obj, role=None, **kwargs):
+        request = context.get("request")
+        if request is not None:
+            kwargs.setdefault("request", request)
+        return Markup(html(obj, role, **kwargs).__html__())
+
+    def _render_cached(self, block_id, key, ttl, caller):
+        cache = self.environment.hyperpython_cache
+        key = (block_id, key)
+        result = cache.get(key)
+        if result is None:
+            result = Markup(caller())
+            cache.set(key, result, ttl)
+        return result
+
+
+def environment(bytecode_cache=None, cache_dir=None, **kwargs):
+    """
+    Create a Jinja2 environment with Hyperpython filters and tags.
+
+    Templates of the environment are instances of :class:`Template`, which
+    publish the request in the template context to the render context (see
+    :mod:`hyperpython.context`). The role filter and the {% hyper %} tag do
+    not pass the request as an argument to renderers: use
+    ``context_value("request")`` to read it.
+
+    Compiled templates are stored in Jinja's bytecode cache. If no
+    bytecode_cache is given, use a FileSystemBytecodeCache that saves
+    compiled templates in cache_dir (defaults to the system's temporary
+    directory).
+
+    Other keyword arguments are passed to the jinja2.Environment constructor.
+    """
+    if bytecode_cache is None:
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    extensions = [HyperpythonExtension, *kwargs.pop("extensions", ())]
+    env = Environment(bytecode_cache=bytecode_cache, extensions=extensions, **kwargs)
+    env.template_class = Template
+    env.filters.update(filters, role=context_role)
+    return env
+
+
+def _template_request(args, kwargs):
+    if "request" in kwargs:
+        return kwargs["request"]
+    return dict(*args).get("request") if args else None
 
 
 #
 # Register filters and global function namespaces
 #
 filters = {"role": role}
+extensions = [HyperpythonExtension]
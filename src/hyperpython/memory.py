@@ -0,0 +1,245 @@
+"""
+Memory accounting for Hyperpython trees.
+"""
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from .core import BaseElement, Element, Text, Blob, Json, Block, Component
+
+_getsizeof = sys.getsizeof
+_CONTAINERS = (list, tuple, set, frozenset)
+_SINGLETONS = frozenset(map(id, (None, True, False, Ellipsis, NotImplemented)))
+
+RenderTrace = namedtuple("RenderTrace", ["output", "peak", "allocated", "top"])
+RenderTrace.__doc__ = """
+Result of :func:`trace_render`.
+
+Attributes:
+    output:
+        The rendered string.
+    peak:
+        Peak memory (in bytes) allocated during rendering.
+    allocated:
+        Memory still allocated after rendering (including the output).
+    top:
+        List of tracemalloc.StatisticDiff objects for the top allocation sites.
+"""
+
+
+class MemoryReport:
+    """
+    Deep memory usage of a Hyperpython tree.
+
+    Attributes:
+        total:
+            Total number of bytes.
+        nodes:
+            Number of distinct nodes in the tree.
+        by_type:
+            Mapping from node type names to the number of bytes owned by nodes
+            of that type (including their attributes and strings).
+        attrs:
+            Bytes used by attribute dictionaries, their keys and values.
+        strings:
+            Bytes used by text, raw HTML and tag names.
+    """
+
+    __slots__ = ("total", "nodes", "by_type", "attrs", "strings")
+
+    def __init__(self):
+        self.total = 0
+        self.nodes = 0
+        self.by_type = {}
+        self.attrs = 0
+        self.strings = 0
+
+    def __repr__(self):
+        return "<MemoryReport %s bytes in %s nodes>" % (self.total, self.nodes)
+
+    def as_dict(self):
+        return {
+            "total": self.total,
+            "nodes": self.nodes,
+            "by_type": dict(self.by_type),
+            "attrs": self.attrs,
+            "strings": self.strings,
+        }
+
+
+def sizeof(tree):
+    """
+    Return a :class:`MemoryReport` with the deep memory usage of tree.
+
+    Objects shared between different parts of the tree (or repeated in the
+    same list of children) are counted only once. Components are accounted
+    with their rendered tree only if it was already computed.
+
+    Examples:
+        >>> report = sizeof(div([p('hello'), p('world')]))
+        >>> report.nodes
+        5
+        >>> report.total == sum(report.by_type.values())
+        True
+    """
+    report = MemoryReport()
+    seen = set()
+    stack = [tree]
+    pop = stack.pop
+    by_type = report.by_type
+
+    while stack:
+        node = pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        report.nodes += 1
+
+        size = _sizeof_node(node, seen, stack, report)
+        name = type(node).__name__
+        by_type[name] = by_type.get(name, 0) + size
+        report.total += size
+
+    return report
+
+
+def _sizeof_node(node, seen, stack, report):
+    for cls, func in _NODE_SIZEOF:
+        if isinstance(node, cls):
+            return func(node, seen, stack, report)
+    return _deep_sizeof(node, seen)
+
+
+def _sizeof_string_node(node, seen, stack, report):
+    size = _getsizeof(node)
+    report.strings += size
+    return size
+
+
+def _sizeof_element(node, seen, stack, report):
+    size = _getsizeof(node) + _sizeof_dict(node, seen)
+    size += _deep_sizeof(node.requires, seen)
+    size += _sizeof_strings(node.tag, seen, report)
+    attrs = _deep_sizeof(node.attrs, seen)
+    report.attrs += attrs
+    return size + attrs + _sizeof_children(node.children, seen, stack)
+
+
+def _sizeof_component(node, seen, stack, report):
+    size = _getsizeof(node) + _sizeof_dict(node, seen)
+    for k, v in vars(node).items():
+        if k == "_tree":
+            stack.append(v)
+        else:
+            size += _deep_sizeof(v, seen)
+    return size
+
+
+def _sizeof_block(node, seen, stack, report):
+    size = _getsizeof(node) + _sizeof_dict(node, seen)
+    size += _deep_sizeof(node.requires, seen)
+    return size + _sizeof_children(node.children, seen, stack)
+
+
+def _sizeof_json(node, seen, stack, report):
+    size = _getsizeof(node) + _sizeof_dict(node, seen)
+    return size + sum(_deep_sizeof(v, seen) for v in vars(node).values())
+
+
+_NODE_SIZEOF = [
+    ((Text, Blob), _sizeof_string_node),
+    (Element, _sizeof_element),
+    (Component, _sizeof_component),
+    (Block, _sizeof_block),
+    (Json, _sizeof_json),
+]
+
+
+def trace_render(obj, limit=10, key_type="lineno"):
+    """
+    Render object while tracing memory allocations with tracemalloc.
+
+    Args:
+        obj:
+            Any Hyperpython element.
+        limit:
+            Maximum number of allocation sites reported in the ``top`` field.
+        key_type:
+            Grouping of allocation sites ("lineno", "filename" or "traceback").
+
+    Returns:
+        A :class:`RenderTrace` named tuple.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+        tracemalloc.reset_peak()
+
+    try:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        base, _ = tracemalloc.get_traced_memory()
+        output = obj.render()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    top = after.compare_to(before, key_type)[:limit]
+    return RenderTrace(output, peak - base, current - base, top)
+
+
+#
+# Auxiliary functions
+#
+def _sizeof_dict(obj, seen):
+    try:
+        dic = obj.__dict__
+    except AttributeError:
+        return 0
+    if id(dic) in seen:
+        return 0
+    seen.add(id(dic))
+    return _getsizeof(dic)
+
+
+def _sizeof_strings(st, seen, report):
+    if id(st) in seen:
+        return 0
+    seen.add(id(st))
+    size = _getsizeof(st)
+    report.strings += size
+    return size
+
+
+def _sizeof_children(children, seen, stack):
+    size = 0
+    if id(children) not in seen:
+        seen.add(id(children))
+        size = _getsizeof(children)
+    stack.extend(reversed(children))
+    return size
+
+
+def _deep_sizeof(obj, seen):
+    """
+    Deep size of generic Python objects (dicts, containers and scalars).
+
+    Nested Hyperpython elements are not visited.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in _SINGLETONS or id(obj) in seen or isinstance(obj, BaseElement):
+            continue
+        seen.add(id(obj))
+        size += _getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, _CONTAINERS):
+            stack.extend(obj)
+    return size
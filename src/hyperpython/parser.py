@@ -0,0 +1,170 @@
+"""
+Convert HTML source into Hyperpython trees.
+"""
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from html.parser import HTMLParser
+
+from .core import Element, Text, Blob, Block, VOID_ELEMENTS
+
+CACHE_SIZE = 256
+
+# Content of those elements is raw text and must not be escaped again
+RAW_TEXT_ELEMENTS = {"script", "style"}
+
+# Start tags that implicitly close an open element
+# https://html.spec.whatwg.org/multipage/syntax.html#optional-tags
+IMPLICIT_END = {
+    "li": {"li"},
+    "p": {"p"},
+    "option": {"option"},
+    "dt": {"dt", "dd"},
+    "dd": {"dt", "dd"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+    "tr": {"tr"},
+}
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_html(source, cache=True):
+    """
+    Parse string of HTML source and return a Block of Hyperpython elements.
+
+    Text content is unescaped, so it can be manipulated as regular strings.
+    Comments, doctype declarations and the content of <script> and <style>
+    tags are kept as raw HTML Blobs.
+
+    Args:
+        source (str):
+            HTML source code.
+        cache (bool):
+            If True (default), keep the parsed tree of the last inputs in an
+            LRU cache indexed by a hash of the source. Each call returns a new
+            copy of the cached tree, so it can be freely modified.
+
+    Examples:
+        >>> parse_html('<p class="foo">Hello <b>world</b>!</p>')
+        Block([h('p', {'class': ['foo']}, ['Hello ', h('b', 'world'), '!'])])
+    """
+    if not cache:
+        return _parse(source)
+
+    key = blake2b(source.encode("utf8", "surrogatepass"), digest_size=16).digest()
+    with _cache_lock:
+        tree = _cache.get(key)
+        if tree is not None:
+            _cache.move_to_end(key)
+    if tree is None:
+        tree = _parse(source)
+        with _cache_lock:
+            _cache[key] = tree
+            if len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+    return _clone(tree)
+
+
+def clear_cache():
+    """
+    Remove all trees from the parse_html() cache.
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
+class Parser(HTMLParser):
+    """
+    Incremental HTML parser.
+
+    Call .feed() with chunks of HTML source as they become available and
+    .close() to finish parsing and obtain the resulting Block. Chunks do not
+    need to be aligned with tag boundaries.
+
+    Examples:
+        >>> parser = Parser()
+        >>> parser.feed('<ul><li>foo<li')
+        >>> parser.feed('>bar</ul>')
+        >>> parser.close()
+        Block([h('ul', [h('li', 'foo'), h('li', 'bar')])])
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Block([])
+        self._stack = [self.root]
+
+    def close(self):
+        """
+        Finish parsing and return the resulting Block.
+        """
+        super().close()
+        del self._stack[1:]
+        return self.root
+
+    def handle_starttag(self, tag, attrs):
+        implicit_end = IMPLICIT_END.get(tag)
+        if implicit_end and self._stack[-1].tag in implicit_end:
+            self._stack.pop()
+        is_void = tag in VOID_ELEMENTS
+        elem = Element(tag, _attrs(attrs), [], is_void)
+        self._stack[-1].children.append(elem)
+        if not is_void:
+            self._stack.append(elem)
+
+    def handle_startendtag(self, tag, attrs):
+        elem = Element(tag, _attrs(attrs), [], tag in VOID_ELEMENTS)
+        self._stack[-1].children.append(elem)
+
+    def handle_endtag(self, tag):
+        stack = self._stack
+        for idx in range(len(stack) - 1, 0, -1):
+            if stack[idx].tag == tag:
+                del stack[idx:]
+                break
+
+    def handle_data(self, data):
+        parent = self._stack[-1]
+        children = parent.children
+        kind = Blob if parent.tag in RAW_TEXT_ELEMENTS else Text
+        if children and type(children[-1]) is kind:
+            children[-1] = kind(children[-1] + data)
+        else:
+            children.append(kind(data))
+
+    def handle_comment(self, data):
+        self._stack[-1].children.append(Blob(f"<!--{data}-->"))
+
+    def handle_decl(self, decl):
+        self._stack[-1].children.append(Blob(f"<!{decl}>"))
+
+    def handle_pi(self, data):
+        self._stack[-1].children.append(Blob(f"<?{data}>"))
+
+
+def _parse(source):
+    parser = Parser()
+    parser.feed(source)
+    return parser.close()
+
+
+def _attrs(attrs):
+    return {name: True if value is None else value for name, value in attrs}
+
+
+def _clone(node):
+    if node.is_element:
+        new = object.__new__(Element)
+        new.tag = node.tag
+        new.attrs = {
+            k: list(v) if k == "class" else v for k, v in node.attrs.items()
+        }
+        new.children = list(map(_clone, node.children))
+        new.is_void = node.is_void
+        new.requires = node.requires
+        return new
+    elif isinstance(node, Block):
+        return Block(map(_clone, node.children))
+    return node
@@ -0,0 +1,261 @@
+"""
+Render-time instrumentation.
+
+Hyperpython calls the active profiler (if any) whenever a Component builds its
+tree, a fragment is computed or :func:`hyperpython.html` dispatches an object
+to a renderer. When no profiler is installed, each hook point costs a single
+global lookup.
+
+Examples:
+    >>> with Profiler() as profiler:                           # doctest: +SKIP
+    ...     page.render()
+    >>> print(profiler.json(indent=2))                         # doctest: +SKIP
+"""
+import json
+import threading
+from collections import namedtuple
+from contextvars import ContextVar
+from time import perf_counter
+
+#: The object hook points call to measure renders. Hook points check this
+#: value directly, so it must be None when profiling is off. It is the
+#: globally installed profiler or, while any profiler is used as a context
+#: manager, an object that finds the profiler of the current context.
+active = None
+_lock = threading.Lock()
+_installed = None
+_scoped = ContextVar("hyperpython_profiler", default=None)
+_scoped_count = 0
+
+ProfileRecord = namedtuple("ProfileRecord", ["kind", "name", "elapsed", "nodes", "size"])
+ProfileRecord.__doc__ = """
+A single measurement.
+
+Attributes:
+    kind:
+        One of 'component', 'fragment' or 'html'.
+    name:
+        Component class name, fragment path or "<type>:<role>" for html()
+        dispatches.
+    elapsed:
+        Wall time in seconds.
+    nodes:
+        Number of nodes in the resulting tree (None if not measured).
+    size:
+        Size of the rendered output in UTF-8 bytes (None if not measured).
+"""
+
+
+class Profiler:
+    """
+    Collect timing information for Hyperpython render functions.
+
+    Args:
+        callback (callable):
+            Optional function called with a :class:`ProfileRecord` for each
+            measurement. Use it to export data to an external metrics system.
+        measure_output (bool):
+            If True (default), count nodes and render the resulting tree to
+            measure the output size. This is done outside the timed region,
+            but it makes profiling considerably slower.
+
+    A profiler can be used as a context manager or installed globally with
+    the :meth:`install` method. Context managers only measure renders in
+    the current thread or asyncio task (see :mod:`contextvars`), while
+    installed profilers measure all renders in the process.
+    """
+
+    def __init__(self, callback=None, measure_output=True):
+        self.callback = callback
+        self.measure_output = measure_output
+        self._stats = {}
+        self._tokens = []
+
+    def __enter__(self):
+        global _scoped_count
+        self._tokens.append(_scoped.set(self))
+        with _lock:
+            _scoped_count += 1
+            _update_active()
+        return self
+
+    def __exit__(self, *args):
+        global _scoped_count
+        _scoped.reset(self._tokens.pop())
+        with _lock:
+            _scoped_count -= 1
+            _update_active()
+
+    def install(self):
+        """
+        Install profiler globally and return the previously installed
+        profiler.
+        """
+        global _installed
+        with _lock:
+            previous, _installed = _installed, self
+            _update_active()
+        return previous
+
+    def uninstall(self):
+        """
+        Disable global profiling, if this profiler is the installed one.
+        """
+        global _installed
+        with _lock:
+            if _installed is self:
+                _installed = None
+                _update_active()
+
+    def measure(self, kind, name, func, *args, **kwargs):
+        """
+        Call func(*args, **kwargs) and record a measurement for the result.
+        """
+        start = perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = perf_counter() - start
+
+        nodes = size = None
+        if self.measure_output:
+            nodes, size = tree_metrics(result)
+        self.record(ProfileRecord(kind, name, elapsed, nodes, size))
+        return result
+
+    def record(self, record):
+        """
+        Aggregate a new measurement in the stats table.
+        """
+        key = (record.kind, record.name)
+        with _lock:
+            try:
+                stats = self._stats[key]
+            except KeyError:
+                stats = self._stats[key] = ProfileStats(*key)
+            stats.add(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def stats(self):
+        """
+        Return a list of :class:`ProfileStats` sorted by total time.
+        """
+        with _lock:
+            data = list(self._stats.values())
+        return sorted(data, key=lambda x: x.total, reverse=True)
+
+    def table(self):
+        """
+        Return stats as a list of JSON-compatible dictionaries.
+        """
+        return [stats.as_dict() for stats in self.stats()]
+
+    def json(self, **kwargs):
+        """
+        Dump stats table as JSON. Keyword arguments are passed to json.dumps.
+        """
+        return json.dumps(self.table(), **kwargs)
+
+    def reset(self):
+        """
+        Remove all collected data.
+        """
+        with _lock:
+            self._stats.clear()
+
+
+class _ContextProfiler:
+    """
+    Forward measurements to the profiler of the current context, or to the
+    installed profiler.
+    """
+
+    def measure(self, kind, name, func, *args, **kwargs):
+        profiler = _scoped.get() or _installed
+        if profiler is None:
+            return func(*args, **kwargs)
+        return profiler.measure(kind, name, func, *args, **kwargs)
+
+
+_CONTEXT_PROFILER = _ContextProfiler()
+
+
+def _update_active():
+    global active
+    active = _CONTEXT_PROFILER if _scoped_count else _installed
+
+
+class ProfileStats:
+    """
+    Aggregate measurements for a single (kind, name) pair.
+    """
+
+    __slots__ = ("kind", "name", "calls", "total", "min", "max", "nodes", "size")
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.nodes = 0
+        self.size = 0
+
+    def __repr__(self):
+        return "<ProfileStats %s %r: %s calls, %.6fs>" % (
+            self.kind,
+            self.name,
+            self.calls,
+            self.total,
+        )
+
+    @property
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+    def add(self, record):
+        elapsed = record.elapsed
+        self.calls += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        self.nodes += record.nodes or 0
+        self.size += record.size or 0
+
+    def as_dict(self):
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "nodes": self.nodes,
+            "bytes": self.size,
+        }
+
+
+def profile(callback=None, measure_output=True):
+    """
+    Return a profiler to be used as a context manager.
+
+    Examples:
+        >>> with profile() as profiler:
+        ...     _ = render(p('hello'))
+        >>> [row['name'] for row in profiler.table()]
+        ['Element:None']
+    """
+    return Profiler(callback=callback, measure_output=measure_output)
+
+
+def tree_metrics(obj):
+    """
+    Return a tuple of (node count, rendered size in bytes) for the given tree.
+    """
+    try:
+        nodes = sum(1 for _ in obj.walk())
+        size = len(obj.render().encode("utf8"))
+    except (AttributeError, NotImplementedError, TypeError):
+        return None, None
+    return nodes, size
@@ -1,3 +1,6 @@
 from .attrs import dump_attrs, render_attrs
+from .binary import dump_bytes, render_bytes
 from .helpers import render_pretty
+from .minify import dump_minified, render_minified
 from .single_attr import dump_single_attr, render_single_attr
+from .stream import iter_render
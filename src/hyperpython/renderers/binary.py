@@ -0,0 +1,119 @@
+from .attrs import render_attrs
+
+# Characters that cannot be encoded are written as character references
+ENCODING_ERRORS = "xmlcharrefreplace"
+
+# Cache of encoded static parts of each tag: (<tag , <tag>, >, </tag>)
+_TAGS = {}
+
+
+def dump_bytes(obj, buffer, encoding="utf8"):
+    """
+    Dump encoded HTML data into a binary buffer.
+
+    Args:
+        obj:
+            A Hyperpython element.
+        buffer:
+            A bytearray (data is appended), a writable memoryview or other
+            object supporting the buffer protocol (data is written from the
+            start of the buffer) or a binary file object.
+        encoding:
+            Output encoding. Characters not supported by the encoding are
+            written as numeric character references.
+
+    Returns:
+        The number of bytes written.
+    """
+    if isinstance(buffer, bytearray):
+        start = len(buffer)
+        _dump(obj, buffer.extend, encoding)
+        return len(buffer) - start
+    elif hasattr(buffer, "write"):
+        writer = _FileWriter(buffer.write)
+    else:
+        writer = _BufferWriter(buffer)
+    _dump(obj, writer.write, encoding)
+    return writer.size
+
+
+def render_bytes(obj, encoding="utf8"):
+    """
+    Like dump_bytes(), but return a bytes object.
+
+    The rendered data is never held as an intermediate str.
+
+    Examples:
+        >>> render_bytes(p('olá'))
+        b'<p>ol\\xc3\\xa1</p>'
+    """
+    chunks = []
+    _dump(obj, chunks.append, encoding)
+    return b"".join(chunks)
+
+
+def _dump(node, write, encoding):
+    if node.is_element:
+        _dump_element(node, write, encoding)
+    elif node.children:
+        for child in node.children:
+            _dump(child, write, encoding)
+    else:
+        tree = getattr(node, "_tree", node)
+        if tree is node:
+            write(str(node.render()).encode(encoding, ENCODING_ERRORS))
+        else:
+            _dump(tree, write, encoding)
+
+
+def _dump_element(node, write, encoding):
+    try:
+        opener, bare_opener, end, closer = _TAGS[node.tag, encoding]
+    except KeyError:
+        opener, bare_opener, end, closer = _encode_tag(node.tag, encoding)
+
+    attrs = node.attrs and render_attrs(node.attrs)
+    if attrs:
+        write(opener)
+        write(attrs.encode(encoding, ENCODING_ERRORS))
+        write(end)
+    else:
+        write(bare_opener)
+    if not node.is_void:
+        for child in node.children:
+            _dump(child, write, encoding)
+    write(closer)
+
+
+def _encode_tag(tag, encoding):
+    parts = (f"<{tag} ", f"<{tag}>", ">", f"</{tag}>")
+    data = _TAGS[tag, encoding] = tuple(x.encode(encoding) for x in parts)
+    return data
+
+
+class _FileWriter:
+    __slots__ = ("_write", "size")
+
+    def __init__(self, write):
+        self._write = write
+        self.size = 0
+
+    def write(self, data):
+        self._write(data)
+        self.size += len(data)
+
+
+class _BufferWriter:
+    __slots__ = ("view", "size")
+
+    def __init__(self, buffer):
+        self.view = memoryview(buffer).cast("B")
+        self.size = 0
+
+    def write(self, data):
+        start = self.size
+        end = start + len(data)
+        if end > len(self.view):
+            raise ValueError("buffer is too small to hold the rendered data")
+        self.view[start:end] = data
+        self.size = end
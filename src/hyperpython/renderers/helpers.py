@@ -1,31 +1,84 @@
 import re
 
 from markupsafe import Markup
-from sidekick import import_later
 
-lxml_html = import_later("lxml.html")
-lxml_etree = import_later("lxml.etree")
-head_children = re.compile(r"^<(?:title|meta|script|style|link)")
+from .attrs import render_attrs
 
+# Output starting with these tags has no trailing newline
+HEAD_TAGS = re.compile(r"<(?:head|title|meta|script|style|link)\b")
 
-def render_pretty(source, raw=False):
+# Elements whose content is rendered verbatim by the pretty printer
+PRESERVE_WHITESPACE = {"pre", "textarea", "script", "style"}
+
+# https://developer.mozilla.org/en-US/docs/Web/HTML/Inline_elements
+INLINE_ELEMENTS = {
+    "a",
+    "abbr",
+    "acronym",
+    "b",
+    "bdi",
+    "bdo",
+    "big",
+    "br",
+    "button",
+    "cite",
+    "code",
+    "data",
+    "del",
+    "dfn",
+    "em",
+    "font",
+    "i",
+    "img",
+    "input",
+    "ins",
+    "kbd",
+    "label",
+    "mark",
+    "meter",
+    "output",
+    "progress",
+    "q",
+    "ruby",
+    "s",
+    "samp",
+    "select",
+    "small",
+    "span",
+    "strike",
+    "strong",
+    "sub",
+    "sup",
+    "textarea",
+    "time",
+    "tt",
+    "u",
+    "var",
+    "wbr",
+}
+
+
+def render_pretty(source, raw=False, indent=2):
     """
     Pretty prints HTML source or element.
 
+    Block-level elements are broken in several indented lines, while inline
+    content is kept in a single line. Children of <pre>, <textarea>, <script>
+    and <style> tags are rendered verbatim.
+
     Returns a Markup strings.
     """
 
-    if not isinstance(source, str):
-        source = source.render()
+    if isinstance(source, str) and not hasattr(source, "dump"):
+        from ..parser import parse_html
 
-    root = lxml_html.fromstring(source)
-    pretty = lxml_etree.tostring(root, encoding="unicode", pretty_print=True)
+        source = parse_html(source)
 
-    # lxml adds <head> and <html> tags if the root tag should be
-    if source.startswith("<head"):
-        pretty = dedent(pretty[7:-8], 2)
-    elif head_children.match(source):
-        pretty = dedent(pretty[16:-18], 4)
+    lines = []
+    _pretty(source, 0, lines, " " * indent)
+    pretty = "\n".join(lines)
+    if not (lines and HEAD_TAGS.match(lines[0])):
+        pretty += "\n"
 
     if raw:
         return pretty
@@ -33,5 +86,92 @@ def render_pretty(source, raw=False):
         return Markup(pretty)
 
 
-def dedent(st, size):
-    return "\n".join(line[size:] for line in st.splitlines())
+def open_tag(elem):
+    """
+    Return the opening tag string for the given element.
+    """
+    if elem.attrs:
+        attrs = render_attrs(elem.attrs)
+        if attrs:
+            return f"<{elem.tag} {attrs}>"
+    return f"<{elem.tag}>"
+
+
+def _pretty(node, level, lines, indent):
+    pad = indent * level
+
+    if node.is_element:
+        if _is_flat(node):
+            parts = [pad]
+            _flat(node, parts.append)
+            lines.append("".join(parts))
+        else:
+            lines.append(pad + open_tag(node))
+            _pretty_children(node.children, level + 1, lines, indent)
+            lines.append(f"{pad}</{node.tag}>")
+    elif node.children:
+        _pretty_children(node.children, level, lines, indent)
+    else:
+        tree = getattr(node, "_tree", node)
+        if tree is not node:
+            _pretty(tree, level, lines, indent)
+        else:
+            data = node.render().strip()
+            if data:
+                lines.append(pad + data)
+
+
+def _pretty_children(children, level, lines, indent):
+    """
+    Render block children in separate lines, grouping consecutive runs of
+    inline content in a single line.
+    """
+    pad = indent * level
+    run = []
+
+    for child in children:
+        if _is_inline(child):
+            _flat(child, run.append)
+            continue
+        if run:
+            _flush_run(run, pad, lines)
+        _pretty(child, level, lines, indent)
+
+    if run:
+        _flush_run(run, pad, lines)
+
+
+def _flush_run(run, pad, lines):
+    data = "".join(run).strip()
+    if data:
+        lines.append(pad + data)
+    run.clear()
+
+
+def _is_inline(node):
+    if node.is_element:
+        return node.tag in INLINE_ELEMENTS
+    return not node.children
+
+
+def _is_flat(elem):
+    if elem.is_void or elem.tag in INLINE_ELEMENTS or elem.tag in PRESERVE_WHITESPACE:
+        return True
+    return all(_is_inline(child) for child in elem.children)
+
+
+def _flat(node, write):
+    """
+    Render node without line breaks, omitting end tags of void elements.
+    """
+    if node.is_element:
+        write(open_tag(node))
+        if not node.is_void:
+            for child in node.children:
+                _flat(child, write)
+            write(f"</{node.tag}>")
+    elif node.children:
+        for child in node.children:
+            _flat(child, write)
+    else:
+        write(node.render())
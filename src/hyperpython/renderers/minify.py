@@ -0,0 +1,111 @@
+import io
+import re
+
+from markupsafe import Markup
+
+from .helpers import PRESERVE_WHITESPACE
+from .single_attr import render_single_attr
+
+# https://html.spec.whatwg.org/multipage/syntax.html#unquoted
+UNQUOTED_ATTR_VALUE = re.compile(r"^[^\s\"'=<>`]+$")
+WHITESPACE = re.compile(r"\s+")
+
+
+def dump_minified(obj, file, collapse_whitespace=False):
+    """
+    Dump the smallest valid HTML5 representation of obj in file.
+
+    End tags of void elements are omitted, boolean and empty attributes are
+    written without values and attribute values are left unquoted when it is
+    safe to do so.
+
+    Args:
+        obj:
+            A Hyperpython element.
+        file:
+            A file-like object opened in text mode.
+        collapse_whitespace (bool):
+            If True, collapse runs of whitespace in text nodes to a single
+            space. Text inside <pre>, <textarea>, <script> and <style> tags
+            is never changed.
+    """
+    _dump(obj, file.write, collapse_whitespace)
+
+
+def render_minified(obj, collapse_whitespace=False):
+    """
+    Like dump_minified(), but return a string instead of writing to a file.
+
+    Examples:
+        >>> render_minified(input_(type='checkbox', checked=True, value=''))
+        '<input type=checkbox checked value>'
+    """
+    file = io.StringIO()
+    _dump(obj, file.write, collapse_whitespace)
+    return file.getvalue()
+
+
+def _dump(node, write, collapse):
+    if node.is_element:
+        _dump_element(node, write, collapse)
+    elif node.children:
+        for child in node.children:
+            _dump(child, write, collapse)
+    elif collapse and isinstance(node, str) and not isinstance(node, Markup):
+        write(WHITESPACE.sub(" ", node.render()))
+    else:
+        tree = getattr(node, "_tree", node)
+        if tree is node:
+            write(node.render())
+        else:
+            _dump(tree, write, collapse)
+
+
+def _dump_element(node, write, collapse):
+    tag = node.tag
+    write("<")
+    write(tag)
+    if node.attrs:
+        _dump_attrs(node.attrs, write)
+    write(">")
+    if not node.is_void:
+        collapse = collapse and tag not in PRESERVE_WHITESPACE
+        for child in node.children:
+            _dump(child, write, collapse)
+        write("</")
+        write(tag)
+        write(">")
+
+
+def _dump_attrs(attrs, write):
+    for attr, value in attrs.items():
+        if value is False or value is None:
+            continue
+        elif value is True or value == "":
+            write(" ")
+            write(attr)
+        elif attr == "class":
+            if value:
+                _write_attr(attr, _class_value(value), write)
+        else:
+            _write_attr(attr, render_single_attr(value), write)
+
+
+def _class_value(value):
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, dict):
+        return " ".join(str(k) for k, v in value.items() if v)
+    return " ".join(value)
+
+
+def _write_attr(attr, data, write):
+    write(" ")
+    write(attr)
+    if UNQUOTED_ATTR_VALUE.match(data):
+        write("=")
+        write(data)
+    else:
+        write('="')
+        write(data)
+        write('"')
@@ -0,0 +1,77 @@
+from .attrs import render_attrs
+
+# Tags whose end triggers an immediate flush of the buffered output
+FLUSH_AFTER = frozenset({"head"})
+
+
+def iter_render(obj, chunk_size=8192, flush_after=FLUSH_AFTER):
+    """
+    Render object incrementally, yielding strings of approximately
+    chunk_size characters.
+
+    Output is flushed as soon as the end tag of any element in flush_after is
+    rendered. By default, this sends the <head> section to the client as
+    early as possible, so browsers can start fetching stylesheets and scripts
+    while the rest of the page is rendered.
+
+    Components are rendered only when they are reached, so generating their
+    content is interleaved with sending data. Leaf nodes that implement an
+    iter_chunks() method (e.g., :class:`hyperpython.contrib.grid.Grid`) are
+    also consumed incrementally.
+
+    Examples:
+        >>> page = HTML5([head(title('Title')), body(p('Hello!'))])
+        >>> list(iter_render(page))
+        ['<html><head><title>Title</title></head>', '<body><p>Hello!</p></body></html>']
+    """
+    buffer = []
+    size = 0
+    for data, flush in _iter_parts(obj, flush_after):
+        buffer.append(data)
+        size += len(data)
+        if flush or size >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _iter_parts(obj, flush_after):
+    """
+    Iterate over (html, flush) pairs with consecutive parts of the output.
+    """
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node = pop()
+        if type(node) is tuple:
+            yield node
+        elif node.is_element:
+            tag = node.tag
+            attrs = node.attrs and render_attrs(node.attrs)
+            yield (f"<{tag} {attrs}>" if attrs else f"<{tag}>"), False
+            push((f"</{tag}>", tag in flush_after))
+            if not node.is_void:
+                stack.extend(reversed(node.children))
+        elif node.children:
+            stack.extend(reversed(node.children))
+        else:
+            yield from _iter_leaf_parts(node, push)
+
+
+def _iter_leaf_parts(node, push):
+    iter_chunks = getattr(node, "iter_chunks", None)
+    if iter_chunks is not None:
+        # Leaf nodes that render themselves incrementally. This takes
+        # precedence over _tree, which some of them build for inspection.
+        for data in iter_chunks():
+            yield data, False
+        return
+    tree = getattr(node, "_tree", None)
+    if tree is not None:
+        push(tree)
+    else:
+        yield node.render(), False
@@ -2,7 +2,7 @@ from .core import Tag, Element, Text, as_child, as_attr, SEQUENCE_TYPES, VOID_EL
 from .utils import html_safe_natural_attr
 
 
-def h(tag, *args, children=None, **attrs):
+def h(tag, *args, children=None, requires=(), **attrs):
     """
     Creates a tag.
 
@@ -28,6 +28,10 @@ def h(tag, *args, children=None, **attrs):
     h('h1', class_='title', children=['content'])
         Optionally, the list of children nodes can be specified as a keyword
         argument.
+
+    h('div', 'content', requires=['widget.css', 'widget.js'])
+        The requires argument declares assets (stylesheets and scripts) the
+        element depends on. See :mod:`hyperpython.assets`.
     """
     attr_name = html_safe_natural_attr
     is_void = tag in VOID_ELEMENTS
@@ -60,7 +64,7 @@ def h(tag, *args, children=None, **attrs):
     else:
         raise TypeError("h() accepts at most 3 positional arguments")
 
-    return Element(tag, attrs, children, is_void)
+    return Element(tag, attrs, children, is_void, requires)
 
 
 def _as_children(data, as_child=as_child, seq=SEQUENCE_TYPES):
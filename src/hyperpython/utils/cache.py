@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+
+_missing = object()
+
+
+class LRUCache:
+    """
+    A thread-safe mapping that keeps at most maxsize items, discarding the
+    least recently used ones. Items optionally expire after ttl seconds.
+
+    Examples:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set('a', 1)
+        >>> cache.set('b', 2)
+        >>> cache.get('a')
+        1
+        >>> cache.set('c', 3)  # discards 'b', the least recently used item
+        >>> cache.get('b') is None
+        True
+    """
+
+    def __init__(self, maxsize=128, ttl=None, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def get(self, key, default=None):
+        """
+        Return cached value for key or default, if key is missing or expired.
+        """
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires <= self.timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Store value in cache.
+
+        The optional ttl overrides the default time to live of the cache.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self.timer() + ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all items from cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+def freeze(value):
+    """
+    Convert lists, dicts and sets to hashable tuples and frozensets.
+
+    Examples:
+        >>> freeze({'b': [1, 2], 'a': {3}})
+        (('a', frozenset({3})), ('b', (1, 2)))
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(freeze, value))
+    elif isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(map(freeze, value))
+    return value
@@ -0,0 +1,41 @@
+class lazy:
+    """
+    Lazy attribute that is computed on first access and stored in the
+    instance dictionary.
+
+    It works like sidekick's lazy, but initialization is atomic: if several
+    threads access the attribute at the same time, the function might be
+    executed more than once, but all threads observe the value that was
+    stored first. Reads after initialization never touch the descriptor and
+    never take a lock, which matters on free-threaded builds of Python.
+
+    Examples:
+        >>> class Foo:
+        ...     @lazy
+        ...     def value(self):
+        ...         print('computing...')
+        ...         return 42
+        >>> foo = Foo()
+        >>> foo.value
+        computing...
+        42
+        >>> foo.value
+        42
+    """
+
+    __slots__ = ("function", "name")
+
+    def __init__(self, function, name=None):
+        self.function = function
+        self.name = name
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = self.function(obj)
+        # dict.setdefault is atomic: the first stored value wins.
+        return obj.__dict__.setdefault(self.name, value)
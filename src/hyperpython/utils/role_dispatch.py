@@ -1,9 +1,12 @@
+import threading
 from abc import get_cache_token
 from functools import wraps, partial
 
 from sidekick import lazy_singledispatch
 from types import MappingProxyType
 
+from .. import profiling as _profiling
+
 
 def role_singledispatch(func):  # noqa: C901
     """
@@ -14,6 +17,10 @@ def role_singledispatch(func):  # noqa: C901
     roles = {}
     no_roles = lazy_singledispatch(func)
     registry = {}
+    lock = threading.RLock()
+
+    # Copy-on-write cache: readers never take the lock, writers replace the
+    # whole dictionary.
     dispatch_cache = {}
     cache_token = None
 
@@ -28,26 +35,36 @@ def role_singledispatch(func):  # noqa: C901
             role (str):
                 Roles define alternate contexts for rendering the same object.
         """
-        if role is None:
-            register_ = no_roles.register(cls)
-        else:
-            try:
-                function = roles[role]
-            except KeyError:
-
-                def role_fallback(obj, **kwargs):
-                    return no_roles(obj, role=role, **kwargs)
-
-                function = roles[role] = lazy_singledispatch(role_fallback)
-            register_ = function.register(cls)
 
         def decorator(func):
-            dispatch_cache.clear()
-            registry[cls, role] = func
-            return register_(func)
+            with lock:
+                if role is None:
+                    register_ = no_roles.register(cls)
+                else:
+                    try:
+                        function = roles[role]
+                    except KeyError:
+
+                        def role_fallback(obj, **kwargs):
+                            return no_roles(obj, role=role, **kwargs)
+
+                        function = roles[role] = lazy_singledispatch(role_fallback)
+                    register_ = function.register(cls)
+                registry[cls, role] = func
+                result = register_(func)
+                clear_cache()
+            return result
 
         return decorator
 
+    def clear_cache():
+        """
+        Clear dispatch cache.
+        """
+        nonlocal dispatch_cache
+        with lock:
+            dispatch_cache = {}
+
     def dispatch(cls, role=None):
         """
         Return the implementation for the given type and role.
@@ -58,9 +75,9 @@ def role_singledispatch(func):  # noqa: C901
         positional arguments.
         """
         # Invalidate cache when ABC cache is invalidated
-        nonlocal cache_token
+        nonlocal cache_token, dispatch_cache
         if cache_token is not None and cache_token != get_cache_token():
-            dispatch_cache.clear()
+            clear_cache()
             cache_token = get_cache_token()
 
         try:
@@ -68,27 +85,32 @@ def role_singledispatch(func):  # noqa: C901
         except KeyError:
             pass
 
-        # Find implementation, if not in cache
-        if role is None:
-            impl = no_roles.dispatch(cls)
-        elif role in roles:
-            impl = roles[role].dispatch(cls)
-        else:
-            impl = partial(no_roles.dispatch(cls), role=role)
-
-        # Cache and return
-        dispatch_cache[cls, role] = impl
+        # Find implementation, if not in cache. Resolution is done under the
+        # lock since sidekick's dispatch mutates its lazy registry.
+        with lock:
+            if role is None:
+                impl = no_roles.dispatch(cls)
+            elif role in roles:
+                impl = roles[role].dispatch(cls)
+            else:
+                impl = partial(no_roles.dispatch(cls), role=role)
+            dispatch_cache = {**dispatch_cache, (cls, role): impl}
         return impl
 
     @wraps(func)
     def wrapped(obj, role=None, **kwargs):
-        impl = dispatch(obj.__class__, role)
-        return impl(obj, **kwargs)
+        cls = obj.__class__
+        impl = dispatch(cls, role)
+        profiler = _profiling.active
+        if profiler is None:
+            return impl(obj, **kwargs)
+        name = f"{cls.__name__}:{role}"
+        return profiler.measure(func.__name__, name, impl, obj, **kwargs)
 
     wrapped.register = register
     wrapped.dispatch = dispatch
     wrapped.registry = MappingProxyType(registry)
-    wrapped.clear_cache = dispatch_cache.clear
+    wrapped.clear_cache = clear_cache
     return wrapped
 
 
@@ -10,7 +10,5 @@ def func():
 
 @pytest.fixture(autouse=True)
 def hyperpython_function(doctest_namespace):
-    hp_namespace = {
-        k: v for k, v in vars(hyperpython).items() if not k.startswith('_')
-    }
+    hp_namespace = {k: getattr(hyperpython, k) for k in hyperpython.__all__}
     doctest_namespace.update(hp_namespace)
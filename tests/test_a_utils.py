@@ -1,12 +1,35 @@
+import threading
 from collections import OrderedDict
 
 import pytest
 from hyperpython.utils import flatten
 from hyperpython.utils import  html_safe_natural_attr
+from hyperpython.utils.cache import LRUCache
+from hyperpython.utils.descriptors import lazy
 from hyperpython.utils.role_dispatch import role_singledispatch
 from hyperpython.utils.text import snake_case, dash_case, random_id
 
 
+def run_threads(targets):
+    """
+    Run each target in its own thread and return the exceptions they raised.
+    """
+    errors = []
+
+    def run(target):
+        try:
+            target()
+        except Exception as ex:  # pragma: no cover
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return errors
+
+
 
 
 
@@ -46,6 +69,27 @@ class TestRoleDispatch:
         assert func('foo', role='bar') == 'foo:bar'
         assert func('foo', role='uppercase') == 'FOO'
 
+    def test_register_invalidates_cache_concurrently(self):
+        @role_singledispatch
+        def func(x, role=None):
+            return 'default'
+
+        classes = [type(f'Cls{i}', (), {}) for i in range(20)]
+
+        def call():
+            for _ in range(50):
+                for cls in classes:
+                    func(cls(), role='r')
+
+        def register():
+            for i, cls in enumerate(classes):
+                func.register(cls, 'r')(lambda x, i=i: i)
+
+        errors = run_threads([call] * 4 + [register])
+
+        assert errors == []
+        assert [func(cls(), role='r') for cls in classes] == list(range(20))
+
 
 class TestStringUtils:
     def test_attr_names(self):
@@ -77,3 +121,55 @@ class TestSeqUtils:
     def test_flatten_lists(self):
         assert flatten([[1, 2], [3]]) == [1, 2, 3]
         assert flatten([1, [2, [3, 4]]]) == [1, 2, 3, 4]
+
+
+class TestLRUCache:
+    def test_discard_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+        cache.set('c', 3)
+        assert 'b' not in cache
+        assert 'a' in cache and 'c' in cache
+        assert len(cache) == 2
+
+    def test_expire_items(self):
+        clock = [0.0]
+        cache = LRUCache(ttl=1, timer=lambda: clock[0])
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        clock[0] = 1.5
+        assert cache.get('a', 'missing') == 'missing'
+        assert cache.hits == 1
+
+
+class TestLazy:
+    def test_all_threads_observe_the_first_stored_value(self):
+        barrier = threading.Barrier(8)
+
+        class Foo:
+            @lazy
+            def value(self):
+                barrier.wait()
+                return object()
+
+        foo = Foo()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(foo.value))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 8
+        assert all(value is foo.value for value in results)
+
+    def test_can_be_overridden(self):
+        class Foo:
+            value = lazy(lambda self: 1)
+
+        foo = Foo()
+        foo.value = 2
+        assert foo.value == 2
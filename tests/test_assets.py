@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from hyperpython import HTML5, head, body, div, p, link, script, style, title, Block, Component
+from hyperpython.assets import Assets, AssetManifest, collect_assets, render_with_assets
+from hyperpython.assets import file_integrity
+from hyperpython.components import Head
+
+
+class Widget(Component):
+    requires = ['widget.css', 'widget.js']
+
+    def html(self):
+        return div(class_='widget', requires=['base.css'])['widget']
+
+
+def page(*content, head_children=()):
+    return HTML5([head(list(head_children)), body(list(content))])
+
+
+class TestAssets:
+    def test_order_and_deduplication(self):
+        assets = Assets(['a.js', 'a.css', 'b.js?v=1', 'a.js', 'b.css', 'a.css'])
+        assert [x.attrs.get('href') or x.attrs['src'] for x in assets] == \
+            ['a.css', 'b.css', 'a.js', 'b.js?v=1']
+
+    def test_elements(self):
+        inline = style('p {}')
+        assets = Assets([script(src='x.js', defer=True), inline, 'x.js', style('p {}')])
+        assert list(assets) == [inline, script(src='x.js', defer=True)]
+
+    def test_invalid_asset(self):
+        with pytest.raises(ValueError):
+            Assets(['image.png'])
+
+    def test_collect_assets(self):
+        tree = Block([Widget(), p('x', requires=['p.css'])])
+        assets = collect_assets(tree)
+        assert [x.attrs.get('href') or x.attrs['src'] for x in assets] == \
+            ['widget.css', 'base.css', 'p.css', 'widget.js']
+
+
+class TestRenderWithAssets:
+    def test_inject_in_head(self):
+        tree = page(Widget(), p('hi', requires=['widget.js', 'p.js']),
+                    head_children=[title('Page')])
+        assert render_with_assets(tree) == (
+            '<html><head><title>Page</title>'
+            '<link rel="stylesheet" href="widget.css"></link>'
+            '<link rel="stylesheet" href="base.css"></link>'
+            '<script src="widget.js"></script>'
+            '<script src="p.js"></script></head>'
+            '<body><div class="widget">widget</div><p>hi</p></body></html>'
+        )
+
+    def test_skip_assets_already_in_head(self):
+        tree = page(div('x', requires=['a.css', 'b.js']),
+                    head_children=[link(rel='stylesheet', href='a.css')])
+        html = render_with_assets(tree)
+        assert html.count('a.css') == 1
+        assert html.index('b.js') < html.index('</head>')
+
+    def test_head_component(self):
+        tree = HTML5([Head('Title', stylesheets=['a.css']),
+                      body(div(requires=['a.css', 'b.css']))])
+        html = render_with_assets(tree)
+        assert html.count('a.css') == 1
+        assert html.index('b.css') < html.index('</head>')
+
+    def test_output_matches_regular_render(self):
+        tree = page(div([p('a'), 'b & c']), head_children=[title('x')])
+        assert render_with_assets(tree) == str(tree)
+
+    def test_fragment_without_head(self):
+        assert render_with_assets(div('x', requires=['a.js'])) == \
+            '<script src="a.js"></script><div>x</div>'
+
+
+class TestAssetManifest:
+    def test_render_is_cached(self):
+        manifest = AssetManifest({'app': ['app.css', 'app.js'], 'extra': 'x.js'})
+        first = manifest.render('app', 'extra')
+        second = manifest.render('app', 'extra')
+        assert first is not second
+        assert first.children[0] is not second.children[0]
+        assert manifest._cache[('app', 'extra')][0] is not first.children[0]
+        assert [x.tag for x in first.walk() if x.is_element] == ['link', 'script', 'script']
+        assert str(first) == (
+            '<link rel="stylesheet" href="app.css"></link>'
+            '<script src="app.js"></script><script src="x.js"></script>'
+        )
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError):
+            AssetManifest({'app': 'app.css'}).render('missing')
+
+    def test_explicit_type(self):
+        manifest = AssetManifest({'font': {'url': '//fonts/css?family=Foo', 'type': 'css'}})
+        assert manifest.urls('font') == ['//fonts/css?family=Foo']
+        assert manifest.elements('font')[0].tag == 'link'
+
+    def test_load_json_and_integrity(self, tmpdir):
+        tmpdir.join('static', 'app.css').write('body {}', ensure=True)
+        tmpdir.join('manifest.json').write(json.dumps({
+            'assets': {'app': ['/static/app.css', '/static/app.js']},
+            'integrity': {'/static/app.js': 'sha384-abc'},
+        }))
+        manifest = AssetManifest.load(str(tmpdir.join('manifest.json')))
+        manifest.add_integrity(str(tmpdir))
+        html = str(manifest.render('app'))
+        digest = file_integrity(str(tmpdir.join('static', 'app.css')))
+        assert digest.startswith('sha384-')
+        assert f'integrity="{digest}" crossorigin="anonymous"' in html
+        assert 'integrity="sha384-abc"' in html
+
+    def test_semantic_cdn_components(self):
+        from hyperpython.contrib.semantic import cdn
+
+        assert 'semantic.min.css' in str(cdn())
+        html = str(cdn(['button', 'modal', 'site'], exclude=['modal']))
+        assert 'site.min.css' in html and 'button.min.css' in html
+        assert 'modal' not in html
+        assert html.index('site.min.css') < html.index('button.min.css')
+
+    def test_semantic_manifest_is_not_shared(self, tmpdir):
+        from hyperpython.contrib.semantic.cdn import cdn_link, manifest
+
+        tmpdir.join('2.4.1', 'semantic.min.css').write('body {}', ensure=True)
+        copy = manifest('/cdn')
+        copy.add_integrity(str(tmpdir), base_url='/cdn')
+        assert 'integrity=' in str(copy.render('all'))
+        assert 'integrity=' not in str(manifest('/cdn').render('all'))
+        assert 'integrity=' not in str(cdn_link('all', prefix='/cdn')[1])
+
+    def test_semantic_cdn_font_is_deprecated(self):
+        from hyperpython.contrib.semantic.cdn import cdn_font, cdn_link, prefix, version
+
+        with pytest.warns(DeprecationWarning):
+            elem = cdn_font(prefix, version, 'basic', 'icons', 'woff')
+        assert elem == cdn_link('theme-basic')[-1]
+        with pytest.warns(DeprecationWarning), pytest.raises(ValueError):
+            cdn_font(prefix, version, 'basic', 'icons', 'otf')
+
+    def test_assets_in_manifest_are_not_repeated(self):
+        manifest = AssetManifest({'app': 'app.css'})
+        tree = page(div(requires=['app.css']), head_children=[manifest.render('app')])
+        assert str(render_with_assets(tree)).count('app.css') == 1
@@ -0,0 +1,54 @@
+import pytest
+
+from hyperpython import fragment, FragmentNotFound
+from hyperpython.benchmarks import WORKLOADS, SCALING_WORKLOADS, run_benchmark, compare
+from hyperpython.benchmarks import run_scaling
+from hyperpython.benchmarks.__main__ import main
+
+
+@pytest.mark.parametrize('cls', WORKLOADS, ids=lambda cls: cls.name)
+def test_workloads_run(cls):
+    result = run_benchmark(cls(size=5), min_time=0.001, repeat=1)
+    assert result['ops'] > 0
+    assert result['peak'] >= 0
+    assert result['size'] == 5
+
+
+@pytest.mark.parametrize('cls', [x for x in WORKLOADS if x.name.startswith('fragment.')],
+                         ids=lambda cls: cls.name)
+def test_fragment_workload_restores_registry(cls):
+    run_benchmark(cls(size=5), min_time=0.001, repeat=1)
+    with pytest.raises(FragmentNotFound):
+        fragment('benchmark.simple-0')
+
+
+def test_compare_detects_regressions():
+    baseline = {'a': {'ops': 100, 'size': 1}, 'b': {'ops': 100, 'size': 1}}
+    results = {'a': {'ops': 50, 'size': 1}, 'b': {'ops': 120, 'size': 1}}
+    assert compare(results, baseline) == [('a', 0.5, True), ('b', 1.2, False)]
+
+
+def test_command_line_saves_and_compares_baseline(tmpdir, capsys):
+    path = str(tmpdir.join('baseline.json'))
+    opts = ['deep_tree', '--size', '3', '--min-time', '0.001', '--repeat', '1']
+    assert main([*opts, '--save', path]) == 0
+    main([*opts, '--compare', path, '--tolerance', '1'])
+    out = capsys.readouterr().out
+    assert 'deep_tree.render' in out
+    assert 'x' in out.splitlines()[-1]
+
+
+@pytest.mark.parametrize('cls', SCALING_WORKLOADS, ids=lambda cls: cls.name)
+def test_scaling_workloads_run(cls):
+    result = run_scaling(cls, threads=(1, 2), min_time=0.01, size=3)
+    assert set(result['ops']) == {1, 2}
+    assert result['efficiency'][1] == 1.0
+    assert all(ops > 0 for ops in result['ops'].values())
+
+
+def test_command_line_scaling(capsys):
+    opts = ['deep_tree', '--size', '3', '--min-time', '0.01', '--threads', '1,2']
+    assert main(opts) == 0
+    out = capsys.readouterr().out
+    assert '2 threads' in out
+    assert 'GIL' in out
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from hyperpython.contrib import chota
+
+
+class TestTheme:
+    def test_theme_css(self):
+        css = chota.theme_css(grid_gutter='2rem', color_primary='red')
+        assert css == ':root {\n  --color-primary: red;\n  --grid-gutter: 2rem;\n}'
+
+    def test_options_are_cached(self):
+        style = chota.options(color_primary='red', font_size='18px')
+        other = chota.options(font_size='18px', color_primary='red')
+        assert style.tag == 'style' and style is not other
+        assert style.children[0] is other.children[0]
+        html = str(style)
+        assert html.startswith('<style>:root {') and html.endswith('}</style>')
+
+    def test_invalid_options(self):
+        with pytest.raises(TypeError):
+            chota.options(color='red')
+        with pytest.raises(TypeError):
+            chota.options(font_size=None)
+        with pytest.raises(ValueError):
+            chota.options(color_primary='red} body {display: none')
+
+    def test_cdn_inlines_theme(self):
+        html = str(chota.cdn(color_primary='red'))
+        assert 'unpkg.com/chota' in html
+        assert '--color-primary: red;' in html
+        assert '<style>' not in str(chota.cdn())
+
+    def test_cdn_writes_static_file(self, tmpdir):
+        static = str(tmpdir.join('static'))
+        html = str(chota.cdn(static_dir=static, static_url='/s/', color_primary='red'))
+        files = os.listdir(static)
+        assert len(files) == 1
+        assert f'href="/s/{files[0]}"' in html
+        assert files[0] == chota.write_css(static, color_primary='red')
+        assert files[0] != chota.write_css(static, color_primary='blue')
+        with open(os.path.join(static, files[0])) as fd:
+            assert fd.read() == chota.theme_css(color_primary='red')
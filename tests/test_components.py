@@ -1,14 +1,17 @@
+from contextlib import contextmanager
+
 import pytest
 import sidekick as sk
 from mock import Mock
 
-from hyperpython import Text, html, render, p
+from hyperpython import Text, Block, html, render, p, div, h, link
 from hyperpython.components import (
     hyperlink, html_table, html_list, html_map, a_or_p,
-    a_or_span, fa_icon, page
+    a_or_span, fa_icon, page, SvgIcons
 )
 from hyperpython.components.hyperlinks import split_link
 from hyperpython.core import as_child, Blob
+from hyperpython.utils.cache import LRUCache
 
 
 class CustomType:
@@ -73,8 +76,8 @@ class TestRender:
 
 # noinspection PyShadowingNames
 class TestDjangoRenderer:
-    @pytest.yield_fixture
-    def model_class(self):
+    @pytest.fixture
+    def model_class(self, monkeypatch):
         import sys
 
         class Base:
@@ -83,12 +86,10 @@ class TestDjangoRenderer:
         class Model(Base):
             _meta = sk.record(app_label='app', model_name='model')
 
-        sys.modules['django.db.models'] = sk.record(Model=Base)
-        sys.modules['django.template.loader'] = sk.record(get_template=Mock())
-        try:
-            yield Model
-        finally:
-            del sys.modules['django.db.models']
+        html_module = sys.modules[html.__module__]
+        monkeypatch.setitem(sys.modules, 'django.db.models', sk.record(Model=Base))
+        monkeypatch.setattr(html_module, 'django_loader', sk.record(get_template=Mock()))
+        return Model
 
     def test_render_django_model(self, model_class):
         @html.register_template(model_class, 'example.html', role='simple')
@@ -104,6 +105,141 @@ class TestDjangoRenderer:
             html('foo', 'bad-role')
 
 
+class FakeContext:
+    def __init__(self, request=None, autoescape=True):
+        self.dicts = [{'request': request}]
+        self.autoescape = autoescape
+
+    def __getitem__(self, key):
+        for dic in reversed(self.dicts):
+            if key in dic:
+                return dic[key]
+        raise KeyError(key)
+
+    @contextmanager
+    def push(self, data):
+        self.dicts.append(data)
+        try:
+            yield self
+        finally:
+            self.dicts.pop()
+
+
+class FakeTemplate:
+    def __init__(self):
+        self.calls = 0
+        self.engine_calls = 0
+        self.contexts = []
+        engine = sk.record(autoescape=False)
+        self.template = sk.record(render=self._engine_render, engine=engine)
+
+    def render(self, context, request=None):
+        self.calls += 1
+        return f'<p>{context["name"]}</p>'
+
+    def _engine_render(self, context):
+        self.engine_calls += 1
+        self.contexts.append(context)
+        return f'<p>{context["name"]}</p>'
+
+
+# noinspection PyShadowingNames
+class TestTemplateCache:
+    @pytest.fixture
+    def template(self, monkeypatch):
+        import sys
+
+        template = FakeTemplate()
+        html_module = sys.modules[html.__module__]
+        loader = sk.record(get_template=lambda name: template)
+        context = sk.record(make_context=lambda ctx, request, **kwargs: FakeContext(request, **kwargs))
+        monkeypatch.setattr(html_module, 'django_loader', loader)
+        monkeypatch.setitem(sys.modules, 'django.template.context', context)
+        return template
+
+    def register(self, role, **kwargs):
+        class User(sk.Record):
+            name: str
+            pk: int
+
+        @html.register_template(User, 'user.html', role, **kwargs)
+        def renderer(user, request=None, **kwargs):
+            ctx = {'name': user.name, 'pk': user.pk}
+            if request is not None:
+                ctx['request'] = request
+            return ctx
+
+        return User, renderer
+
+    def test_cache_output(self, template):
+        User, renderer = self.register('cached', cache_key=lambda ctx: ctx['pk'])
+        assert html(User('john', 1), 'cached') == Blob('<p>john</p>')
+        assert html(User('john', 1), 'cached') == Blob('<p>john</p>')
+        assert html(User('mary', 2), 'cached') == Blob('<p>mary</p>')
+        assert template.calls == 2
+        renderer.cache.clear()
+        html(User('john', 1), 'cached')
+        assert template.calls == 3
+
+    def test_cache_whole_context(self, template):
+        User, renderer = self.register('cached-ctx', cache_key=True, maxsize=1)
+        html(User('john', 1), 'cached-ctx')
+        html(User('john', 1), 'cached-ctx')
+        html(User('mary', 2), 'cached-ctx')
+        html(User('john', 1), 'cached-ctx')
+        assert template.calls == 3
+
+    def test_whole_context_key_skips_cache_with_request(self, template):
+        User, renderer = self.register('cached-request', cache_key=True)
+        html(User('john', 1), 'cached-request', request=object())
+        html(User('john', 1), 'cached-request', request=object())
+        assert template.calls == 2
+        assert len(renderer.cache) == 0
+
+    def test_unhashable_key_is_not_cached(self, template):
+        User, renderer = self.register('unhashable', cache_key=lambda ctx: [ctx['pk']])
+        html(User('john', 1), 'unhashable')
+        html(User('john', 1), 'unhashable')
+        assert template.calls == 2
+
+    def test_cache_key_errors_propagate(self, template):
+        User, renderer = self.register('bad-key', cache_key=lambda ctx: ctx['name'] + 1)
+        with pytest.raises(TypeError):
+            html(User('john', 1), 'bad-key')
+
+    def test_cache_ttl(self, template):
+        clock = [0]
+        cache = LRUCache(ttl=10, timer=lambda: clock[0])
+        User, renderer = self.register('ttl', cache_key=lambda ctx: ctx['pk'], cache=cache)
+        html(User('john', 1), 'ttl')
+        clock[0] = 5
+        html(User('john', 1), 'ttl')
+        assert template.calls == 1
+        clock[0] = 11
+        html(User('john', 1), 'ttl')
+        assert template.calls == 2
+
+    def test_no_cache_by_default(self, template):
+        User, renderer = self.register('uncached')
+        html(User('john', 1), 'uncached')
+        html(User('john', 1), 'uncached')
+        assert template.calls == 2
+        assert renderer.cache is None
+
+    def test_render_many_reuses_context(self, template):
+        User, renderer = self.register('many', cache_key=lambda ctx: ctx['pk'])
+        users = [User('john', 1), User('mary', 2), User('john', 1)]
+        block = renderer.render_many(users)
+        assert str(block) == '<p>john</p><p>mary</p><p>john</p>'
+        assert template.engine_calls == 2
+        assert template.calls == 0
+
+    def test_render_many_uses_engine_autoescape(self, template):
+        User, renderer = self.register('many-autoescape')
+        renderer.render_many([User('john', 1)])
+        assert template.contexts[0].autoescape is False
+
+
 class TestHyperlink:
     """
     Tests functions on bricks.helpers.hyperlink
@@ -178,3 +314,144 @@ class TestPageHead:
         assert '<title>My Page</title>' in head_html
         assert head_html.startswith('<head>')
         assert head_html.endswith('</head>')
+        assert '<script>' in head_html
+
+    def test_static_parts_are_cached(self):
+        first = page.Head('First', stylesheets=['a.css'], scripts=['a.js'])
+        second = page.Head('Second', stylesheets=['a.css'], scripts=['a.js'])
+        other = page.Head('Other', stylesheets=['b.css'])
+        parts = lambda head: [str(x) for x in head.static_parts()]
+        parts(first)
+        hits = page._HEAD_CACHE.hits
+        assert parts(second) == parts(first)
+        assert page._HEAD_CACHE.hits == hits + 2
+        assert parts(other) != parts(first)
+        assert '<title>Second</title>' in str(second)
+        assert '<meta property="og:title" content="Second">' in str(second)
+
+    def test_cached_output_matches_uncached(self):
+        class UncachedHead(page.Head):
+            cache_static = False
+
+        kwargs = dict(
+            og_title='OG <title>',
+            stylesheets=['a.css'],
+            scripts=['a.js'],
+            favicons={57: '/icon-57.ico', 'default': '/icon.ico'},
+            meta_values={'refresh': '30'},
+            meta_properties={'fb:app_id': '1'},
+        )
+        assert str(page.Head('Page', **kwargs)) == str(UncachedHead('Page', **kwargs))
+
+    def test_static_parts_are_elements(self):
+        first = page.Head('First', stylesheets=['a.css'])
+        second = page.Head('Second', stylesheets=['a.css'])
+        links = [x for x in first.walk() if x.is_element and x.tag == 'link']
+        assert links == [link(rel='stylesheet', href='a.css')]
+        links[0].attrs['href'] = 'b.css'
+        assert 'href="a.css"' in str(second)
+        assert 'href="b.css"' in str(first)
+
+    def test_static_parts_render_cached_html(self):
+        head = page.Head('Page', stylesheets=['a.css'])
+        html = str(head)
+        parts = [x for x in head._tree.children if isinstance(x, Block)]
+        assert len(parts) == 3
+        assert all('children' not in vars(x) for x in parts)
+        assert html.count('<link rel="stylesheet" href="a.css"></link>') == 1
+
+    def test_static_key_uses_all_settings(self):
+        class ThemedHead(page.Head):
+            theme = 'light'
+
+            def css_tags(self):
+                return [link(rel='stylesheet', href=self.theme + '.css')]
+
+        assert 'light.css' in str(ThemedHead('Page'))
+        assert 'dark.css' in str(ThemedHead('Page', theme='dark'))
+        assert 'light.css' in str(ThemedHead('Page', theme='light'))
+
+    def test_unhashable_settings(self):
+        head = page.Head('Page', meta_headers={'keywords': ['a', 'b']})
+        assert '<title>Page</title>' in str(head)
+
+
+class TestFontAwesomeIcons:
+    def test_collection_lookup(self):
+        from hyperpython.components.fa_icons import icon_collection
+
+        assert icon_collection('github') == 'fab'
+        assert icon_collection('address-book') == 'fa'
+        assert icon_collection('not-an-icon') == 'fa'
+
+    def test_legacy_tables(self):
+        from hyperpython.components import fa_icons
+
+        assert fa_icons.COLLECTIONS['github'] == 'fab'
+        assert fa_icons.LIB_ICONS['solid'] == fa_icons.icon_names('fa')
+        assert 'github' in fa_icons.LIB_ICONS['brand']
+
+
+class TestSvgIcons:
+    @pytest.fixture
+    def icons(self, tmpdir):
+        tmpdir.join('star.svg').write(
+            '<?xml version="1.0"?>\n'
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">'
+            '<path d="M1 1"/></svg>'
+        )
+        tmpdir.join('user.svg').write('<svg viewBox="0 0 16 16"><circle r="8"/></svg>')
+        return SvgIcons(str(tmpdir))
+
+    def test_icon_references_symbol(self, icons):
+        assert str(icons.icon('star')) == (
+            '<svg class="icon icon-star"><use href="#icon-star"></use></svg>'
+        )
+        assert str(icons.icon('star', href='#')).startswith('<a href="#"><svg')
+
+        with pytest.raises(ValueError):
+            icons.icon('../secret')
+
+    def test_symbol_is_cached(self, icons, tmpdir):
+        symbol = icons.symbol('star')
+        assert symbol == '<symbol id="icon-star" viewBox="0 0 24 24"><path d="M1 1"/></symbol>'
+        tmpdir.join('star.svg').remove()
+        assert icons.symbol('star') == symbol
+
+    def test_sprite_deduplicates_symbols(self, icons):
+        tree = div([icons.icon('star'), icons.icon('user'), icons.icon('star')])
+        assert icons.used_icons(tree) == ['star', 'user']
+        sprite = str(icons.sprite(tree))
+        assert sprite.startswith('<svg xmlns="http://www.w3.org/2000/svg" style="display:none">')
+        assert sprite.count('<symbol') == 2
+
+    def test_inject_sprite_in_body(self, icons):
+        page = h('html', [h('head'), h('body', [p('hi'), icons.icon('user')])])
+        icons.inject(page)
+        body = page.children[1]
+        assert body.children[0].startswith('<svg xmlns')
+        assert 'id="icon-user"' in body.children[0]
+
+        block = icons.inject(div(icons.icon('star')))
+        assert isinstance(block, Block) and len(block) == 2
+
+    def test_icons_in_nested_blocks(self, icons):
+        tree = div([p('x'), Block([icons.icon('star'), Block([icons.icon('user')])])])
+        assert icons.used_icons(tree) == ['star', 'user']
+        page = h('html', [h('body', [tree])])
+        icons.inject(page)
+        sprite = page.children[0].children[0]
+        assert 'id="icon-star"' in sprite and 'id="icon-user"' in sprite
+
+    def test_render_collects_icons(self, icons):
+        def make_page():
+            content = div([Block([icons.icon('user')]), icons.icon('star')])
+            return h('html', [h('head'), h('body', [p('hi'), content])])
+
+        page = make_page()
+        html = icons.render(page)
+        assert html == str(icons.inject(make_page()))
+        assert html.index('<symbol id="icon-user"') < html.index('<p>hi</p>')
+        assert str(page).count('<symbol') == 0
+        assert icons.render(div('no icons')) == '<div>no icons</div>'
+        assert str(icons.render(icons.icon('star'))).startswith('<svg xmlns')
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from hyperpython import html, p, render_context
+from hyperpython.context import context_value, get_context, iter_in_context
+
+
+class Greeting:
+    pass
+
+
+@html.register(Greeting, 'localized')
+def greeting(obj, **kwargs):
+    return p('Olá' if context_value('locale') == 'pt' else 'Hello')
+
+
+class TestRenderContext:
+    def test_nested_contexts(self):
+        with render_context(locale='pt', user='john'):
+            with render_context(locale='en') as ctx:
+                assert ctx == {'locale': 'en', 'user': 'john'}
+            assert context_value('locale') == 'pt'
+        assert get_context() == {}
+
+    def test_renderers_read_context(self):
+        assert html(Greeting(), 'localized') == p('Hello')
+        with render_context(locale='pt'):
+            assert html(Greeting(), 'localized') == p('Olá')
+
+    def test_restored_on_errors(self):
+        try:
+            with render_context(locale='pt'):
+                raise ValueError
+        except ValueError:
+            pass
+        assert context_value('locale') is None
+
+    def test_isolated_between_asyncio_tasks(self):
+        async def render(locale):
+            with render_context(locale=locale):
+                await asyncio.sleep(0.01)
+                first = str(html(Greeting(), 'localized'))
+                await asyncio.sleep(0)
+                return first, context_value('locale')
+
+        async def main():
+            return await asyncio.gather(*(render(loc) for loc in ['pt', 'en'] * 5))
+
+        results = asyncio.run(main())
+        assert results == [('<p>Olá</p>', 'pt'), ('<p>Hello</p>', 'en')] * 5
+
+    def test_isolated_between_threads(self):
+        barrier = threading.Barrier(4)
+
+        def render(locale):
+            with render_context(locale=locale):
+                barrier.wait()
+                return str(html(Greeting(), 'localized'))
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(render, ['pt', 'en', 'pt', 'en']))
+        assert results == ['<p>Olá</p>', '<p>Hello</p>'] * 2
+
+    def test_iter_in_context(self):
+        def chunks():
+            yield context_value('locale')
+            yield context_value('locale')
+
+        it = iter_in_context(chunks(), locale='pt')
+        assert next(it) == 'pt'
+        assert context_value('locale') is None
+        with render_context(locale='en'):
+            assert next(it) == 'pt'
@@ -0,0 +1,115 @@
+import json
+import random
+
+import pytest
+
+import hyperpython
+from hyperpython import div, p, ul, li, span, Text, Block, Component
+from hyperpython.core import Blob
+from hyperpython.diff import diff, patch, structural_hash
+
+
+def items(*keys, text=str):
+    return ul(class_='list')[[li(text(k), key=k) for k in keys]]
+
+
+class Card(Component):
+    def __init__(self, title):
+        self.title = title
+
+    def html(self):
+        return div(class_='card')[p(self.title)]
+
+
+class TestStructuralHash:
+    def test_equal_trees_have_equal_hashes(self):
+        assert structural_hash(div(class_='a')['x']) == structural_hash(div(class_='a')['x'])
+        assert structural_hash(Card('x')) == structural_hash(div(class_='card')[p('x')])
+
+    def test_different_trees(self):
+        assert structural_hash(div('x')) != structural_hash(div('y'))
+        assert structural_hash(div('x')) != structural_hash(span('x'))
+        assert structural_hash(Text('<b>')) != structural_hash(Blob('<b>'))
+
+    def test_memo_caches_subtrees(self):
+        memo = {}
+        child = p('foo')
+        tree = div([child])
+        structural_hash(tree, memo)
+        assert memo[id(child)] == structural_hash(p('foo'))
+
+
+class TestDiff:
+    def test_equal_trees(self):
+        assert diff(div(class_='a')['x'], div(class_='a')['x']) == []
+
+    def test_attributes(self):
+        old = div(class_='a', id='x', title='t')
+        new = div(class_=['a', 'b'], id='x', hidden=True)
+        assert diff(old, new) == [
+            ['attr', [], 'class', ['a', 'b']],
+            ['attr', [], 'hidden', True],
+            ['unattr', [], 'title'],
+        ]
+
+    def test_text_and_replace(self):
+        old = div([p('foo'), span('bar')])
+        new = div([p('baz'), div('bar')])
+        assert diff(old, new) == [
+            ['text', [0, 0], 'baz'],
+            ['replace', [1], ['div', 'bar']],
+        ]
+
+    def test_positional_children(self):
+        assert diff(div([p('a')]), div([p('a'), p('b')])) == [
+            ['insert', [], 1, ['p', 'b']],
+        ]
+        assert diff(div([p('a'), p('b'), p('c')]), div([p('a')])) == [
+            ['remove', [], 2],
+            ['remove', [], 1],
+        ]
+
+    def test_keyed_children_use_moves(self):
+        ops = diff(items(1, 2, 3, 4, 5), items(2, 3, 4, 5, 1))
+        assert ops == [['move', [], 0, 4]]
+
+    def test_keyed_insert_and_remove(self):
+        ops = diff(items(1, 2, 3), items(1, 4, 3))
+        assert ops == [
+            ['remove', [], 1],
+            ['insert', [], 1, ['li', {'key': 4}, '4']],
+        ]
+
+    def test_operations_are_json_serializable(self):
+        ops = diff(Block([items(1, 2), 'x']), Block([items(2, 1, 3), Blob('<b>y</b>')]))
+        assert json.loads(json.dumps(ops)) == ops
+
+    def test_components(self):
+        assert diff(Card('foo'), Card('bar')) == [['text', [0, 0], 'bar']]
+
+    def test_exported_as_function(self):
+        assert hyperpython.diff is diff
+        assert hyperpython.diff(div('a'), div('b')) == [['text', [0], 'b']]
+
+    def test_patch_invalid_operation(self):
+        with pytest.raises(ValueError):
+            patch(div(), [['bad', []]])
+
+    @pytest.mark.parametrize('seed', range(50))
+    def test_patch_roundtrip_keyed(self, seed):
+        rnd = random.Random(seed)
+        old_keys = rnd.sample(range(60), rnd.randint(0, 40))
+        new_keys = rnd.sample(range(60), rnd.randint(0, 40))
+        old = items(*old_keys)
+        new = items(*new_keys, text=lambda k: str(k * rnd.randint(1, 2)))
+        assert str(patch(old, diff(old, new))) == str(new)
+
+    @pytest.mark.parametrize('old, new', [
+        (div([p('a'), 'b']), div([p('a', class_='x'), 'c', span('d')])),
+        (div([p('a'), span('b'), 'c']), div(['c'])),
+        (div('a'), span('a')),
+        (Text('a'), Text('b')),
+        (Block([p('a')]), Block([p('b'), p('c')])),
+    ])
+    def test_patch_roundtrip(self, old, new):
+        assert str(patch(old, diff(old, new))) == str(new)
@@ -0,0 +1,126 @@
+import pytest
+
+django_test = pytest.importorskip('django.test')
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(
+        DEBUG=True,
+        SECRET_KEY='secret',
+        ROOT_URLCONF=__name__,
+        ALLOWED_HOSTS=['testserver'],
+        MIDDLEWARE=[],
+        INSTALLED_APPS=[],
+        TEMPLATES=[{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': [('django.template.loaders.locmem.Loader', {
+                    'request-path.html': '<p>{{ request.path }}{{ name }}</p>',
+                })],
+                'context_processors': ['django.template.context_processors.request'],
+            },
+        }],
+    )
+    import django  # noqa: E402
+
+    django.setup()
+
+from django.urls import path  # noqa: E402
+
+from hyperpython import HTML5, head, body, title, p, Component, html  # noqa: E402
+from hyperpython.context import context_value, render_context  # noqa: E402
+from hyperpython.django import HyperpythonStreamingResponse, stream, tree_etag  # noqa: E402
+
+
+def page(text='Hello!'):
+    return HTML5([head(title('Title')), body(p(text))])
+
+
+def stream_view(request):
+    return HyperpythonStreamingResponse(page())
+
+
+def etag_view(request):
+    return stream(request, page(request.GET.get('text', 'Hello!')), etag=True)
+
+
+class RequestPath(Component):
+    def html(self):
+        return p(context_value('request').path)
+
+
+def context_view(request):
+    return stream(request, RequestPath(), etag='etag' in request.GET)
+
+
+class Visit:
+    name = ''
+
+
+@html.register_template(Visit, 'request-path.html', 'request-path', cache_key=True)
+def visit_request_path(visit, **kwargs):
+    return {'name': visit.name}
+
+
+urlpatterns = [
+    path('stream/', stream_view),
+    path('etag/', etag_view),
+    path('context/', context_view),
+]
+
+
+@pytest.fixture
+def client():
+    return django_test.Client()
+
+
+class TestStreamingResponse:
+    def test_stream_page(self, client):
+        response = client.get('/stream/')
+        assert response.status_code == 200
+        assert response.streaming
+        chunks = list(response.streaming_content)
+        assert chunks[0] == b'<!DOCTYPE html><html><head><title>Title</title></head>'
+        assert b''.join(chunks).endswith(b'<body><p>Hello!</p></body></html>')
+        assert response['Content-Type'] == 'text/html; charset=utf-8'
+
+    def test_conditional_get(self, client):
+        response = client.get('/etag/')
+        etag = response['ETag']
+        assert etag == tree_etag(page())
+        assert client.get('/etag/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        changed = client.get('/etag/?text=changed', HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == 200
+        assert changed['ETag'] != etag
+
+    def test_request_in_render_context(self, client):
+        response = client.get('/context/')
+        assert b''.join(response.streaming_content) == b'<p>/context/</p>'
+        response = client.get('/context/?etag=1')
+        assert b''.join(response.streaming_content) == b'<p>/context/</p>'
+
+
+class TestTreeEtag:
+    def test_stable_etag(self):
+        assert tree_etag(page()) == tree_etag(page())
+        assert tree_etag(page()) != tree_etag(page('other'))
+        assert tree_etag(page()).startswith('"')
+
+
+class TestRegisterTemplate:
+    def test_whole_context_cache_does_not_leak_between_requests(self):
+        factory = django_test.RequestFactory()
+        for url in ['/one', '/two']:
+            with render_context(request=factory.get(url)):
+                assert str(html(Visit(), 'request-path')) == f'<p>{url}</p>'
+            request = factory.get(url)
+            block = visit_request_path.render_many([Visit()], request=request)
+            assert str(block) == f'<p>{url}</p>'
+        assert len(visit_request_path.cache) == 0
+
+    def test_whole_context_cache_without_request(self):
+        assert str(html(Visit(), 'request-path')) == '<p></p>'
+        assert str(html(Visit(), 'request-path')) == '<p></p>'
+        assert len(visit_request_path.cache) == 1
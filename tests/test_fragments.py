@@ -1,8 +1,30 @@
+import threading
+
 import pytest
 
 from hyperpython import fragment, div, FragmentNotFound
 
 
+def run_threads(targets):
+    """
+    Run each target in its own thread and return the exceptions they raised.
+    """
+    errors = []
+
+    def run(target):
+        try:
+            target()
+        except Exception as ex:  # pragma: no cover
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return errors
+
+
 @pytest.fixture(scope='session')
 def fragments():
     @fragment.register('header')
@@ -50,3 +72,21 @@ class TestFragmentAPI:
     def test_fragment_error(self):
         with pytest.raises(FragmentNotFound):
             fragment('not-found')
+
+    def test_concurrent_register_and_lookup(self, fragments):
+        def register(n):
+            for i in range(50):
+                fragment.register(f'thread-{n}-{i}')(lambda: div('ok'))
+                fragment.register(f'thread-{n}-{i}/<int:x>')(lambda x: div(x))
+
+        def lookup():
+            for _ in range(200):
+                assert fragment('header') == div('header')
+                assert fragment('number/1') == div('number: 2')
+
+        targets = [lambda n=n: register(n) for n in range(4)] + [lookup] * 4
+        errors = run_threads(targets)
+
+        assert errors == []
+        assert fragment('thread-3-49') == div('ok')
+        assert fragment('thread-0-10/42') == div(42)
@@ -0,0 +1,72 @@
+import pytest
+
+from hyperpython import div, span, hyperjson
+from hyperpython.contrib import milligram, skeleton
+from hyperpython.contrib.grid import Grid
+from hyperpython.diff import diff, patch
+from hyperpython.renderers import iter_render
+
+
+class TestGrid:
+    def test_matches_row_and_column_elements(self):
+        data = [['a', 'b'], ['c', 'd']]
+        expected = milligram.container(*(
+            milligram.row(*(milligram.column(x, size=50) for x in row))
+            for row in data
+        ))
+        assert str(milligram.grid(data, size=50)) == str(expected)
+
+    def test_cell_renderer_and_escaping(self):
+        grid = Grid([['<b>', 'x']], cell=lambda x: span(x), column_class=['a', 'b'])
+        assert str(grid) == (
+            '<div class="row"><div class="a"><span>&lt;b&gt;</span></div>'
+            '<div class="b"><span>x</span></div></div>'
+        )
+
+    def test_renders_in_batches(self):
+        grid = Grid([[i] for i in range(10)], batch_size=4, container_class='c')
+        chunks = list(grid.iter_chunks())
+        assert len(chunks) == 3
+        assert ''.join(chunks) == grid.render()
+        assert chunks[0].startswith('<div class="c">')
+        assert chunks[-1].endswith('</div></div>')
+
+    def test_streaming_consumes_batches(self):
+        grid = Grid(([i] * 3 for i in range(100)), batch_size=10)
+        tree = div([grid])
+        chunks = list(iter_render(tree, chunk_size=100))
+        assert len(chunks) > 5
+        assert ''.join(chunks).count('<div class="column">') == 300
+
+    def test_streaming_does_not_build_tree(self):
+        grid = Grid([[1, 2]])
+        assert ''.join(iter_render(div([grid]))) == str(div([grid]))
+        assert '_tree' not in vars(grid)
+
+    def test_hyperjson(self):
+        grid = Grid([['a', 'b'], ['c']], cell=span, container_class='c')
+        data = hyperjson.to_data(grid)
+        assert data[0] == 'div'
+        assert hyperjson.loads(hyperjson.dumps(grid)).render() == grid.render()
+        assert str(hyperjson.from_data(data)) == str(grid)
+        assert grid.json()['tag'] == 'div'
+
+    def test_diff(self):
+        old = Grid([['a', 'b'], ['c']])
+        new = Grid([['a', 'x'], ['c']])
+        assert diff(old, new) == [['text', [0, 1, 0], 'x']]
+        assert str(patch(old._tree.copy(), diff(old, new))) == str(new)
+
+    def test_milligram_validates_once(self):
+        with pytest.raises(ValueError):
+            milligram.grid([[1]], size=42)
+
+    def test_milligram_row_options(self):
+        assert str(milligram.row(padding=False, wrap=True)) == \
+            '<div class="row row-no-padding row-wrap"></div>'
+        assert str(milligram.row()) == '<div class="row"></div>'
+
+    def test_skeleton_shares_columns_equally(self):
+        html = str(skeleton.grid([[1, 2, 3], [4]], container=False))
+        assert html.count('four columns') == 3
+        assert html.count('twelve columns') == 1
@@ -0,0 +1,78 @@
+import io
+import json
+
+import pytest
+
+from hyperpython import div, p, h1, br, a, Text, Block, Json, Component, hyperjson
+from hyperpython.core import Blob
+
+
+class Card(Component):
+    def html(self):
+        return div(class_='card')['hello']
+
+
+class TestHyperJSON:
+    def test_encode_element(self):
+        elem = div(class_='foo')[h1('Title'), p('Hello world!')]
+        assert hyperjson.dumps(elem) == \
+            '["div",{"class":["foo"]},[["h1","Title"],["p","Hello world!"]]]'
+
+    def test_encode_attributes(self):
+        elem = a(href='url', class_=(), disabled=False, data_n=1, data_x=True)['x']
+        assert json.loads(hyperjson.dumps(elem)) == \
+            ['a', {'href': 'url', 'data-n': 1, 'data-x': True}, 'x']
+        assert hyperjson.dumps(br) == '["br"]'
+
+    def test_encode_other_nodes(self):
+        block = Block([Text('<escaped>'), Blob('<b>raw</b>'), Json({'a': [1]})])
+        assert json.loads(hyperjson.dumps(block)) == \
+            {'body': ['<escaped>', {'raw': '<b>raw</b>'}, {'json': {'a': [1]}}]}
+        assert hyperjson.dumps(Card()) == '["div",{"class":["card"]},"hello"]'
+
+    def test_skipped_attributes_are_omitted(self):
+        for elem in [div(class_=()), div(class_=(), hidden=None)['x']]:
+            data = hyperjson.dumps(elem)
+            assert json.loads(data) == hyperjson.to_data(elem)
+            assert str(hyperjson.loads(data)) == str(elem)
+        assert hyperjson.dumps(div(class_=())) == '["div"]'
+
+    def test_is_compact(self):
+        elem = div(class_='foo')[h1('Title'), p('Hello world!')]
+        assert len(hyperjson.dumps(elem)) < len(json.dumps(elem.json()))
+
+    @pytest.mark.parametrize('tree', [
+        div(class_='foo', id='bar')[h1('Title'), p('Hello "world"!'), br],
+        Block([p('foo'), 'bar', Blob('<i>raw</i>'), Json([1, 2])]),
+        div([div([div('deep')])]),
+        div(class_=(), hidden=None)[p(title=False)],
+    ])
+    def test_roundtrip(self, tree):
+        data = hyperjson.dumps(tree)
+        new = hyperjson.loads(data)
+        assert type(new) is type(tree)
+        assert str(new) == str(tree)
+        assert hyperjson.dumps(new) == data
+
+    def test_stream_to_files(self):
+        tree = div(class_='foo')['olá']
+        text = io.StringIO()
+        hyperjson.dump(tree, text)
+        assert text.getvalue() == hyperjson.dumps(tree)
+
+        binary = io.BytesIO()
+        hyperjson.dump(tree, binary)
+        assert binary.getvalue() == hyperjson.dumps(tree).encode('utf8')
+
+        buf = bytearray()
+        hyperjson.dump(tree, buf)
+        assert hyperjson.load(io.BytesIO(buf)) == tree
+        assert hyperjson.loads(buf) == tree
+
+    def test_invalid_data(self):
+        with pytest.raises(ValueError):
+            hyperjson.loads('{"foo": 1, "bar": 2}')
+
+    def test_block_json(self):
+        assert Block([p('foo')]).json() == \
+            {'body': [{'tag': 'p', 'children': [{'text': 'foo'}]}]}
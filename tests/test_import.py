@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import hyperpython
+
+SRC_PATH = os.path.dirname(os.path.dirname(hyperpython.__file__))
+
+
+def run_python(code, *options):
+    env = dict(os.environ, PYTHONPATH=SRC_PATH)
+    cmd = [sys.executable, *options, '-c', code]
+    return subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+
+
+def imported_modules(statement):
+    """
+    Return a map of {module: cumulative import time in us} using
+    python -X importtime.
+    """
+    result = run_python(statement, '-X', 'importtime')
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImport:
+    def test_import_hyperpython_is_lazy(self):
+        modules = imported_modules('import hyperpython')
+        assert 'hyperpython' in modules
+        assert 'hyperpython.core' not in modules
+        assert 'hyperpython.tags' not in modules
+        assert 'sidekick' not in modules
+
+    def test_import_components_is_lazy(self):
+        modules = imported_modules('import hyperpython.components')
+        assert 'hyperpython.components.fa_icons' not in modules
+        assert 'hyperpython.components.page' not in modules
+
+    def test_accessing_names_load_modules(self):
+        code = (
+            'import sys, hyperpython as hp\n'
+            'assert "hyperpython.tags" not in sys.modules\n'
+            'print(hp.div("foo"))\n'
+            'assert "hyperpython.tags" in sys.modules\n'
+        )
+        assert run_python(code).stdout.strip() == '<div>foo</div>'
+
+    def test_function_names_are_not_shadowed_by_submodules(self):
+        code = (
+            'import hyperpython.fragment, hyperpython.html, hyperpython.diff\n'
+            'import hyperpython as hp\n'
+            'print(hp.html.__module__, hp.fragment.__module__, hp.diff.__module__)\n'
+        )
+        out = run_python(code).stdout.split()
+        assert out == ['hyperpython.html', 'hyperpython.fragment', 'hyperpython.diff']
+        assert callable(hyperpython.diff)
+
+    def test_public_names(self):
+        for name in hyperpython.__all__:
+            assert getattr(hyperpython, name) is not None
+        assert set(hyperpython.__all__) <= set(dir(hyperpython))
+
+        with pytest.raises(AttributeError):
+            print(hyperpython.not_a_name)
+
+    def test_star_import(self):
+        ns = {}
+        exec('from hyperpython import *', ns)
+        assert ns['div'] is hyperpython.div
+        assert ns['Element'] is hyperpython.Element
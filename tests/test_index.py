@@ -0,0 +1,117 @@
+import pytest
+
+from hyperpython import div, p, span, ul, li, a, Block, Component, TreeIndex
+
+
+class Item(Component):
+    def __init__(self, name):
+        self.name = name
+
+    def html(self):
+        return li(class_='item', id=self.name)[a(self.name, href='#' + self.name)]
+
+
+@pytest.fixture
+def tree():
+    return div(id='root', class_='page')[
+        ul(class_='menu')[Item('home'), Item('about')],
+        Block([p('intro', class_='lead text'), p('body', class_='text')]),
+        span(class_='text', hidden=True),
+    ]
+
+
+class TestTreeIndex:
+    def test_lookups(self, tree):
+        index = TreeIndex(tree)
+        assert index.by_id('root') is tree
+        assert index.by_id('about').children[0] == a('about', href='#about')
+        assert index.by_id('missing') is None
+        assert [x.tag for x in index.by_class('text')] == ['p', 'p', 'span']
+        assert [x.id for x in index.by_tag('li')] == ['home', 'about']
+        assert len(index) == 9
+
+    @pytest.mark.parametrize('selector, expected', [
+        ('p', ['intro', 'body']),
+        ('.text.lead', ['intro']),
+        ('div > p', ['intro', 'body']),
+        ('div a', ['home', 'about']),
+        ('ul > a', []),
+        ('#about a, p.lead', ['about', 'intro']),
+        ('p.lead, #about a', ['about', 'intro']),
+        ('[href="#home"]', ['home']),
+        ('span[hidden]', ['']),
+        ('*.menu li', ['home', 'about']),
+    ])
+    def test_select(self, tree, selector, expected):
+        label = lambda x: x.id or (x.children[0] if x.children else '')
+        assert [label(x) for x in TreeIndex(tree).select(selector)] == expected
+
+    def test_invalid_selector(self, tree):
+        with pytest.raises(ValueError):
+            TreeIndex(tree).select('p:first-child')
+
+    def test_tracks_new_children(self, tree):
+        index = TreeIndex(tree)
+        tree.add_child(div(id='new')[span(class_='x')])
+        tree[p(class_='x')]
+        block = tree.children[1]
+        block.add_child(span(class_='in-block'))
+        assert index.by_id('new').tag == 'div'
+        assert [x.tag for x in index.select('div .x')] == ['span', 'p']
+        assert index.select('div > .in-block')
+
+    def test_tracks_classes_and_ids(self, tree):
+        index = TreeIndex(tree)
+        elem = index.by_id('home')
+        elem.add_class('active')
+        assert index.by_class('active') == [elem]
+        elem.set_class('other')
+        assert index.by_class('active') == []
+        assert index.by_class('item') == [index.by_id('about')]
+        elem.id = 'start'
+        assert index.by_id('home') is None
+        assert index.by_id('start') is elem
+
+    def test_rebuild(self, tree):
+        index = TreeIndex(tree)
+        tree.children.pop()
+        index.rebuild()
+        assert index.by_tag('span') == []
+
+    def test_rebuild_detaches_removed_elements(self, tree):
+        index = TreeIndex(tree)
+        span = tree.children.pop()
+        assert span._index is index
+        index.rebuild()
+        assert span._index is None
+        assert tree._index is index
+
+    def test_close(self, tree):
+        index = TreeIndex(tree)
+        index.close()
+        assert tree._index is None
+        assert all(x._index is None for x in tree.walk())
+        tree.add_child(p(id='new'))
+        assert index.by_id('new') is None and len(index) == 0
+        index.rebuild()
+        assert index.by_id('new').tag == 'p'
+
+    def test_select_in_document_order_after_nested_insert(self, tree):
+        index = TreeIndex(tree)
+        index.by_id('home').add_child(p('nested', class_='text'))
+        labels = [x.children[0] for x in index.select('.text') if x.tag == 'p']
+        assert labels == ['nested', 'intro', 'body']
+
+    def test_several_indexes_share_elements(self, tree):
+        menu = tree.children[0]
+        page_index = TreeIndex(tree)
+        menu_index = TreeIndex(menu)
+        menu.add_child(li(id='new', class_='item'))
+        assert page_index.by_id('new') is menu_index.by_id('new') is not None
+        assert len(page_index.select('.item')) == len(menu_index.select('.item')) == 3
+
+        menu_index.close()
+        assert menu._index is page_index
+        menu.add_child(li(id='other'))
+        assert page_index.by_id('other') is not None
+        assert menu_index.by_id('other') is None
@@ -0,0 +1,111 @@
+import pytest
+
+pytest.importorskip('jinja2')
+
+from jinja2 import DictLoader, Environment  # noqa: E402
+
+from hyperpython import html, div, p  # noqa: E402
+from hyperpython.context import context_value  # noqa: E402
+from hyperpython import jinja2 as hp_jinja2  # noqa: E402
+from hyperpython.jinja2 import environment  # noqa: E402
+
+
+class Article:
+    def __init__(self, title):
+        self.title = title
+
+
+@html.register(Article, 'card')
+def article_card(article, **kwargs):
+    user = getattr(context_value('request'), 'user', 'anonymous')
+    return div(class_='card')[p(article.title), p(user)]
+
+
+@html.register(Article, 'request-arg')
+def article_request_arg(article, request=None, **kwargs):
+    return p(getattr(request, 'user', 'anonymous'))
+
+
+def env_templates():
+    return DictLoader({
+        'hyper.html': '{% hyper obj, role="card" %}',
+        'filter.html': '{{ obj|role("card") }}',
+        'many.html': '{% for x in objs %}{{ x|role("card") }}{% hyper x, role="card" %}{% endfor %}',
+        'request-arg.html': '{% hyper obj, role="request-arg" %}{{ obj|role("request-arg") }}',
+        'cached.html': '{% hypercache key, 60 %}<b>{{ counter() }}</b>{% endhypercache %}',
+        'cached-no-ttl.html': '{% hypercache key %}{{ counter() }}{% endhypercache %}',
+    })
+
+
+@pytest.fixture
+def env(tmp_path):
+    return environment(loader=env_templates(), cache_dir=str(tmp_path), autoescape=True)
+
+
+class Request:
+    user = 'john'
+
+
+class TestJinja2Extension:
+    def test_hyper_tag(self, env):
+        result = env.get_template('hyper.html').render(obj=Article('Title'))
+        assert result == '<div class="card"><p>Title</p><p>anonymous</p></div>'
+        assert result == env.get_template('filter.html').render(obj=Article('Title'))
+
+    def test_request_is_set_in_render_context(self, env):
+        for name in ['hyper.html', 'filter.html']:
+            result = env.get_template(name).render(obj=Article('T'), request=Request())
+            assert '<p>john</p>' in result
+        assert context_value('request') is None
+
+    def test_request_argument_is_not_passed_with_render_context(self, env):
+        template = env.get_template('request-arg.html')
+        assert template.render(obj=Article('T'), request=Request()) == '<p>anonymous</p>' * 2
+
+    def test_other_environments_pass_request_argument(self):
+        env = Environment(loader=env_templates(), extensions=hp_jinja2.extensions)
+        env.filters.update(hp_jinja2.filters)
+        template = env.get_template('request-arg.html')
+        assert template.render(obj=Article('T'), request=Request()) == '<p>john</p>' * 2
+        assert template.render(obj=Article('T')) == '<p>anonymous</p>' * 2
+
+    def test_render_context_is_set_once_per_template(self, env, monkeypatch):
+        calls = []
+        render_context = hp_jinja2.render_context
+        monkeypatch.setattr(hp_jinja2, 'render_context',
+                            lambda **kw: calls.append(kw) or render_context(**kw))
+        objs = [Article('a'), Article('b')]
+        result = env.get_template('many.html').render(objs=objs, request=Request())
+        assert result.count('<p>john</p>') == 4
+        assert len(calls) == 1
+
+    def test_generate_sets_render_context(self, env):
+        events = env.get_template('filter.html').generate({'obj': Article('T'), 'request': Request()})
+        assert '<p>john</p>' in ''.join(events)
+        assert context_value('request') is None
+
+    def test_hypercache(self, env):
+        calls = []
+        counter = lambda: calls.append(1) or len(calls)
+        template = env.get_template('cached.html')
+        assert template.render(key='a', counter=counter) == '<b>1</b>'
+        assert template.render(key='a', counter=counter) == '<b>1</b>'
+        assert template.render(key='b', counter=counter) == '<b>2</b>'
+        env.hyperpython_cache.clear()
+        assert template.render(key='a', counter=counter) == '<b>3</b>'
+
+    def test_hypercache_blocks_do_not_share_keys(self, env):
+        counter = iter(range(10)).__next__
+        assert env.get_template('cached.html').render(key='a', counter=counter) == '<b>0</b>'
+        assert env.get_template('cached-no-ttl.html').render(key='a', counter=counter) == '1'
+
+    def test_hypercache_in_templates_from_string(self, env):
+        first = env.from_string('{% hypercache 1 %}first{% endhypercache %}')
+        second = env.from_string('{% hypercache 1 %}second{% endhypercache %}')
+        assert first.render() == 'first'
+        assert second.render() == 'second'
+        assert env.from_string('{% hypercache 1 %}first{% endhypercache %}').render() == 'first'
+
+    def test_uses_bytecode_cache(self, env, tmp_path):
+        env.get_template('hyper.html')
+        assert list(tmp_path.iterdir())
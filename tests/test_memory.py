@@ -0,0 +1,61 @@
+import sys
+
+from hyperpython import div, p, Text, Block, Json, Component, sizeof
+from hyperpython.core import Blob
+from hyperpython.memory import trace_render
+
+
+class Card(Component):
+    def html(self):
+        return div(class_='card')['hello']
+
+
+class TestSizeof:
+    def test_text_size(self):
+        text = Text('hello world')
+        report = sizeof(text)
+        assert report.nodes == 1
+        assert report.total == report.strings == sys.getsizeof(text)
+        assert report.by_type == {'Text': sys.getsizeof(text)}
+
+    def test_breakdown_by_type(self):
+        tree = Block([div(class_='foo')['text', Blob('<b>raw</b>')], Json([1])])
+        report = sizeof(tree)
+        assert set(report.by_type) == {'Block', 'Element', 'Text', 'Blob', 'Json'}
+        assert report.total == sum(report.by_type.values())
+        assert report.attrs > 0
+        assert report.strings > 0
+
+    def test_shared_objects_are_counted_once(self):
+        child = p('some text ' * 10)
+        single = sizeof(div(child))
+        shared = sizeof(div([child, child, child]))
+        assert shared.nodes == single.nodes
+        assert shared.total - single.total < sys.getsizeof(child)
+
+    def test_bigger_trees_use_more_memory(self):
+        small = sizeof(div([p(str(i)) for i in range(10)]))
+        large = sizeof(div([p(str(i)) for i in range(100)]))
+        assert large.total > 5 * small.total
+
+    def test_component_tree_is_counted_only_when_rendered(self):
+        card = Card()
+        before = sizeof(card)
+        assert before.nodes == 1
+        card.render()
+        after = sizeof(card)
+        assert after.nodes == 3
+        assert after.total > before.total
+
+    def test_as_dict(self):
+        data = sizeof(div('foo')).as_dict()
+        assert set(data) == {'total', 'nodes', 'by_type', 'attrs', 'strings'}
+
+
+class TestTraceRender:
+    def test_trace_render(self):
+        tree = div([p(str(i)) for i in range(100)])
+        trace = trace_render(tree, limit=5)
+        assert trace.output == tree.render()
+        assert trace.peak >= sys.getsizeof(trace.output) // 2
+        assert len(trace.top) <= 5
@@ -0,0 +1,94 @@
+import pytest
+
+from hyperpython import div, p, b, ul, li, Text, Block, parse_html
+from hyperpython.core import Blob
+from hyperpython.parser import Parser, clear_cache
+from hyperpython.renderers import render_pretty
+from hyperpython.utils import sanitize
+
+
+class TestParser:
+    def test_parse_elements(self):
+        block = parse_html('<div class="a b" id="x"><p>Hello <b>world</b></p></div>')
+        assert isinstance(block, Block)
+        assert list(block) == [div(class_='a b', id='x')[p(['Hello ', b('world')])]]
+
+    def test_text_is_unescaped(self):
+        elem, = parse_html('<p>1 &lt; 2 &amp; 3 &#62; 2</p>')
+        assert elem.children == [Text('1 < 2 & 3 > 2')]
+        assert str(elem) == '<p>1 &lt; 2 &amp; 3 &gt; 2</p>'
+
+    def test_boolean_and_void_elements(self):
+        elem, text = parse_html('<input disabled value="x">tail')
+        assert elem.is_void
+        assert elem.attrs == {'disabled': True, 'value': 'x'}
+        assert text == 'tail'
+
+    def test_raw_content(self):
+        block = parse_html('<!DOCTYPE html><!-- note --><script>if (a < b) {}</script>')
+        doctype, comment, script = block
+        assert doctype == Blob('<!DOCTYPE html>')
+        assert comment == Blob('<!-- note -->')
+        assert script.children == [Blob('if (a < b) {}')]
+        assert str(script) == '<script>if (a < b) {}</script>'
+
+    def test_implicit_end_tags(self):
+        elem, = parse_html('<ul><li>foo<li>bar</ul>')
+        assert elem == ul([li('foo'), li('bar')])
+
+    def test_stray_end_tags_are_ignored(self):
+        assert list(parse_html('<div>foo</span></div>')) == [div('foo')]
+
+    @pytest.mark.parametrize('html', [
+        '<div class="foo"><p>Hello <b>world</b>!</p><a href="url?a=1&amp;b=2">x</a></div>',
+        '<ul><li>1</li><li>2</li></ul>text',
+    ])
+    def test_roundtrip(self, html):
+        assert str(parse_html(html)) == html
+
+
+class TestIncrementalParser:
+    def test_feed_chunks(self):
+        html = '<div class="foo"><p>Hello &amp; <b>world</b></p></div>'
+        parser = Parser()
+        for i in range(0, len(html), 3):
+            parser.feed(html[i:i + 3])
+        assert list(parser.close()) == list(parse_html(html, cache=False))
+
+    def test_merge_text_chunks(self):
+        parser = Parser()
+        parser.feed('<p>hello ')
+        parser.feed('world</p>')
+        elem, = parser.close()
+        assert elem.children == ['hello world']
+
+
+class TestParseCache:
+    def test_returns_independent_copies(self):
+        clear_cache()
+        first = parse_html('<div class="x"><p>foo</p></div>')
+        first[0].add_class('y')
+        first[0].children[0].add_child('bar')
+        second = parse_html('<div class="x"><p>foo</p></div>')
+        assert str(second) == '<div class="x"><p>foo</p></div>'
+
+    def test_cache_can_be_disabled(self):
+        assert str(parse_html('<p>x</p>', cache=False)) == '<p>x</p>'
+
+
+class TestIntegration:
+    def test_sanitized_content_becomes_walkable(self):
+        pytest.importorskip('bleach')
+        block = parse_html(sanitize('Hello <script>x</script><b>world</b> <i>!</i>'))
+        assert [e.tag for e in block.walk_tags()] == ['b', 'i']
+
+    def test_render_pretty_source(self):
+        assert render_pretty('<div><p>foo</p><ul><li>a<li>b</ul></div>') == (
+            '<div>\n'
+            '  <p>foo</p>\n'
+            '  <ul>\n'
+            '    <li>a</li>\n'
+            '    <li>b</li>\n'
+            '  </ul>\n'
+            '</div>\n'
+        )
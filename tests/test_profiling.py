@@ -0,0 +1,120 @@
+import json
+import threading
+
+from hyperpython import Component, div, p, render, fragment, profiling
+from hyperpython.profiling import Profiler, profile
+
+
+class Card(Component):
+    def html(self):
+        return div(class_='card')[p('hello'), p('world')]
+
+
+class TestProfiler:
+    def test_profiler_is_disabled_by_default(self):
+        assert profiling.active is None
+
+    def test_records_component_calls(self):
+        with profile() as profiler:
+            Card().render()
+            Card().render()
+
+        stats, = [x for x in profiler.stats() if x.kind == 'component']
+        assert stats.name == 'Card'
+        assert stats.calls == 2
+        assert stats.nodes == 2 * 5
+        assert stats.size == 2 * len(Card().render())
+        assert profiling.active is None
+
+    def test_records_html_dispatch(self):
+        with profile() as profiler:
+            render('hello')
+            render(42)
+
+        names = {row['name'] for row in profiler.table()}
+        assert names == {'str:None', 'int:None'}
+
+    def test_records_fragments(self):
+        @fragment.register('profiling.header')
+        def header():
+            return div('header')
+
+        with profile() as profiler:
+            fragment('profiling.header')
+
+        row, = profiler.table()
+        assert row['kind'] == 'fragment'
+        assert row['name'] == 'profiling.header'
+
+    def test_callback_receives_records(self):
+        records = []
+        with profile(records.append, measure_output=False):
+            Card().render()
+
+        record, = records
+        assert record.kind == 'component'
+        assert record.nodes is None
+        assert record.elapsed >= 0
+
+    def test_json_output(self):
+        with profile() as profiler:
+            render(p('foo'))
+        data = json.loads(profiler.json())
+        assert data[0]['calls'] == 1
+        assert set(data[0]) >= {'kind', 'name', 'total', 'mean', 'bytes'}
+
+    def test_nested_profilers_restore_previous(self):
+        outer = Profiler()
+        with outer:
+            with profile() as inner:
+                render('inner')
+            render('outer')
+        assert [x.name for x in inner.stats()] == ['str:None']
+        assert [x.name for x in outer.stats()] == ['str:None']
+        assert outer.stats()[0].calls == 1
+
+    def test_global_install(self):
+        profiler = Profiler()
+        profiler.install()
+        try:
+            render('foo')
+        finally:
+            profiler.uninstall()
+        assert profiling.active is None
+        assert profiler.stats()[0].calls == 1
+
+    def test_context_profiler_ignores_other_threads(self):
+        started = threading.Event()
+        stop = threading.Event()
+
+        def worker():
+            render('other thread')
+            started.set()
+            while not stop.is_set():
+                render(42)
+
+        with profile() as profiler:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            started.wait()
+            render('main thread')
+            stop.set()
+            thread.join()
+        assert [(x.name, x.calls) for x in profiler.stats()] == [('str:None', 1)]
+        assert profiling.active is None
+
+    def test_global_install_with_context_profiler(self):
+        installed = Profiler()
+        installed.install()
+        try:
+            with profile() as scoped:
+                render('scoped')
+            thread = threading.Thread(target=render, args=(42,))
+            with profile():
+                thread.start()
+                thread.join()
+        finally:
+            installed.uninstall()
+        assert [x.name for x in scoped.stats()] == ['str:None']
+        assert [x.name for x in installed.stats()] == ['int:None']
+        assert profiling.active is None
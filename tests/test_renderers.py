@@ -0,0 +1,120 @@
+import io
+
+import pytest
+
+from hyperpython import div, p, pre, br, input_, a, Text, Block, Component
+from hyperpython import HTML5, head, body, title, link
+from hyperpython.core import Blob, Json
+from hyperpython.renderers import render_minified, render_bytes, dump_bytes, iter_render
+
+
+class Card(Component):
+    def html(self):
+        return div(class_='card')[br, 'text']
+
+
+class TestMinify:
+    def test_void_elements_have_no_end_tags(self):
+        assert div([br, 'foo']).render(minify=True) == '<div><br>foo</div>'
+
+    def test_boolean_and_empty_attributes(self):
+        elem = input_(type='checkbox', checked=True, disabled=False, value='')
+        assert elem.render(minify=True) == '<input type=checkbox checked value>'
+
+    def test_quotes_attribute_values_only_when_necessary(self):
+        elem = a('link', href='/foo?a=1&b=2', title='some title', class_='a b')
+        assert elem.render(minify=True) == (
+            '<a href="/foo?a=1&amp;b=2" title="some title" class="a b">link</a>'
+        )
+        assert a(href='/foo/bar', id='x').render(minify=True) == \
+            '<a href=/foo/bar id=x></a>'
+        assert a(title='"').render(minify=True) == '<a title=&quot;></a>'
+
+    def test_collapse_whitespace(self):
+        elem = div(['foo  \n  bar ', pre('  keep\n  this '), Blob('<b>  raw</b>')])
+        assert elem.render(minify=True, collapse_whitespace=True) == (
+            '<div>foo bar <pre>  keep\n  this </pre><b>  raw</b></div>'
+        )
+        assert elem.render(minify=True) == elem.render()
+
+    def test_text_and_blocks(self):
+        assert Text('a  <  b').render(minify=True, collapse_whitespace=True) \
+            == 'a &lt; b'
+        block = Block([p('foo'), br])
+        assert block.render(minify=True) == '<p>foo</p><br>'
+
+    def test_components(self):
+        assert Card().render(minify=True) == '<div class=card><br>text</div>'
+        assert render_minified(Block([Card()])) == Card().render(minify=True)
+
+    def test_class_mapping(self):
+        elem = div()
+        elem.attrs['class'] = {'a': True, 'b': False, 'c': 1}
+        assert elem.render(minify=True) == '<div class="a c"></div>'
+
+    def test_default_render_is_unchanged(self):
+        assert div([br]).render() == '<div><br></br></div>'
+
+
+class TestBytesRenderer:
+    tree = div(class_='foo')[p('olá & <tchau>'), br, Blob('<b>raw</b>'), Card()]
+
+    def test_render_bytes(self):
+        assert render_bytes(self.tree) == self.tree.render().encode('utf8')
+        assert render_bytes(self.tree, 'latin1') == \
+            self.tree.render().encode('latin1')
+
+    def test_characters_outside_encoding(self):
+        assert render_bytes(p('€ ã'), 'latin1') == '<p>&#8364; ã</p>'.encode('latin1')
+        assert render_bytes(p(title='€'), 'ascii') == b'<p title="&#8364;"></p>'
+
+    def test_dump_into_bytearray(self):
+        buf = bytearray(b'prefix:')
+        size = dump_bytes(self.tree, buf)
+        assert buf == b'prefix:' + render_bytes(self.tree)
+        assert size == len(buf) - len(b'prefix:')
+
+    def test_dump_into_binary_file(self):
+        file = io.BytesIO()
+        size = dump_bytes(self.tree, file)
+        assert file.getvalue() == render_bytes(self.tree)
+        assert size == len(file.getvalue())
+
+    def test_dump_into_memoryview(self):
+        data = render_bytes(self.tree)
+        buf = bytearray(len(data) + 10)
+        size = dump_bytes(self.tree, memoryview(buf))
+        assert size == len(data)
+        assert buf[:size] == data
+
+        with pytest.raises(ValueError):
+            dump_bytes(self.tree, memoryview(bytearray(10)))
+
+
+class TestIterRender:
+    @pytest.mark.parametrize('tree', [
+        div(class_='card', id='x')[p('foo & bar'), br, Blob('<b>raw</b>'), 'text'],
+        Block([Card(), Json({'a': 1}), Text('<escaped>')]),
+        HTML5([head([title('Title'), link(rel='stylesheet', href='a.css')]), body(Card())]),
+    ])
+    def test_same_output_as_render(self, tree):
+        assert ''.join(iter_render(tree)) == tree.render()
+        assert ''.join(iter_render(tree, chunk_size=1)) == tree.render()
+
+    def test_chunk_size(self):
+        tree = div([p(str(i)) for i in range(100)])
+        chunks = list(iter_render(tree, chunk_size=100))
+        assert len(chunks) > 1
+        assert all(len(chunk) < 120 for chunk in chunks)
+
+    def test_flush_head_early(self):
+        tree = HTML5([head(title('Title')), body(Card())])
+        first, *rest = iter_render(tree)
+        assert first.endswith('</head>')
+        assert ''.join(rest) == '<body><div class="card"><br></br>text</div></body></html>'
+
+    def test_components_are_rendered_lazily(self):
+        tree = Block([p('first'), Card()])
+        chunks = iter_render(tree, chunk_size=1)
+        next(chunks)
+        assert '_tree' not in vars(tree[1])
@@ -0,0 +1,43 @@
+from hyperpython import div
+from hyperpython.contrib.semantic import button
+from hyperpython.contrib.semantic.base import component, extract_classes
+
+
+class TestComponent:
+    def test_extract_classes_returns_names_of_true_flags(self):
+        extractor = extract_classes(['a', 'b', 'c'])
+        kwargs = {'c': True, 'a': 1, 'b': None, 'id': 'x'}
+        assert extractor(kwargs) == ('a', 'c')
+        assert kwargs == {'id': 'x'}
+
+    def test_decorator_keeps_suffix_classes(self):
+        @component(flags=['big'], prefix_classes='ui', suffix_classes='box')
+        def box(*args, **kwargs):
+            return div(*args, **kwargs)
+
+        assert str(box('x', big=True)) == '<div class="ui big box">x</div>'
+
+    def test_compiled_and_regular_factories_are_equivalent(self):
+        args = (div, ['big', 'red'], ['ui'], ['box'])
+        regular = component(*args)
+        compiled = component(*args, compiled=True)
+        for kwargs in [{}, {'big': True}, {'red': True, 'big': True, 'id': 'x'},
+                       {'class_': 'foo ui', 'big': True}]:
+            assert compiled('x', **kwargs) == regular('x', **kwargs)
+
+    def test_compiled_factory_caches_flag_combinations(self):
+        btn = component(div, ['big'], compiled=True)
+        btn(big=True)
+        btn(big=True)
+        info = btn.class_table.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestButton:
+    def test_button_flags(self):
+        assert str(button('Ok', primary=True, big=True)) == \
+            '<button class="ui primary big button">Ok</button>'
+
+    def test_button_with_href(self):
+        assert str(button('Ok', href='/ok', basic=True, class_='extra')) == \
+            '<a href="/ok" class="ui extra basic button">Ok</a>'
@@ -1,6 +1,6 @@
 import pytest
 
-from hyperpython import a, div, p, title, head, Text, Json, h1, Block, h
+from hyperpython import a, div, p, title, head, Text, Json, h1, Block, h, pre, br
 
 
 # noinspection PyShadowingNames
@@ -57,6 +57,33 @@ class TestSimpleTagAttrsOperations:
         )
         assert str(title('title').pretty()) == '<title>title</title>'
 
+    def test_pretty_mixed_content(self):
+        tag = div([h1('title'), 'some ', Text('<text>'), a('link', href='#'), br])
+        assert tag.pretty(raw=True) == (
+            '<div>\n'
+            '  <h1>title</h1>\n'
+            '  some &lt;text&gt;<a href="#">link</a><br>\n'
+            '</div>\n'
+        )
+
+    def test_pretty_preserves_whitespace(self):
+        tag = div([pre('  foo\n    bar'), p('baz')])
+        assert tag.pretty(raw=True) == (
+            '<div>\n'
+            '  <pre>  foo\n    bar</pre>\n'
+            '  <p>baz</p>\n'
+            '</div>\n'
+        )
+
+    def test_pretty_block_and_indent(self):
+        block = Block([div(p('foo')), 'bar'])
+        assert block.pretty(raw=True, indent=4) == (
+            '<div>\n'
+            '    <p>foo</p>\n'
+            '</div>\n'
+            'bar\n'
+        )
+
 
 # noinspection PyShadowingNames
 class TestCoreTagFunctionality: